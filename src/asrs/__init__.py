@@ -1,19 +1,60 @@
 from .item import Item
 from .position import Position
-from .cell import Cell
+from .cell import Cell, CellItemsView, CellObserver
+from .cell_store import CellStore
+from .item_index import ItemIndex
+from .occupancy_index import OccupancyIndex
+from .inventory_totals import InventoryTotals
 from .output_policy import OutputPolicy, OutputStrategy, FIFOStrategy, LIFOStrategy, PriorityStrategy
+from .free_slot_index import FreeSlotIndex
+from .slotting_policy import SlottingPolicy, SlottingStrategy, ClosestOpenStrategy, RandomStrategy, \
+    ClassBasedStrategy, PriorityZonedStrategy
+from .operation_journal import JournalEntry, OperationJournal
+from .operation_record import OperationRecord, OperationType
+from .travel_time_model import AxisKinematics, TravelTimeModel
+from .crane_request import BatchingPolicy, CraneRequest, DualCommandReport
 from .stacker_crane import StackerCrane
+from .crane_fleet import CraneFleet, CranePartition, CraneStatistics
 from .asrs import ASRS
+from .columnar_asrs import ColumnarASRS
+from .async_asrs import AsyncASRS
 
 __all__ = [
     'Item', 
     'Position', 
     'Cell', 
+    'CellItemsView',
+    'CellObserver',
+    'CellStore',
+    'ItemIndex',
+    'OccupancyIndex',
+    'InventoryTotals',
     'OutputPolicy', 
     'OutputStrategy',
     'FIFOStrategy',
     'LIFOStrategy', 
     'PriorityStrategy',
+    'FreeSlotIndex',
+    'SlottingPolicy',
+    'SlottingStrategy',
+    'ClosestOpenStrategy',
+    'RandomStrategy',
+    'ClassBasedStrategy',
+    'PriorityZonedStrategy',
+    'JournalEntry',
+    'OperationJournal',
+    'OperationRecord',
+    'OperationType',
+    'AxisKinematics',
+    'TravelTimeModel',
+    'BatchingPolicy',
+    'CraneRequest',
+    'DualCommandReport',
     'StackerCrane', 
-    'ASRS'
+    'CraneFleet',
+    'CranePartition',
+    'CraneStatistics',
+    'ASRS',
+    'ColumnarASRS',
+    'AsyncASRS'
 ]
@@ -1,13 +1,32 @@
-from typing import List, Optional, Dict
+from typing import Iterable, List, Optional, Dict, Sequence, Tuple
 
-from .cell import Cell
-from .config.storage_cost_policy import StorageCostPolicy, PerTimeUnitStrategy
+import numpy as np
+
+from ..entity.Entity import Entity
+from .batch import accept_within_capacity, flat_cell_indices, rank_within_groups
+from .cell_store import CellStore
+from .config.storage_cost_policy import StorageCostPolicy, StorageCostStrategy, PerTimeUnitStrategy, \
+    PerItemStrategy, VolumeStrategy, WeightStrategy, TieredOccupancyStrategy, PerZoneStrategy
+from .config.simulation_clock import SimulationClock
 from .config.work_time_config import WorkTimeConfig
+from .cost_accrual import StorageCostAccrual
 from .item import Item
+from .inventory_totals import InventoryTotals
+from .item_index import ItemIndex
+from .occupancy_index import OccupancyIndex
+from .operation_journal import OperationJournal
+from .operation_record import OperationRecord, OperationType
 from .output_policy import OutputPolicy, FIFOStrategy, LIFOStrategy, \
     PriorityStrategy
 from .position import Position
-from .stacker_crane import StackerCrane
+from .snapshot import SnapshotInventory, inventory_arrays, read_snapshot, write_snapshot
+from .storage_aggregates import StorageAggregates
+from .crane_fleet import CraneFleet, CranePartition, CraneStatistics
+from .crane_request import BatchingPolicy
+from .free_slot_index import FreeSlotIndex
+from .slotting_policy import SlottingPolicy, ClosestOpenStrategy, RandomStrategy, \
+    ClassBasedStrategy, PriorityZonedStrategy
+from .travel_time_model import AxisKinematics, TravelTimeModel
 
 
 class ASRS:
@@ -23,40 +42,137 @@ class ASRS:
         storage_cost_policy: StorageCostPolicy = StorageCostPolicy.PER_TIME_UNIT,
         cost: float = 0.01,
         cost_time: float = 0.1,
-        max_items_per_cell: int = 100
+        max_items_per_cell: int = 100,
+        realtime: bool = False,
+        travel_model: Optional[TravelTimeModel] = None,
+        debug_aggregates: bool = False,
+        crane_count: int = 1,
+        cranes_per_aisle: int = 1,
+        slotting_policy: SlottingPolicy = SlottingPolicy.CLOSEST_OPEN,
+        journal: Optional[OperationJournal] = None
     ):
         self.max_x = max_x
         self.max_y = max_y
         self.max_z = max_z
         self.inbound_time = inbound_time
         self.outbound_time = outbound_time
-        self.work_config = WorkTimeConfig()
+        self.work_config = WorkTimeConfig(realtime=realtime)
+        self.travel_model = travel_model
+        self.operation_log: List[OperationRecord] = []
+        self.journal = journal  # 입고/출고 작업을 기록하는 선행 기록(write-ahead) 저널
         self.storage_cost_policy = storage_cost_policy
         self.storage_cost_strategies = {
             StorageCostPolicy.PER_TIME_UNIT: PerTimeUnitStrategy(),
+            StorageCostPolicy.PER_ITEM: PerItemStrategy(),
+            StorageCostPolicy.VOLUME: VolumeStrategy(),
+            StorageCostPolicy.WEIGHT: WeightStrategy(),
+            StorageCostPolicy.TIERED_OCCUPANCY: TieredOccupancyStrategy(),
+            StorageCostPolicy.PER_ZONE: PerZoneStrategy(),
         }
-        self.cost = cost # 비용
+        self._cost = cost # 비용
         self.cost_time = cost_time # 보관 유지 비용 정책(초)
         self.max_items_per_cell = max_items_per_cell
-        self.cells: Dict[Position, Cell] = {}
+        self.cells: CellStore
+        self.item_index = ItemIndex()
+        self.aggregates = StorageAggregates(self)
+        self.cost_accrual = StorageCostAccrual(self)
+        self.occupancy = OccupancyIndex(max_x, max_y, max_z)
+        self._inventory_totals = InventoryTotals(max_x, max_y, max_z)
+        # I/O 지점에서의 이동 비용 순으로 정렬된 가용 셀 색인 (put_item_auto에서 처음 조회할 때 생성)
+        slot_costs = (travel_model.io_table if travel_model is not None
+                      else lambda: FreeSlotIndex.chebyshev_costs(max_x, max_y, max_z))
+        self.free_slots = FreeSlotIndex(slot_costs, self.occupancy.counts, max_items_per_cell)
+        self.debug_aggregates = debug_aggregates  # True면 집계 조회 시 전체 스캔과 비교
         self.output_policy = OutputPolicy.FIFO
         self.strategies = {
             OutputPolicy.FIFO: FIFOStrategy(),
             OutputPolicy.LIFO: LIFOStrategy(),
             OutputPolicy.PRIORITY: PriorityStrategy()
         }
-        self.stacker_crane = StackerCrane(self)
+        self.slotting_policy = slotting_policy
+        self.slotting_strategies = {
+            SlottingPolicy.CLOSEST_OPEN: ClosestOpenStrategy(),
+            SlottingPolicy.RANDOM: RandomStrategy(),
+            SlottingPolicy.CLASS_BASED: ClassBasedStrategy(),
+            SlottingPolicy.PRIORITY_ZONED: PriorityZonedStrategy()
+        }
+        self.free_slots.set_zones(self.slotting_strategies[slotting_policy].zone_shares)
+        # 통로 단위로 구역을 나눠 맡는 크레인들 (각 크레인은 자기 시계 위에서 동시에 작업)
+        self.crane_fleet = CraneFleet.by_aisle(self, crane_count, cranes_per_aisle, travel_model)
+        self.stacker_crane = self.crane_fleet.cranes[0]
 
-        # 모든 셀 초기화
+        # 셀 저장소 초기화
         self._initialize_cells()
 
+    @property
+    def clock(self) -> SimulationClock:
+        """이 자동창고의 시뮬레이션 시계"""
+        return self.work_config.clock
+
+    @property
+    def inventory_totals(self) -> InventoryTotals:
+        """셀별 아이템 속성 합계 (속성 기반 보관유지비용 전략이 처음 사용할 때 현재 재고로 채워 할당)"""
+        totals = self._inventory_totals
+        if not totals.active:
+            totals.activate(self.cells.allocated_cells())
+        return totals
+
+    @property
+    def cost(self) -> float:
+        """보관유지 비용율"""
+        return self._cost
+
+    @cost.setter
+    def cost(self, value: float):
+        self._cost = value
+        self.aggregates.recalculate_costs(self.cells.allocated_cells())
+        self.cost_accrual.rebase(self._stored_items(), self._latest_time())
+
+    def set_storage_cost_policy(self, policy: StorageCostPolicy):
+        """보관유지비용 정책 설정 (누적 비용은 현재 시각부터 새 정책의 비용율로 쌓임)"""
+        self.storage_cost_policy = policy
+        self.cost_accrual.rebase(self._stored_items(), self._latest_time())
+
+    def set_storage_cost_strategy(self, policy: StorageCostPolicy, strategy: StorageCostStrategy):
+        """
+        보관유지비용 정책의 전략 교체 (구간/구역 비용율 등 설정 변경)
+
+        교체한 정책이 현재 정책이면 누적 비용은 현재 시각부터 새 전략의 비용율로 쌓입니다.
+        """
+        self.storage_cost_strategies[policy] = strategy
+        if strategy.incremental:
+            self.aggregates.cost_totals[policy] = 0.0
+        else:
+            self.aggregates.cost_totals.pop(policy, None)
+        self.aggregates.recalculate_costs(self.cells.allocated_cells())
+        if policy == self.storage_cost_policy:
+            self.cost_accrual.rebase(self._stored_items(), self._latest_time())
+
+    def _stored_items(self) -> Iterable[Tuple[Position, Item]]:
+        """보관 중인 모든 (위치, 아이템)"""
+        for position, cell in self.cells.allocated_items():
+            for item in cell.get_items():
+                yield position, item
+
+    def _latest_time(self) -> float:
+        """자동창고 시계와 모든 크레인 시계 중 가장 늦은 시각 (기록된 모든 입출고 이후)"""
+        return max(self.clock.now, self.crane_fleet.makespan)
+
+    def _check_aggregates(self):
+        if self.debug_aggregates:
+            self.aggregates.verify(self.cells.allocated_cells())
+
     def _initialize_cells(self):
-        """모든 셀을 초기화"""
-        for x in range(self.max_x):
-            for y in range(self.max_y):
-                for z in range(self.max_z):
-                    position = Position(x, y, z)
-                    self.cells[position] = Cell(position)
+        """셀 저장소 초기화 (셀은 처음 입고될 때 생성됨)"""
+        self.cells = CellStore(self.max_x, self.max_y, self.max_z,
+                               observers=[self.item_index, self.aggregates, self.cost_accrual, self.occupancy,
+                                          self.free_slots, self._inventory_totals])
+
+    def _log_operation(self, operation: OperationType, item: Item, position: Position, start_time: float,
+                       finish_time: float):
+        self.operation_log.append(OperationRecord(operation, item.id, position, start_time, finish_time))
+        if self.journal is not None:
+            self.journal.record(operation, item, position, start_time, finish_time)
 
     def _is_valid_position(self, position: Position) -> bool:
         """위치가 유효한지 확인"""
@@ -93,8 +209,18 @@ class ASRS:
         return max(0, self.max_items_per_cell - current_items_count)
 
     def set_output_policy(self, policy: OutputPolicy):
-        """출고 정책 설정"""
+        """출고 정책 설정 (셀 컨테이너도 정책에 맞게 재구성)"""
         self.output_policy = policy
+        self.cells.set_policy(policy)
+
+    def set_slotting_policy(self, policy: SlottingPolicy):
+        """입고 위치 지정 정책 설정 (가용 셀 색인의 구역도 정책에 맞게 재구성)"""
+        self.slotting_policy = policy
+        self.free_slots.set_zones(self.slotting_strategies[policy].zone_shares)
+
+    def create_item(self, id: str, name: str, priority: int = 0, storage_cost: float = 0.01) -> Item:
+        """시뮬레이션 시계의 현재 시각을 생성 시각으로 갖는 아이템 생성"""
+        return Item(id, name, priority, storage_cost, created_time=self.clock.now)
 
     def put_item(self, item: Item, position: Position) -> bool:
         """아이템을 특정 위치에 입고"""
@@ -102,99 +228,411 @@ class ASRS:
             return False
 
         cell = self.cells[position]
-        current_items_count = len(cell.get_items())
+        current_items_count = cell.item_count()
 
         # 셀 용량 확인
         if self.is_cell_full(current_items_count):
             return False
 
         # 입고 시간 딜레이 적용
-        self.work_config.delay_time(self.inbound_time)
+        start_time, finish_time = self.work_config.delay_time(self.inbound_time)
 
         cell.add_item(item)
+        self._log_operation(OperationType.PUT, item, position, start_time, finish_time)
         return True
 
+    def put_item_auto(self, item: Item) -> Optional[Position]:
+        """
+        입고 위치 지정 정책이 고른 위치에 아이템 입고
+
+        Returns:
+            입고한 위치 (가용 셀이 없으면 None)
+        """
+        position = self.slotting_strategies[self.slotting_policy].select_position(self, item)
+        if position is None or not self.put_item(item, position):
+            return None
+        return position
+
     def get_item(self, position: Position) -> Optional[Item]:
         """특정 위치에서 출고 정책에 따라 아이템 출고"""
         if not self._is_valid_position(position):
             return None
 
-        cell = self.cells[position]
+        cell = self.cells.get(position)
+        if cell is None:
+            return None
         strategy = self.strategies[self.output_policy]
 
         # 출고할 아이템이 있는지 먼저 확인
         item = strategy.get_item(cell)
         if item is not None:
             # 출고 시간 딜레이 적용
-            self.work_config.delay_time(self.outbound_time)
+            start_time, finish_time = self.work_config.delay_time(self.outbound_time)
+            self._log_operation(OperationType.GET, item, position, start_time, finish_time)
 
         return item
 
+    def put_items(self, pairs: Iterable[Tuple[Item, Position]]) -> List[bool]:
+        """
+        여러 아이템을 한 번에 입고
+
+        배치 전체의 위치 검증과 용량 확인을 한 번에 수행하며, 결과는
+        put_item을 순서대로 호출한 것과 같습니다.
+
+        Args:
+            pairs: (아이템, 위치) 목록
+
+        Returns:
+            요청별 입고 성공 여부
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return []
+
+        accepted = self._accept_puts(pairs)
+        accepted_index = np.flatnonzero(accepted).tolist()
+
+        # 입고 시간 딜레이 적용 (아이템은 put_item과 같이 각자의 작업 종료 시각에 셀에 들어감)
+        def place(step: int):
+            item, position = pairs[accepted_index[step]]
+            self.cells[position].add_item(item)
+
+        intervals = self.work_config.delay_times(self.inbound_time, len(accepted_index), on_finish=place)
+        for index, (start_time, finish_time) in zip(accepted_index, intervals):
+            item, position = pairs[index]
+            self._log_operation(OperationType.PUT, item, position, start_time, finish_time)
+        return accepted.tolist()
+
+    def _accept_puts(self, pairs: List[Tuple[Item, Position]]) -> np.ndarray:
+        """요청들을 순서대로 입고했을 때 성공하는 요청 마스크"""
+        flat, valid = flat_cell_indices([position for _, position in pairs], self.max_x, self.max_y, self.max_z)
+        current_counts = self.occupancy.counts.reshape(-1)[flat]
+        return accept_within_capacity(flat, valid, current_counts, self.max_items_per_cell)
+
+    def insert_items(self, pairs: List[Tuple[Item, Position]],
+                     finish_times: Optional[Sequence[float]] = None) -> np.ndarray:
+        """
+        작업 시간과 운영 기록 없이 아이템을 한 번에 셀에 넣음 (저널 재적용/초기 재고 적재 경로)
+
+        Args:
+            pairs: (아이템, 위치) 목록
+            finish_times: 요청별 입고 시각. 주어지면 아이템마다 시계를 그 시각으로 진행한 뒤
+                넣으므로 보관 시간 누적 비용이 원래 작업 시각부터 쌓입니다 (생략하면 현재 시각).
+
+        Returns:
+            요청별 입고 여부 (bool 배열)
+        """
+        if not pairs:
+            return np.zeros(0, dtype=bool)
+        accepted = self._accept_puts(pairs)
+        cells = self.cells
+        for index in np.flatnonzero(accepted).tolist():
+            item, position = pairs[index]
+            if finish_times is not None:
+                self.clock.advance_to(finish_times[index])
+            cells[position].add_item(item)
+        return accepted
+
+    def get_items(self, positions: Iterable[Position]) -> List[Optional[Item]]:
+        """
+        여러 위치에서 출고 정책에 따라 한 번에 출고
+
+        Args:
+            positions: 출고할 위치 목록 (같은 위치가 여러 번 나올 수 있음)
+
+        Returns:
+            요청별 출고된 아이템 (출고할 아이템이 없으면 None)
+        """
+        positions = list(positions)
+        if not positions:
+            return []
+
+        # 출고 가능한 요청을 먼저 구하고, get_item과 같이 각 작업의 시작 시각에 꺼냄
+        flat, valid = flat_cell_indices(positions, self.max_x, self.max_y, self.max_z)
+        retrievable = np.zeros(len(positions), dtype=bool)
+        valid_index = np.flatnonzero(valid)
+        current_counts = self.occupancy.counts.reshape(-1)[flat[valid_index]]
+        retrievable[valid_index] = rank_within_groups(flat[valid_index]) < current_counts
+        retrieved_index = np.flatnonzero(retrievable).tolist()
+        results: List[Optional[Item]] = [None] * len(positions)
+        strategy = self.strategies[self.output_policy]
+
+        def take(step: int):
+            index = retrieved_index[step]
+            results[index] = strategy.get_item(self.cells[positions[index]])
+
+        # 출고 시간 딜레이 적용
+        intervals = self.work_config.delay_times(self.outbound_time, len(retrieved_index), on_start=take)
+        for index, (start_time, finish_time) in zip(retrieved_index, intervals):
+            self._log_operation(OperationType.GET, results[index], positions[index], start_time, finish_time)
+        return results
+
+    def remove_items(self, positions: List[Position]) -> List[Optional[Item]]:
+        """작업 시간과 운영 기록 없이 출고 정책에 따라 한 번에 꺼냄"""
+        results: List[Optional[Item]] = [None] * len(positions)
+        if not positions:
+            return results
+        _, valid = flat_cell_indices(positions, self.max_x, self.max_y, self.max_z)
+        strategy = self.strategies[self.output_policy]
+        for index in np.flatnonzero(valid).tolist():
+            cell = self.cells.get(positions[index])
+            if cell is not None:
+                results[index] = strategy.get_item(cell)
+        return results
+
+    def remove_items_by_id(self, requests: List[Tuple[Position, Item]]) -> List[Optional[Item]]:
+        """
+        작업 시간과 운영 기록 없이 위치별로 지정한 아이템을 꺼냄 (저널 재적용 경로)
+
+        출고 정책 대신 요청 아이템의 ID(같은 ID가 여럿이면 생성 시각)로 꺼낼 아이템을 고릅니다.
+
+        Args:
+            requests: (위치, 꺼낼 아이템과 ID/생성 시각이 같은 아이템) 목록
+        """
+        results: List[Optional[Item]] = [None] * len(requests)
+        if not requests:
+            return results
+        _, valid = flat_cell_indices([position for position, _ in requests], self.max_x, self.max_y, self.max_z)
+        for index in np.flatnonzero(valid).tolist():
+            position, item = requests[index]
+            cell = self.cells.get(position)
+            if cell is not None:
+                results[index] = cell.remove_item_by_id(item.id, item.created_time)
+        return results
+
     def get_items_at_position(self, position: Position) -> List[Item]:
         """특정 위치의 모든 아이템 조회"""
         if not self._is_valid_position(position):
             return []
 
-        cell = self.cells[position]
+        cell = self.cells.get(position)
+        if cell is None:
+            return []
         return cell.get_items()
 
+    def iter_items_at_position(self, position: Position) -> Iterable[Item]:
+        """특정 위치의 아이템을 복사 없이 조회하는 읽기 전용 뷰 반환"""
+        cell = self.cells.get(position) if self._is_valid_position(position) else None
+        if cell is None:
+            return ()
+        return cell.items_view()
+
     def find_item_positions(self, item_id: str) -> List[Position]:
         """특정 아이템 ID의 모든 위치 찾기"""
-        positions = []
-        for position, cell in self.cells.items():
-            for item in cell.get_items():
-                if item.id == item_id:
-                    positions.append(position)
-                    break  # 같은 셀에서 중복 위치 방지
-        return positions
+        return self.item_index.positions(item_id)
 
     def stacker_crane_put(self, item: Item, position: Position) -> bool:
-        """스태커크레인을 통한 입고"""
-        return self.stacker_crane.put_item(item, position)
+        """위치를 담당하는 스태커크레인을 통한 입고"""
+        return self.crane_fleet.put_item(item, position)
 
     def stacker_crane_get(self, position: Position) -> Optional[Item]:
-        """스태커크레인을 통한 출고"""
-        return self.stacker_crane.get_item(position)
+        """위치를 담당하는 스태커크레인을 통한 출고"""
+        return self.crane_fleet.get_item(position)
+
+    def stacker_crane_put_items(self, pairs: Iterable[Tuple[Item, Position]]) -> List[bool]:
+        """스태커크레인들을 통한 일괄 입고"""
+        return self.crane_fleet.put_items(pairs)
+
+    def stacker_crane_get_items(self, positions: Iterable[Position]) -> List[Optional[Item]]:
+        """스태커크레인들을 통한 일괄 출고"""
+        return self.crane_fleet.get_items(positions)
+
+    def set_crane_batching(self, batching: Optional[BatchingPolicy]):
+        """스태커크레인 대기열의 일괄 처리 조건 설정 (None이면 해제)"""
+        self.crane_fleet.set_batching(batching)
+
+    def get_crane_statistics(self, horizon: Optional[float] = None) -> List[CraneStatistics]:
+        """크레인별 가동률과 대기열 통계 반환"""
+        return self.crane_fleet.statistics(horizon)
 
     def get_total_item_count(self) -> int:
         """전체 아이템 수 반환"""
-        total = 0
-        for cell in self.cells.values():
-            total += len(cell.get_items())
-        return total
+        self._check_aggregates()
+        return self.aggregates.total_items
+
+    def get_occupied_cell_count(self) -> int:
+        """아이템이 하나 이상 있는 셀 수 반환"""
+        self._check_aggregates()
+        return self.aggregates.occupied_cells
 
     def get_total_items(self) -> List[Item]:
+        self._check_aggregates()
         all_items = []
-        for cell in self.cells.values():
-            all_items.extend(cell.get_items())
+        if self.aggregates.total_items == 0:
+            return all_items
+        for cell in self.cells.allocated_cells():
+            all_items.extend(cell.items_view())
         return all_items
 
     def get_empty_cells(self) -> List[Position]:
         """빈 셀들의 위치 반환"""
-        empty_positions = []
-        for position, cell in self.cells.items():
-            if cell.is_empty():
-                empty_positions.append(position)
-        return empty_positions
+        return self.occupancy.empty_positions()
 
     def get_available_cells(self) -> List[Position]:
         """아직 용량이 남은 셀들의 위치 반환"""
-        available_positions = []
-        for position, cell in self.cells.items():
-            current_items_count = len(cell.get_items())
-            if not self.is_cell_full(current_items_count):
-                available_positions.append(position)
-        return available_positions
+        return self.occupancy.available_positions(self.max_items_per_cell)
+
+    def get_first_free_cells(self, n: int) -> List[Position]:
+        """(x, y, z) 순서로 용량이 남은 셀을 앞에서부터 n개 반환"""
+        return self.occupancy.first_free_slots(n, self.max_items_per_cell)
+
+    def get_free_cells_in_layer(self, z: int) -> List[Position]:
+        """z 층에서 용량이 남은 셀들의 위치 반환"""
+        if not 0 <= z < self.max_z:
+            return []
+        return self.occupancy.free_slots_in_layer(z, self.max_items_per_cell)
+
+    def get_free_count_per_aisle(self) -> np.ndarray:
+        """통로(x 좌표)별 용량이 남은 셀 개수 반환"""
+        return self.occupancy.free_count_per_aisle(self.max_items_per_cell)
 
     def calculate_total_storage_cost(self, cost: float) -> float:
         """전체 보관유지비용 계산"""
-        total_cost = 0.0
-        # 설정된 x초 마다 설정값
-        for cell in self.cells.values():
-            items_count = len(cell.get_items())
-            if items_count > 0:
-                total_cost += self.calculate_storage_cost(items_count)
-        return total_cost
+        self._check_aggregates()
+        # 아이템 수 기반 정책은 입고/출고 시점에 증분 갱신된 합계, 그 외에는 셀별 배열 연산
+        total = self.aggregates.cost_totals.get(self.storage_cost_policy)
+        if total is not None:
+            return total
+        return self.storage_cost_strategies[self.storage_cost_policy].calculate_total(self)
+
+    def snapshot(self, path: str):
+        """
+        셀, 아이템, 출고/입고 위치 지정 정책, 보관유지비용 전략 설정, 크레인 상태, 시계를 스냅샷 파일로 저장
+
+        운영 기록(operation_log)은 저장하지 않습니다. 복원한 자동창고라면 먼저 남은
+        복원 재고를 셀과 아이템 색인으로 모두 읽어 들이고 연결을 끊으므로, 복원한
+        파일에 다시 저장해도 됩니다.
+
+        Args:
+            path: 파일 경로
+        """
+        self.cells.detach_snapshot()
+        self.item_index.detach_snapshot()
+        cells = sorted(
+            ((position.x * self.max_y + position.y) * self.max_z + position.z, cell.get_items())
+            for position, cell in self.cells.allocated_items() if not cell.is_empty())
+        model = self.travel_model
+        header = {
+            "dimensions": [self.max_x, self.max_y, self.max_z],
+            "inbound_time": self.inbound_time,
+            "outbound_time": self.outbound_time,
+            "storage_cost_policy": self.storage_cost_policy.value,
+            "cost": self.cost,
+            "cost_time": self.cost_time,
+            "max_items_per_cell": self.max_items_per_cell,
+            "realtime": self.work_config.realtime,
+            "debug_aggregates": self.debug_aggregates,
+            "output_policy": self.output_policy.value,
+            "slotting_policy": self.slotting_policy.value,
+            "clock": self.clock.now,
+            "storage_cost_strategies": {policy.value: strategy.config()
+                                        for policy, strategy in self.storage_cost_strategies.items()},
+            "cost_accrual": [self.cost_accrual.closed, self.cost_accrual.open_rate,
+                             self.cost_accrual.open_rate_time, self.cost_accrual.rebase_time],
+            "travel_model": None if model is None else {
+                "axes": [[axis.max_speed, axis.acceleration, axis.pitch] for axis in model.axes],
+                "io_point": [model.io_point.x, model.io_point.y, model.io_point.z],
+            },
+            "cranes": [
+                {
+                    "partition": [list(partition.x_range), list(partition.y_range), list(partition.z_range)],
+                    "position": [crane.current_position.x, crane.current_position.y, crane.current_position.z],
+                    "timeline": crane.timeline.now,
+                    "operation_count": crane.operation_count,
+                    "busy_time": crane.busy_time,
+                    "total_travel_time": crane.total_travel_time,
+                    "move_count": crane.move_count,
+                }
+                for partition, crane in zip(self.crane_fleet.partitions, self.crane_fleet.cranes)
+            ],
+        }
+        arrays, header["entities"] = inventory_arrays(cells)
+        write_snapshot(path, header, arrays)
+
+    @classmethod
+    def restore(cls, path: str, mmap: bool = True) -> "ASRS":
+        """
+        스냅샷 파일에서 자동창고 복원
+
+        재고 배열은 그대로 사용하고 셀과 아이템은 처음 접근할 때 만들어지므로,
+        복원 시간은 아이템 수가 아니라 랙 크기에 비례합니다.
+
+        Args:
+            path: snapshot으로 저장한 파일 경로
+            mmap: True면 재고 배열을 메모리 맵으로 읽음
+
+        Raises:
+            ValueError: 스냅샷 파일이 아니거나 지원하지 않는 버전인 경우 발생합니다.
+        """
+        header, arrays = read_snapshot(path, mmap=mmap)
+        max_x, max_y, max_z = header["dimensions"]
+        travel_model = None
+        if header["travel_model"] is not None:
+            x_axis, y_axis, z_axis = (AxisKinematics(*axis) for axis in header["travel_model"]["axes"])
+            travel_model = TravelTimeModel(max_x, max_y, max_z, x_axis, y_axis, z_axis,
+                                           io_point=Position(*header["travel_model"]["io_point"]))
+        asrs = cls(
+            max_x, max_y, max_z,
+            inbound_time=header["inbound_time"],
+            outbound_time=header["outbound_time"],
+            storage_cost_policy=StorageCostPolicy(header["storage_cost_policy"]),
+            cost=header["cost"],
+            cost_time=header["cost_time"],
+            max_items_per_cell=header["max_items_per_cell"],
+            realtime=header["realtime"],
+            travel_model=travel_model,
+            debug_aggregates=header["debug_aggregates"],
+            slotting_policy=SlottingPolicy(header["slotting_policy"]),
+        )
+        asrs.clock.now = header["clock"]
+        asrs.set_output_policy(OutputPolicy(header["output_policy"]))
+        # 구역/구간 비용율 등 전략 설정을 재고보다 먼저 복원 (집계값과 누적 비용이 같은 비용율을 사용)
+        for policy_value, config in header.get("storage_cost_strategies", {}).items():
+            policy = StorageCostPolicy(policy_value)
+            asrs.set_storage_cost_strategy(policy, type(asrs.storage_cost_strategies[policy])(**config))
+
+        partitions = [CranePartition(*(tuple(axis_range) for axis_range in crane["partition"]))
+                      for crane in header["cranes"]]
+        asrs.crane_fleet = CraneFleet(asrs, partitions, travel_model)
+        asrs.stacker_crane = asrs.crane_fleet.cranes[0]
+        for crane, state in zip(asrs.crane_fleet.cranes, header["cranes"]):
+            crane.current_position = Position(*state["position"])
+            crane.timeline.now = state["timeline"]
+            crane.operation_count = state["operation_count"]
+            crane.busy_time = state["busy_time"]
+            crane.total_travel_time = state["total_travel_time"]
+            crane.move_count = state["move_count"]
+
+        entities = [Entity(**entity) for entity in header["entities"]]
+        asrs._load_inventory(SnapshotInventory(arrays, (max_x, max_y, max_z), entities))
+        accrual = asrs.cost_accrual
+        accrual.closed, accrual.open_rate, accrual.open_rate_time, accrual.rebase_time = header["cost_accrual"]
+        return asrs
+
+    def _load_inventory(self, inventory: SnapshotInventory):
+        """빈 자동창고에 스냅샷 재고를 연결하고 색인/집계값을 한꺼번에 맞춤"""
+        counts = inventory.cell_counts()
+        self.cells.attach_snapshot(inventory)
+        self.item_index.attach_snapshot(inventory)
+        self.occupancy.load_counts(inventory.cells, counts)
+        self.aggregates.load_counts(counts)
+        if self._inventory_totals.active:
+            volumes, weights, unsized = inventory.entity_columns()
+            self._inventory_totals.load_columns(inventory.item_cells, inventory.storage_costs, volumes, weights,
+                                                unsized)
+        self.free_slots.rebuild()
+
+    def accrued_storage_cost(self, at: Optional[float] = None) -> float:
+        """
+        입고부터 출고(보관 중이면 at)까지의 보관 시간에 따라 쌓인 보관유지비용
+
+        아이템 하나의 비용은 cost_time초마다 보관유지비용 전략의 item_rate만큼 쌓입니다.
+
+        Args:
+            at: 기준 시뮬레이션 시각 (생략하면 자동창고 시계와 모든 크레인 시계 중 가장 늦은
+                시각이므로, 크레인이 여럿이어도 모든 입출고를 포함합니다)
+        """
+        return self.cost_accrual.accrued(self._latest_time() if at is None else at)
 
     def get_cell_capacity_info(self, position: Position) -> Optional[
         Dict[str, int]]:
@@ -202,8 +640,8 @@ class ASRS:
         if not self._is_valid_position(position):
             return None
 
-        cell = self.cells[position]
-        current_items_count = len(cell.get_items())
+        cell = self.cells.get(position)
+        current_items_count = 0 if cell is None else cell.item_count()
 
         return {
             "current_items": current_items_count,
@@ -0,0 +1,96 @@
+import asyncio
+from contextlib import AsyncExitStack
+from typing import Callable, Iterable, List, Optional, Tuple, TypeVar
+
+from .asrs import ASRS
+from .item import Item
+from .position import Position
+
+T = TypeVar("T")
+
+
+class AsyncASRS:
+    """
+    ASRS의 asyncio 인터페이스
+
+    작업 자체(셀 갱신과 시뮬레이션 시계 진행)는 동기 ASRS에서 그대로 처리하고,
+    realtime 모드의 실제 대기만 asyncio.sleep으로 기다립니다. 직접 입출고는 자동창고
+    잠금으로, 크레인 작업은 크레인별 잠금으로 순서를 보장하므로 서로 다른 크레인의
+    작업은 실제 시간상으로도 동시에 진행됩니다. 잠금은 이벤트 루프 안에서 처음
+    사용할 때 만들어집니다.
+
+    조회 메서드(get_total_item_count 등)는 감싼 ASRS의 것을 그대로 사용합니다.
+    """
+
+    def __init__(self, asrs: ASRS):
+        self.asrs = asrs
+        self._lock: Optional[asyncio.Lock] = None
+        self._crane_locks: Optional[List[asyncio.Lock]] = None
+
+    def __getattr__(self, name: str):
+        return getattr(self.asrs, name)
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """직접 입출고 작업 잠금"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def crane_lock(self, crane_id: int) -> asyncio.Lock:
+        """크레인 작업 잠금"""
+        if self._crane_locks is None:
+            self._crane_locks = [asyncio.Lock() for _ in self.asrs.crane_fleet.cranes]
+        return self._crane_locks[crane_id]
+
+    async def _run(self, locks: List[asyncio.Lock], operation: Callable[..., T], *args) -> T:
+        async with AsyncExitStack() as stack:
+            for lock in locks:
+                await stack.enter_async_context(lock)
+            result, delay = self.asrs.work_config.run_deferred(operation, *args)
+            await self.asrs.work_config.sleep_async(delay)
+        return result
+
+    def _crane_locks_for(self, positions: Iterable[Position]) -> List[asyncio.Lock]:
+        # 여러 크레인의 잠금은 항상 크레인 번호 순서로 잡음 (교착 방지)
+        crane_ids = sorted({self.asrs.crane_fleet.crane_for(position).crane_id for position in positions})
+        return [self.crane_lock(crane_id) for crane_id in crane_ids]
+
+    async def put_item(self, item: Item, position: Position) -> bool:
+        """아이템을 특정 위치에 입고"""
+        return await self._run([self.lock], self.asrs.put_item, item, position)
+
+    async def get_item(self, position: Position) -> Optional[Item]:
+        """특정 위치에서 출고 정책에 따라 아이템 출고"""
+        return await self._run([self.lock], self.asrs.get_item, position)
+
+    async def put_item_auto(self, item: Item) -> Optional[Position]:
+        """입고 위치 지정 정책이 고른 위치에 아이템 입고"""
+        return await self._run([self.lock], self.asrs.put_item_auto, item)
+
+    async def put_items(self, pairs: Iterable[Tuple[Item, Position]]) -> List[bool]:
+        """여러 아이템을 한 번에 입고"""
+        return await self._run([self.lock], self.asrs.put_items, list(pairs))
+
+    async def get_items(self, positions: Iterable[Position]) -> List[Optional[Item]]:
+        """여러 위치에서 한 번에 출고"""
+        return await self._run([self.lock], self.asrs.get_items, list(positions))
+
+    async def stacker_crane_put(self, item: Item, position: Position) -> bool:
+        """위치를 담당하는 스태커크레인을 통한 입고"""
+        return await self._run(self._crane_locks_for([position]), self.asrs.stacker_crane_put, item, position)
+
+    async def stacker_crane_get(self, position: Position) -> Optional[Item]:
+        """위치를 담당하는 스태커크레인을 통한 출고"""
+        return await self._run(self._crane_locks_for([position]), self.asrs.stacker_crane_get, position)
+
+    async def stacker_crane_put_items(self, pairs: Iterable[Tuple[Item, Position]]) -> List[bool]:
+        """스태커크레인들을 통한 일괄 입고"""
+        pairs = list(pairs)
+        locks = self._crane_locks_for(position for _, position in pairs)
+        return await self._run(locks, self.asrs.stacker_crane_put_items, pairs)
+
+    async def stacker_crane_get_items(self, positions: Iterable[Position]) -> List[Optional[Item]]:
+        """스태커크레인들을 통한 일괄 출고"""
+        positions = list(positions)
+        return await self._run(self._crane_locks_for(positions), self.asrs.stacker_crane_get_items, positions)
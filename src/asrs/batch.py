@@ -0,0 +1,56 @@
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from .position import Position
+
+
+def flat_cell_indices(positions: Sequence[Position], max_x: int, max_y: int,
+                      max_z: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    위치 목록을 한 번에 검증하고 평탄화된 셀 번호로 변환
+
+    Returns:
+        (셀 번호 배열, 유효 여부 배열). 유효하지 않은 위치의 셀 번호는 0입니다.
+    """
+    coordinates = np.array([(position.x, position.y, position.z) for position in positions],
+                           dtype=np.int64).reshape(-1, 3)
+    upper = np.array([max_x, max_y, max_z], dtype=np.int64)
+    valid = np.all((coordinates >= 0) & (coordinates < upper), axis=1)
+    coordinates[~valid] = 0
+    flat = (coordinates[:, 0] * max_y + coordinates[:, 1]) * max_z + coordinates[:, 2]
+    return flat, valid
+
+
+def rank_within_groups(keys: np.ndarray) -> np.ndarray:
+    """각 원소가 같은 키를 가진 원소들 중 몇 번째로 등장했는지 (0부터) 반환"""
+    if keys.size == 0:
+        return np.empty(0, dtype=np.int64)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    index = np.arange(keys.size)
+    is_group_start = np.empty(keys.size, dtype=bool)
+    is_group_start[0] = True
+    is_group_start[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    group_start = np.maximum.accumulate(np.where(is_group_start, index, 0))
+    ranks = np.empty(keys.size, dtype=np.int64)
+    ranks[order] = index - group_start
+    return ranks
+
+
+def accept_within_capacity(flat: np.ndarray, valid: np.ndarray, current_counts: np.ndarray,
+                           capacity: int) -> np.ndarray:
+    """
+    입고 요청들을 순서대로 처리했을 때 용량 안에서 성공하는 요청 마스크 계산
+
+    Args:
+        flat: 요청별 셀 번호
+        valid: 요청별 위치 유효 여부
+        current_counts: 요청별 셀의 현재 아이템 개수
+        capacity: 셀 최대 용량
+    """
+    accepted = np.zeros(flat.size, dtype=bool)
+    valid_index = np.flatnonzero(valid)
+    ranks = rank_within_groups(flat[valid_index])
+    accepted[valid_index] = current_counts[valid_index] + ranks < capacity
+    return accepted
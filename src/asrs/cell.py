@@ -1,45 +1,150 @@
-from typing import List, Optional
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Optional, Sequence
+from .cell_container import ItemContainer, create_item_container
 from .item import Item
+from .output_policy import OutputPolicy
 from .position import Position
 
 
+class CellObserver(ABC):
+    """셀의 아이템 추가/제거를 통지받는 관찰자를 위한 추상 클래스"""
+
+    @abstractmethod
+    def on_item_added(self, cell: "Cell", item: Item):
+        pass
+
+    @abstractmethod
+    def on_item_removed(self, cell: "Cell", item: Item):
+        pass
+
+
+class CellItemsView:
+    """
+    셀 아이템에 대한 읽기 전용 뷰 (복사하지 않음)
+
+    셀의 현재 상태를 그대로 반영하며, 순회 순서는 셀 컨테이너의 내부 순서를
+    따릅니다 (PRIORITY 정책에서는 입고 순서가 아님). 입고 순서의 스냅샷이
+    필요하면 Cell.get_items()를 사용합니다.
+    """
+
+    __slots__ = ("_cell",)
+
+    def __init__(self, cell: "Cell"):
+        self._cell = cell
+
+    def __iter__(self) -> Iterator[Item]:
+        return iter(self._cell._container)
+
+    def __len__(self) -> int:
+        return len(self._cell._container)
+
+    def __contains__(self, item: object) -> bool:
+        return any(stored is item or stored == item for stored in self._cell._container)
+
+    def __repr__(self) -> str:
+        return f"CellItemsView({self._cell.position}, count={len(self)})"
+
+
 class Cell:
     """창고의 각 셀을 나타내는 클래스"""
 
-    def __init__(self, position: Position):
+    def __init__(
+        self,
+        position: Position,
+        observers: Sequence[CellObserver] = (),
+        policy: OutputPolicy = OutputPolicy.FIFO,
+        items: Sequence[Item] = ()
+    ):
+        """
+        Args:
+            items: 처음부터 들어 있는 아이템 (입고 순, 관찰자에게 통지하지 않음)
+        """
         self.position = position
-        self.items: List[Item] = []
+        self.policy = policy
+        self._container: ItemContainer = create_item_container(policy, items)
+        self.observers = observers  # 여러 셀이 같은 관찰자 목록을 공유
+
+    @property
+    def items(self) -> List[Item]:
+        """입고 순서대로 정렬된 아이템 목록 (복사본)"""
+        return self._container.ordered_items()
+
+    def set_policy(self, policy: OutputPolicy):
+        """출고 정책에 맞는 컨테이너로 아이템을 옮겨 담음"""
+        if policy == self.policy:
+            return
+        self._container = create_item_container(policy, self._container.ordered_items())
+        self.policy = policy
+
+    def _notify_added(self, item: Item):
+        for observer in self.observers:
+            observer.on_item_added(self, item)
+
+    def _notify_removed(self, item: Item):
+        for observer in self.observers:
+            observer.on_item_removed(self, item)
 
     def add_item(self, item: Item):
         """셀에 아이템 추가"""
-        self.items.append(item)
+        self._container.add(item)
+        self._notify_added(item)
 
     def remove_item_fifo(self) -> Optional[Item]:
         """FIFO 방식으로 아이템 제거"""
-        if self.items:
-            return self.items.pop(0)
-        return None
+        item = self._container.pop_fifo()
+        if item is not None:
+            self._notify_removed(item)
+        return item
 
     def remove_item_lifo(self) -> Optional[Item]:
         """LIFO 방식으로 아이템 제거"""
-        if self.items:
-            return self.items.pop()
-        return None
+        item = self._container.pop_lifo()
+        if item is not None:
+            self._notify_removed(item)
+        return item
 
     def remove_item_priority(self) -> Optional[Item]:
         """우선순위 방식으로 아이템 제거 (높은 우선순위부터)"""
-        if not self.items:
-            return None
+        # 같은 우선순위에서는 먼저 들어온 아이템을 선택
+        item = self._container.pop_priority()
+        if item is not None:
+            self._notify_removed(item)
+        return item
+
+    def remove_item_by_id(self, item_id: str, created_time: Optional[float] = None) -> Optional[Item]:
+        """
+        출고 정책과 관계없이 ID가 같은 아이템 중 가장 먼저 들어온 아이템 제거
 
-        # 우선순위가 가장 높은 아이템을 찾음
-        highest_priority_item = max(self.items, key=lambda item: item.priority)
-        self.items.remove(highest_priority_item)
-        return highest_priority_item
+        Args:
+            item_id: 아이템 ID
+            created_time: 같은 ID의 아이템이 여럿일 때 생성 시각이 같은 아이템을 우선 선택
+        """
+        item = None
+        if created_time is not None:
+            item = self._container.pop_first(
+                lambda stored: stored.id == item_id and stored.created_time == created_time)
+        if item is None:
+            item = self._container.pop_first(lambda stored: stored.id == item_id)
+        if item is not None:
+            self._notify_removed(item)
+        return item
 
     def is_empty(self) -> bool:
         """셀이 비어있는지 확인"""
-        return len(self.items) == 0
+        return len(self._container) == 0
+
+    def __len__(self) -> int:
+        """셀의 아이템 개수"""
+        return len(self._container)
+
+    def item_count(self) -> int:
+        """셀의 아이템 개수 (O(1))"""
+        return len(self._container)
+
+    def items_view(self) -> CellItemsView:
+        """복사 없이 셀의 아이템을 조회하는 읽기 전용 뷰 반환"""
+        return CellItemsView(self)
 
     def get_items(self) -> List[Item]:
         """셀의 모든 아이템 반환"""
-        return self.items.copy()
+        return self._container.ordered_items()
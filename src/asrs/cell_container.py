@@ -0,0 +1,162 @@
+import heapq
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Tuple
+
+from .item import Item
+from .output_policy import OutputPolicy
+
+
+class ItemContainer(ABC):
+    """셀 내부에서 아이템을 보관하는 컨테이너를 위한 추상 클래스"""
+
+    @abstractmethod
+    def add(self, item: Item):
+        pass
+
+    @abstractmethod
+    def pop_fifo(self) -> Optional[Item]:
+        pass
+
+    @abstractmethod
+    def pop_lifo(self) -> Optional[Item]:
+        pass
+
+    @abstractmethod
+    def pop_priority(self) -> Optional[Item]:
+        pass
+
+    @abstractmethod
+    def pop_first(self, match: Callable[[Item], bool]) -> Optional[Item]:
+        """match를 만족하는 아이템 중 가장 먼저 들어온 아이템을 꺼냄"""
+        pass
+
+    @abstractmethod
+    def ordered_items(self) -> List[Item]:
+        """입고 순서대로 정렬된 아이템 목록"""
+        pass
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[Item]:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+
+class DequeItemContainer(ItemContainer):
+    """FIFO/LIFO 출고용 deque 컨테이너 (양 끝 출고 O(1))"""
+
+    def __init__(self, items: Iterable[Item] = ()):
+        self._items: Deque[Item] = deque(items)
+
+    def add(self, item: Item):
+        self._items.append(item)
+
+    def pop_fifo(self) -> Optional[Item]:
+        if self._items:
+            return self._items.popleft()
+        return None
+
+    def pop_lifo(self) -> Optional[Item]:
+        if self._items:
+            return self._items.pop()
+        return None
+
+    def pop_priority(self) -> Optional[Item]:
+        if not self._items:
+            return None
+        # 같은 우선순위 중에서는 먼저 들어온 아이템을 선택
+        highest_index = 0
+        highest_priority = self._items[0].priority
+        for index, item in enumerate(self._items):
+            if item.priority > highest_priority:
+                highest_index, highest_priority = index, item.priority
+        item = self._items[highest_index]
+        del self._items[highest_index]
+        return item
+
+    def pop_first(self, match: Callable[[Item], bool]) -> Optional[Item]:
+        for index, item in enumerate(self._items):
+            if match(item):
+                del self._items[index]
+                return item
+        return None
+
+    def ordered_items(self) -> List[Item]:
+        return list(self._items)
+
+    def __iter__(self) -> Iterator[Item]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class PriorityItemContainer(ItemContainer):
+    """
+    PRIORITY 출고용 힙 컨테이너 (우선순위 출고 O(log n))
+
+    (-우선순위, 입고 순번, 아이템) 항목을 힙으로 유지하므로 같은 우선순위에서는
+    먼저 들어온 아이템이 먼저 나갑니다. 우선순위는 입고 시점의 값을 사용합니다.
+    """
+
+    def __init__(self, items: Iterable[Item] = ()):
+        self._heap: List[Tuple[int, int, Item]] = []
+        self._sequence = 0
+        for item in items:
+            self._heap.append((-item.priority, self._sequence, item))
+            self._sequence += 1
+        heapq.heapify(self._heap)
+
+    def add(self, item: Item):
+        heapq.heappush(self._heap, (-item.priority, self._sequence, item))
+        self._sequence += 1
+
+    def _pop_at(self, index: int) -> Item:
+        entry = self._heap[index]
+        last = self._heap.pop()
+        if index < len(self._heap):
+            self._heap[index] = last
+            heapq.heapify(self._heap)
+        return entry[2]
+
+    def pop_fifo(self) -> Optional[Item]:
+        if not self._heap:
+            return None
+        index = min(range(len(self._heap)), key=lambda i: self._heap[i][1])
+        return self._pop_at(index)
+
+    def pop_lifo(self) -> Optional[Item]:
+        if not self._heap:
+            return None
+        index = max(range(len(self._heap)), key=lambda i: self._heap[i][1])
+        return self._pop_at(index)
+
+    def pop_priority(self) -> Optional[Item]:
+        if self._heap:
+            return heapq.heappop(self._heap)[2]
+        return None
+
+    def pop_first(self, match: Callable[[Item], bool]) -> Optional[Item]:
+        matches = [index for index, entry in enumerate(self._heap) if match(entry[2])]
+        if not matches:
+            return None
+        return self._pop_at(min(matches, key=lambda i: self._heap[i][1]))
+
+    def ordered_items(self) -> List[Item]:
+        return [entry[2] for entry in sorted(self._heap, key=lambda entry: entry[1])]
+
+    def __iter__(self) -> Iterator[Item]:
+        return (entry[2] for entry in self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+def create_item_container(policy: OutputPolicy, items: Iterable[Item] = ()) -> ItemContainer:
+    """출고 정책에 맞는 컨테이너 생성"""
+    if policy == OutputPolicy.PRIORITY:
+        return PriorityItemContainer(items)
+    return DequeItemContainer(items)
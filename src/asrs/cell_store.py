@@ -0,0 +1,143 @@
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .cell import Cell, CellObserver
+from .output_policy import OutputPolicy
+from .position import Position
+
+if TYPE_CHECKING:
+    from .snapshot import SnapshotInventory
+
+
+class CellStore(Mapping):
+    """
+    셀을 처음 접근할 때 생성하는 희소(sparse) 셀 저장소
+
+    랙의 모든 좌표를 키로 갖는 매핑처럼 동작하지만, 실제 Cell 객체는
+    처음 쓰기 위해 접근한 좌표에 대해서만 만들어집니다. 한 번도 사용되지 않은
+    좌표는 빈 셀로 취급됩니다.
+    """
+
+    def __init__(self, max_x: int, max_y: int, max_z: int, observers: Sequence[CellObserver] = ()):
+        self.max_x = max_x
+        self.max_y = max_y
+        self.max_z = max_z
+        self.observers: List[CellObserver] = list(observers)  # 생성되는 모든 셀이 공유
+        self.policy = OutputPolicy.FIFO  # 새로 생성되는 셀의 출고 정책
+        self._cells: Dict[Position, Cell] = {}
+        self._snapshot: Optional["SnapshotInventory"] = None  # 아직 셀로 만들지 않은 복원 재고
+
+    def attach_snapshot(self, inventory: "SnapshotInventory"):
+        """복원한 재고 연결 (셀은 처음 접근할 때 만들어짐, 관찰자에게는 통지하지 않음)"""
+        self._snapshot = inventory
+
+    def _in_bounds(self, position: Position) -> bool:
+        return (0 <= position.x < self.max_x and
+                0 <= position.y < self.max_y and
+                0 <= position.z < self.max_z)
+
+    def _load(self, position: Position) -> Optional[Cell]:
+        """복원 재고에 있는 셀을 만듦 (재고가 없으면 None)"""
+        if not isinstance(position, Position) or not self._in_bounds(position):
+            return None
+        flat_index = (position.x * self.max_y + position.y) * self.max_z + position.z
+        items = self._snapshot.items_at(flat_index)
+        if not items:
+            return None
+        cell = Cell(position, self.observers, self.policy, items)
+        self._cells[position] = cell
+        return cell
+
+    def _load_all(self):
+        if self._snapshot is None:
+            return
+        inventory, self._snapshot = self._snapshot, None
+        for flat_index, start, end in zip(inventory.cells.tolist(), inventory.cell_offsets[:-1].tolist(),
+                                          inventory.cell_offsets[1:].tolist()):
+            position = inventory.position_of(flat_index)
+            if position not in self._cells:
+                self._cells[position] = Cell(position, self.observers, self.policy,
+                                             [inventory._item(row) for row in range(start, end)])
+
+    def detach_snapshot(self):
+        """연결된 복원 재고를 모두 셀로 만들고 연결을 끊음"""
+        self._load_all()
+
+    def __getitem__(self, position: Position) -> Cell:
+        """셀 반환 (아직 없으면 생성)"""
+        cell = self._cells.get(position)
+        if cell is not None:
+            return cell
+        if self._snapshot is not None:
+            cell = self._load(position)
+            if cell is not None:
+                return cell
+        if not isinstance(position, Position) or not self._in_bounds(position):
+            raise KeyError(position)
+        cell = Cell(position, self.observers, self.policy)
+        self._cells[position] = cell
+        return cell
+
+    def get(self, position: Position, default: Optional[Cell] = None) -> Optional[Cell]:
+        """이미 생성된 셀 반환 (셀을 새로 만들지 않음)"""
+        cell = self._cells.get(position)
+        if cell is None and self._snapshot is not None:
+            cell = self._load(position)
+        return default if cell is None else cell
+
+    def __contains__(self, position: object) -> bool:
+        return isinstance(position, Position) and self._in_bounds(position)
+
+    def __iter__(self) -> Iterator[Position]:
+        """랙의 모든 좌표를 (x, y, z) 순서로 순회"""
+        for x in range(self.max_x):
+            for y in range(self.max_y):
+                for z in range(self.max_z):
+                    yield Position(x, y, z)
+
+    def __len__(self) -> int:
+        return self.max_x * self.max_y * self.max_z
+
+    def items(self) -> Iterator[Tuple[Position, Cell]]:
+        """
+        랙의 모든 좌표의 (위치, 셀)을 순회 (셀을 새로 만들어 저장하지 않음)
+
+        생성되지 않은 좌표는 저장소에 넣지 않은 빈 임시 셀(관찰자 없음)로 반환하므로
+        조회에만 사용해야 합니다. 임시 셀에 넣은 아이템은 저장소에 반영되지 않으며,
+        입고할 셀은 store[position]으로 가져옵니다. 생성된 셀만 필요하면
+        allocated_items()를 사용합니다.
+        """
+        for position in self:
+            cell = self.get(position)
+            yield position, Cell(position, (), self.policy) if cell is None else cell
+
+    def values(self) -> Iterator[Cell]:
+        """랙의 모든 좌표의 셀을 순회 (items()와 같이 생성되지 않은 좌표는 빈 임시 셀)"""
+        for _, cell in self.items():
+            yield cell
+
+    def set_policy(self, policy: OutputPolicy):
+        """모든 셀의 아이템 컨테이너를 출고 정책에 맞게 재구성"""
+        self.policy = policy
+        for cell in self._cells.values():
+            cell.set_policy(policy)
+
+    def allocated_count(self) -> int:
+        """실제로 생성된 셀 개수"""
+        self._load_all()
+        return len(self._cells)
+
+    def allocated_items(self) -> Iterator[Tuple[Position, Cell]]:
+        """생성된 셀들의 (위치, 셀) 순회"""
+        self._load_all()
+        return iter(self._cells.items())
+
+    def allocated_cells(self) -> Iterator[Cell]:
+        """생성된 셀들 순회"""
+        self._load_all()
+        return iter(self._cells.values())
+
+    def is_empty_at(self, position: Position) -> bool:
+        """해당 좌표의 셀이 비어있는지 확인 (생성되지 않은 셀은 빈 셀)"""
+        cell = self.get(position)
+        return cell is None or cell.is_empty()
@@ -0,0 +1,451 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .batch import accept_within_capacity, flat_cell_indices
+from .config.simulation_clock import SimulationClock
+from .config.storage_cost_policy import StorageCostPolicy, PerTimeUnitStrategy
+from .config.work_time_config import WorkTimeConfig
+from .item import Item
+from .operation_record import OperationRecord, OperationType
+from .output_policy import OutputPolicy
+from .position import Position
+from .stacker_crane import StackerCrane
+from .travel_time_model import TravelTimeModel
+
+
+class ColumnarASRS:
+    """
+    NumPy 컬럼(struct-of-arrays) 기반 자동창고 백엔드
+
+    ASRS와 같은 입고/출고 API를 제공하지만, 재고를 셀/아이템 객체 대신
+    컬럼 배열(아이템 코드, 우선순위, 보관 비용, 입고 시각, 셀 번호 등)로 보관합니다.
+    아이템 행은 빈틈 없이 앞쪽(0 ~ 전체 아이템 수 - 1)에 모여 있으므로 컬럼 크기는
+    셀 용량이 아니라 아이템 수에 비례합니다. 출고된 행은 마지막 행으로 채우며,
+    셀별 행은 셀 머리 행 배열과 행별 이전/다음 행 컬럼의 이중 연결 목록으로 찾습니다.
+    """
+
+    SUPPORTED_STORAGE_COST_POLICIES = (StorageCostPolicy.PER_TIME_UNIT,)
+    _COLUMNS = ("item_codes", "priorities", "storage_costs", "arrival_times", "sequences", "cell_indices",
+                "_next_rows", "_prev_rows", "_items")
+
+    def __init__(
+        self,
+        max_x: int,
+        max_y: int,
+        max_z: int,
+        inbound_time: float = 1.0,
+        outbound_time: float = 1.0,
+        storage_cost_policy: StorageCostPolicy = StorageCostPolicy.PER_TIME_UNIT,
+        cost: float = 0.01,
+        cost_time: float = 0.1,
+        max_items_per_cell: int = 100,
+        realtime: bool = False,
+        travel_model: Optional[TravelTimeModel] = None
+    ):
+        """
+        Raises:
+            ValueError: 지원하지 않는 보관유지비용 정책인 경우 발생합니다 (PER_TIME_UNIT만 지원).
+        """
+        if storage_cost_policy not in self.SUPPORTED_STORAGE_COST_POLICIES:
+            raise ValueError(f"ColumnarASRS does not support storage cost policy {storage_cost_policy.value!r}.")
+        self.max_x = max_x
+        self.max_y = max_y
+        self.max_z = max_z
+        self.inbound_time = inbound_time
+        self.outbound_time = outbound_time
+        self.work_config = WorkTimeConfig(realtime=realtime)
+        self.operation_log: List[OperationRecord] = []
+        self.storage_cost_policy = storage_cost_policy
+        self.storage_cost_strategies = {
+            StorageCostPolicy.PER_TIME_UNIT: PerTimeUnitStrategy(),
+        }
+        self.cost = cost # 비용
+        self.cost_time = cost_time # 보관 유지 비용 정책(초)
+        self.max_items_per_cell = max_items_per_cell
+        self.output_policy = OutputPolicy.FIFO
+        self.stacker_crane = StackerCrane(self, travel_model)
+
+        # 셀별 아이템 수와 연결 목록의 머리 행 (-1: 빈 셀)
+        self._cell_counts = np.zeros(max_x * max_y * max_z, dtype=np.int64)
+        self._cell_heads = np.full(max_x * max_y * max_z, -1, dtype=np.int64)
+        self._total_items = 0
+        self._sequence = 0
+
+        # 아이템 ID 코드 테이블
+        self._id_codes: Dict[str, int] = {}
+        self._ids: List[str] = []
+
+        # 행별 컬럼 (앞쪽 _total_items개 행만 유효)
+        self.item_codes = np.empty(0, dtype=np.int64)
+        self.priorities = np.empty(0, dtype=np.int64)
+        self.storage_costs = np.empty(0, dtype=np.float64)
+        self.arrival_times = np.empty(0, dtype=np.float64)
+        self.sequences = np.empty(0, dtype=np.int64)
+        self.cell_indices = np.empty(0, dtype=np.int64)
+        self._next_rows = np.empty(0, dtype=np.int64)  # 같은 셀의 다음 행 (-1: 끝)
+        self._prev_rows = np.empty(0, dtype=np.int64)  # 같은 셀의 이전 행 (-1: 머리)
+        self._items = np.empty(0, dtype=object)
+
+    @property
+    def clock(self) -> SimulationClock:
+        """이 자동창고의 시뮬레이션 시계"""
+        return self.work_config.clock
+
+    def _is_valid_position(self, position: Position) -> bool:
+        """위치가 유효한지 확인"""
+        return (0 <= position.x < self.max_x and
+                0 <= position.y < self.max_y and
+                0 <= position.z < self.max_z)
+
+    def _flat_index(self, position: Position) -> int:
+        return (position.x * self.max_y + position.y) * self.max_z + position.z
+
+    def _positions_from_flat(self, flat_indices: np.ndarray) -> List[Position]:
+        coordinates = np.column_stack(np.unravel_index(flat_indices, (self.max_x, self.max_y, self.max_z)))
+        return [Position(x, y, z) for x, y, z in coordinates.tolist()]
+
+    def _item_code(self, item_id: str) -> int:
+        code = self._id_codes.get(item_id)
+        if code is None:
+            code = self._id_codes[item_id] = len(self._ids)
+            self._ids.append(item_id)
+        return code
+
+    def _reserve(self, row_total: int):
+        """컬럼이 row_total개 행을 담을 수 있도록 크기를 늘림 (두 배씩)"""
+        capacity = self.item_codes.size
+        if row_total <= capacity:
+            return
+        new_capacity = max(1, capacity)
+        while new_capacity < row_total:
+            new_capacity *= 2
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            grown = np.empty(new_capacity, dtype=column.dtype)
+            grown[:capacity] = column
+            setattr(self, name, grown)
+
+    def _link(self, row: int, flat_index: int):
+        """행을 셀 연결 목록의 머리에 추가"""
+        head = int(self._cell_heads[flat_index])
+        self._next_rows[row] = head
+        self._prev_rows[row] = -1
+        if head >= 0:
+            self._prev_rows[head] = row
+        self._cell_heads[flat_index] = row
+        self._cell_counts[flat_index] += 1
+
+    def _unlink(self, row: int):
+        """행을 셀 연결 목록에서 뺌"""
+        previous, following = int(self._prev_rows[row]), int(self._next_rows[row])
+        if previous >= 0:
+            self._next_rows[previous] = following
+        else:
+            self._cell_heads[self.cell_indices[row]] = following
+        if following >= 0:
+            self._prev_rows[following] = previous
+        self._cell_counts[self.cell_indices[row]] -= 1
+
+    def _remove_row(self, row: int):
+        """행을 지우고 마지막 행을 그 자리로 옮겨 행을 빈틈 없이 유지"""
+        self._unlink(row)
+        last = self._total_items - 1
+        if row != last:
+            for name in self._COLUMNS:
+                column = getattr(self, name)
+                column[row] = column[last]
+            # 옮긴 행을 가리키던 이웃(또는 셀 머리)을 새 행 번호로 갱신
+            previous, following = int(self._prev_rows[row]), int(self._next_rows[row])
+            if previous >= 0:
+                self._next_rows[previous] = row
+            else:
+                self._cell_heads[self.cell_indices[row]] = row
+            if following >= 0:
+                self._prev_rows[following] = row
+        self._items[last] = None
+        self._total_items = last
+
+    def _cell_rows(self, flat_index: int) -> np.ndarray:
+        """셀의 행 번호 배열 (연결 목록 순서)"""
+        rows = np.empty(int(self._cell_counts[flat_index]), dtype=np.int64)
+        row = int(self._cell_heads[flat_index])
+        next_rows = self._next_rows
+        for index in range(rows.size):
+            rows[index] = row
+            row = int(next_rows[row])
+        return rows
+
+    def _select_offset(self, rows: np.ndarray) -> int:
+        """출고 정책에 따라 셀의 행 중 출고할 행의 위치 선택"""
+        sequences = self.sequences[rows]
+        if self.output_policy == OutputPolicy.FIFO:
+            return int(np.argmin(sequences))
+        if self.output_policy == OutputPolicy.LIFO:
+            return int(np.argmax(sequences))
+        # 우선순위가 가장 높은 아이템, 같은 우선순위에서는 먼저 들어온 아이템
+        priorities = self.priorities[rows]
+        candidates = np.flatnonzero(priorities == priorities.max())
+        return int(candidates[np.argmin(sequences[candidates])])
+
+    def calculate_storage_cost(self, items_count: int) -> float:
+        storage_cost_policy = self.storage_cost_strategies[self.storage_cost_policy]
+        return storage_cost_policy.calculate(self, items_count)
+
+    def is_cell_full(self, current_items_count: int) -> bool:
+        """셀이 가득 찼는지 확인"""
+        return current_items_count >= self.max_items_per_cell
+
+    def get_available_capacity(self, current_items_count: int) -> int:
+        """셀의 남은 용량 반환"""
+        return max(0, self.max_items_per_cell - current_items_count)
+
+    def set_output_policy(self, policy: OutputPolicy):
+        """출고 정책 설정"""
+        self.output_policy = policy
+
+    def put_item(self, item: Item, position: Position) -> bool:
+        """아이템을 특정 위치에 입고"""
+        if not self._is_valid_position(position):
+            return False
+
+        flat_index = self._flat_index(position)
+        current_items_count = int(self._cell_counts[flat_index])
+
+        # 셀 용량 확인
+        if self.is_cell_full(current_items_count):
+            return False
+
+        # 입고 시간 딜레이 적용
+        start_time, finish_time = self.work_config.delay_time(self.inbound_time)
+
+        row = self._total_items
+        self._reserve(row + 1)
+        self.item_codes[row] = self._item_code(item.id)
+        self.priorities[row] = item.priority
+        self.storage_costs[row] = item.storage_cost
+        self.arrival_times[row] = finish_time
+        self.sequences[row] = self._sequence
+        self.cell_indices[row] = flat_index
+        self._items[row] = item
+        self._link(row, flat_index)
+        self._sequence += 1
+        self._total_items += 1
+
+        self.operation_log.append(
+            OperationRecord(OperationType.PUT, item.id, position, start_time, finish_time))
+        return True
+
+    def _remove_item(self, position: Position) -> Optional[Item]:
+        """출고 정책에 따라 셀에서 아이템 하나를 제거 (딜레이 없음)"""
+        flat_index = self._flat_index(position)
+        if self._cell_counts[flat_index] == 0:
+            return None
+
+        rows = self._cell_rows(flat_index)
+        row = int(rows[self._select_offset(rows)])
+        item = self._items[row]
+        self._remove_row(row)
+        return item
+
+    def get_item(self, position: Position) -> Optional[Item]:
+        """특정 위치에서 출고 정책에 따라 아이템 출고"""
+        if not self._is_valid_position(position):
+            return None
+
+        item = self._remove_item(position)
+        if item is not None:
+            # 출고 시간 딜레이 적용
+            start_time, finish_time = self.work_config.delay_time(self.outbound_time)
+            self.operation_log.append(
+                OperationRecord(OperationType.GET, item.id, position, start_time, finish_time))
+        return item
+
+    def put_items(self, pairs: Iterable[Tuple[Item, Position]]) -> List[bool]:
+        """
+        여러 아이템을 한 번에 입고
+
+        위치 검증, 용량 확인, 슬롯 배정과 컬럼 기록을 배열 연산으로 처리하며,
+        결과는 put_item을 순서대로 호출한 것과 같습니다.
+
+        Args:
+            pairs: (아이템, 위치) 목록
+
+        Returns:
+            요청별 입고 성공 여부
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return []
+
+        flat, valid = flat_cell_indices([position for _, position in pairs], self.max_x, self.max_y, self.max_z)
+        current_counts = self._cell_counts[flat]
+        accepted = accept_within_capacity(flat, valid, current_counts, self.max_items_per_cell)
+        accepted_index = np.flatnonzero(accepted)
+        if accepted_index.size == 0:
+            return accepted.tolist()
+
+        accepted_flat = flat[accepted_index]
+        slots = np.arange(self._total_items, self._total_items + accepted_index.size)
+        self._reserve(self._total_items + slots.size)
+
+        # 입고 시간 딜레이 적용
+        intervals = self.work_config.delay_times(self.inbound_time, accepted_index.size)
+
+        accepted_items = [pairs[index][0] for index in accepted_index.tolist()]
+        self.item_codes[slots] = [self._item_code(item.id) for item in accepted_items]
+        self.priorities[slots] = [item.priority for item in accepted_items]
+        self.storage_costs[slots] = [item.storage_cost for item in accepted_items]
+        self.arrival_times[slots] = [finish_time for _, finish_time in intervals]
+        self.sequences[slots] = np.arange(self._sequence, self._sequence + slots.size)
+        self.cell_indices[slots] = accepted_flat
+        object_column = np.empty(slots.size, dtype=object)
+        object_column[:] = accepted_items
+        self._items[slots] = object_column
+        self._link_rows(slots, accepted_flat)
+        self._sequence += slots.size
+        self._total_items += slots.size
+
+        for item, index, (start_time, finish_time) in zip(accepted_items, accepted_index.tolist(), intervals):
+            self.operation_log.append(
+                OperationRecord(OperationType.PUT, item.id, pairs[index][1], start_time, finish_time))
+        return accepted.tolist()
+
+    def _link_rows(self, rows: np.ndarray, flat_indices: np.ndarray):
+        """
+        행들을 순서대로 _link한 것과 같도록 셀 연결 목록에 한꺼번에 추가
+
+        셀마다 나중 행이 머리가 되고, 셀의 첫 새 행이 기존 머리를 가리킵니다.
+        """
+        order = np.argsort(flat_indices, kind="stable")
+        cells, rows = flat_indices[order], rows[order]
+        boundary = cells[1:] != cells[:-1]
+        first = np.concatenate(([True], boundary))
+        last = np.concatenate((boundary, [True]))
+        old_heads = self._cell_heads[cells]
+        self._next_rows[rows] = np.where(first, old_heads, np.concatenate(([-1], rows[:-1])))
+        self._prev_rows[rows] = np.where(last, -1, np.concatenate((rows[1:], [-1])))
+        first_rows, first_heads = rows[first], old_heads[first]
+        linked = first_heads >= 0
+        self._prev_rows[first_heads[linked]] = first_rows[linked]
+        self._cell_heads[cells[last]] = rows[last]
+        np.add.at(self._cell_counts, cells, 1)
+
+    def get_items(self, positions: Iterable[Position]) -> List[Optional[Item]]:
+        """
+        여러 위치에서 출고 정책에 따라 한 번에 출고
+
+        Args:
+            positions: 출고할 위치 목록 (같은 위치가 여러 번 나올 수 있음)
+
+        Returns:
+            요청별 출고된 아이템 (출고할 아이템이 없으면 None)
+        """
+        positions = list(positions)
+        if not positions:
+            return []
+
+        _, valid = flat_cell_indices(positions, self.max_x, self.max_y, self.max_z)
+        results: List[Optional[Item]] = [None] * len(positions)
+        for index in np.flatnonzero(valid).tolist():
+            results[index] = self._remove_item(positions[index])
+
+        # 출고 시간 딜레이 적용
+        retrieved_index = [index for index, item in enumerate(results) if item is not None]
+        intervals = self.work_config.delay_times(self.outbound_time, len(retrieved_index))
+        for index, (start_time, finish_time) in zip(retrieved_index, intervals):
+            self.operation_log.append(
+                OperationRecord(OperationType.GET, results[index].id, positions[index], start_time, finish_time))
+        return results
+
+    def get_items_at_position(self, position: Position) -> List[Item]:
+        """특정 위치의 모든 아이템 조회 (입고 순서)"""
+        if not self._is_valid_position(position):
+            return []
+
+        rows = self._cell_rows(self._flat_index(position))
+        order = np.argsort(self.sequences[rows], kind="stable")
+        return self._items[rows[order]].tolist()
+
+    def find_item_positions(self, item_id: str) -> List[Position]:
+        """특정 아이템 ID의 모든 위치 찾기"""
+        code = self._id_codes.get(item_id)
+        if code is None:
+            return []
+        count = self._total_items
+        mask = self.item_codes[:count] == code
+        return self._positions_from_flat(np.unique(self.cell_indices[:count][mask]))
+
+    def stacker_crane_put(self, item: Item, position: Position) -> bool:
+        """스태커크레인을 통한 입고"""
+        return self.stacker_crane.put_item(item, position)
+
+    def stacker_crane_get(self, position: Position) -> Optional[Item]:
+        """스태커크레인을 통한 출고"""
+        return self.stacker_crane.get_item(position)
+
+    def stacker_crane_put_items(self, pairs: Iterable[Tuple[Item, Position]]) -> List[bool]:
+        """스태커크레인을 통한 일괄 입고"""
+        return self.stacker_crane.put_items(pairs)
+
+    def stacker_crane_get_items(self, positions: Iterable[Position]) -> List[Optional[Item]]:
+        """스태커크레인을 통한 일괄 출고"""
+        return self.stacker_crane.get_items(positions)
+
+    def get_total_item_count(self) -> int:
+        """전체 아이템 수 반환"""
+        return self._total_items
+
+    def get_total_items(self) -> List[Item]:
+        return self._items[:self._total_items].tolist()
+
+    def cell_counts(self) -> np.ndarray:
+        """(x, y, z) 모양의 셀별 아이템 개수 배열"""
+        return self._cell_counts.reshape(self.max_x, self.max_y, self.max_z).copy()
+
+    def get_empty_cells(self) -> List[Position]:
+        """빈 셀들의 위치 반환"""
+        return self._positions_from_flat(np.flatnonzero(self._cell_counts == 0))
+
+    def get_available_cells(self) -> List[Position]:
+        """아직 용량이 남은 셀들의 위치 반환"""
+        return self._positions_from_flat(np.flatnonzero(self._cell_counts < self.max_items_per_cell))
+
+    def calculate_total_storage_cost(self, cost: float) -> float:
+        """전체 보관유지비용 계산 (아이템이 있는 셀 전체를 한 번에 계산)"""
+        occupied_counts = self._cell_counts[self._cell_counts > 0]
+        if occupied_counts.size == 0:
+            return 0.0
+        strategy = self.storage_cost_strategies[self.storage_cost_policy]
+        return float(np.sum(strategy.calculate(self, occupied_counts)))
+
+    def total_item_storage_cost(self) -> float:
+        """재고 전체의 아이템별 보관 비용 합계"""
+        return float(self.storage_costs[:self._total_items].sum())
+
+    def inventory_columns(self) -> Dict[str, np.ndarray]:
+        """현재 재고의 컬럼 배열 (아이템 ID, 우선순위, 보관 비용, 입고 시각, 셀 번호)"""
+        count = self._total_items
+        codes = self.item_codes[:count]
+        return {
+            "item_ids": np.asarray(self._ids, dtype=object)[codes] if codes.size else np.empty(0, dtype=object),
+            "priorities": self.priorities[:count].copy(),
+            "storage_costs": self.storage_costs[:count].copy(),
+            "arrival_times": self.arrival_times[:count].copy(),
+            "cell_indices": self.cell_indices[:count].copy(),
+        }
+
+    def get_cell_capacity_info(self, position: Position) -> Optional[
+        Dict[str, int]]:
+        """특정 셀의 용량 정보 반환"""
+        if not self._is_valid_position(position):
+            return None
+
+        current_items_count = int(self._cell_counts[self._flat_index(position)])
+
+        return {
+            "current_items": current_items_count,
+            "max_capacity": self.max_items_per_cell,
+            "available_capacity": self.get_available_capacity(
+                current_items_count)
+        }
@@ -0,0 +1,36 @@
+class SimulationClock:
+    """시뮬레이션 가상 시계 (초 단위)"""
+
+    def __init__(self, start_time: float = 0.0):
+        """
+        Args:
+            start_time: 시계의 시작 시각.
+        """
+        self.now = start_time
+
+    def advance(self, duration: float) -> float:
+        """
+        시계를 duration 만큼 진행
+
+        Args:
+            duration: 진행할 시간 (초)
+
+        Returns:
+            진행 후의 현재 시각
+
+        Raises:
+            ValueError: duration이 음수인 경우 발생합니다.
+        """
+        if duration < 0:
+            raise ValueError("Duration cannot be negative.")
+        self.now += duration
+        return self.now
+
+    def advance_to(self, target_time: float) -> float:
+        """시계를 target_time 까지 진행 (과거 시각이면 변화 없음)"""
+        if target_time > self.now:
+            self.now = target_time
+        return self.now
+
+    def __repr__(self) -> str:
+        return f"SimulationClock(now={self.now})"
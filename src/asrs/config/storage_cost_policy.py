@@ -1,25 +1,240 @@
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 if TYPE_CHECKING:
     from ..asrs import ASRS
+    from ..item import Item
+    from ..position import Position
+
+Count = Union[int, np.ndarray]
 
 
 class StorageCostPolicy(Enum):
     """보관유지비용 정책"""
     PER_TIME_UNIT = "per_time_unit"
+    PER_ITEM = "per_item"
+    VOLUME = "volume"
+    WEIGHT = "weight"
+    TIERED_OCCUPANCY = "tiered_occupancy"
+    PER_ZONE = "per_zone"
 
 
 class StorageCostStrategy(ABC):
     """보관 유지 비용 전략을 위한 추상 클래스"""
 
+    # True면 셀 비용이 셀의 아이템 수만으로 정해지므로 StorageAggregates가 입고/출고 때 증분 갱신
+    incremental: bool = False
+    # True면 아이템 비용율이 셀의 아이템 수에 따라 바뀌므로(count_rate) 보관 시간 누적 비용이
+    # 입고/출고로 비용율이 바뀐 셀의 아이템을 다시 적분
+    occupancy_dependent: bool = False
+
     @abstractmethod
-    def calculate(self, context: "ASRS", item_count: int) -> float:
+    def calculate(self, context: "ASRS", item_count: Count) -> Count:
+        """아이템 item_count개가 있는 셀의 비용 (item_count는 셀별 배열일 수 있음)"""
         pass
 
+    def item_rate(self, context: "ASRS", item: "Item", position: Optional["Position"] = None) -> float:
+        """아이템 하나를 cost_time 동안 보관하는 비용 (보관 시간 누적 비용 계산용)"""
+        return self.calculate(context, 1)
+
+    def count_rate(self, context: "ASRS", item_count: int) -> float:
+        """아이템 item_count개가 있는 셀의 아이템 하나의 비용율 (occupancy_dependent 전략용)"""
+        return self.calculate(context, 1)
+
+    def config(self) -> Dict[str, Any]:
+        """전략을 다시 만들 생성자 인자 (스냅샷 헤더에 msgpack으로 저장)"""
+        return {}
+
+    def calculate_total(self, context: "ASRS") -> float:
+        """재고 전체의 비용 (셀별 아이템 수 배열에 대한 배열 연산)"""
+        counts = context.occupancy.counts
+        occupied = counts[counts > 0].astype(np.int64)
+        if occupied.size == 0:
+            return 0.0
+        return float(np.sum(self.calculate(context, occupied)))
+
 
 class PerTimeUnitStrategy(StorageCostStrategy):
-    def calculate(self, context: "ASRS", item_count: int) -> float:
+    incremental = True
+
+    def calculate(self, context: "ASRS", item_count: Count) -> Count:
         base_cost = context.cost
         return base_cost * item_count
+
+
+class _InventoryAttributeStrategy(StorageCostStrategy):
+    """아이템 속성 합계(InventoryTotals)로 계산하는 전략의 공통 부분"""
+
+    @abstractmethod
+    def _total(self, context: "ASRS") -> float:
+        """재고 전체의 비용 (context.inventory_totals의 배열 합)"""
+        pass
+
+    def calculate_total(self, context: "ASRS") -> float:
+        return self._total(context)
+
+    def calculate(self, context: "ASRS", item_count: Count) -> Count:
+        # 아이템 정보 없이 개수만 주어지면 현재 재고의 평균 비용으로 계산
+        total_items = int(context.occupancy.counts.sum())
+        mean = self._total(context) / total_items if total_items else context.cost
+        return mean * item_count
+
+
+class PerItemStrategy(_InventoryAttributeStrategy):
+    """아이템별 비용율(Item.storage_cost)의 합"""
+
+    def _total(self, context: "ASRS") -> float:
+        return float(context.inventory_totals.storage_costs.sum())
+
+    def item_rate(self, context: "ASRS", item: "Item", position: Optional["Position"] = None) -> float:
+        return item.storage_cost
+
+
+class VolumeStrategy(_InventoryAttributeStrategy):
+    """
+    부피 기반 비용 (Entity의 width * length * height)
+
+    Entity가 없는 아이템은 default_volume으로 봅니다.
+    """
+
+    def __init__(self, rate: Optional[float] = None, default_volume: float = 1.0):
+        """
+        Args:
+            rate: 단위 부피당 비용율 (생략하면 자동창고의 cost)
+            default_volume: Entity가 없는 아이템의 부피
+        """
+        self.rate = rate
+        self.default_volume = default_volume
+
+    def config(self) -> Dict[str, Any]:
+        return {"rate": self.rate, "default_volume": self.default_volume}
+
+    def _rate(self, context: "ASRS") -> float:
+        return context.cost if self.rate is None else self.rate
+
+    def _total(self, context: "ASRS") -> float:
+        totals = context.inventory_totals
+        volume = float(totals.volumes.sum()) + self.default_volume * float(totals.unsized.sum())
+        return self._rate(context) * volume
+
+    def item_rate(self, context: "ASRS", item: "Item", position: Optional["Position"] = None) -> float:
+        entity = item.entity
+        volume = self.default_volume if entity is None else entity.width * entity.length * entity.height
+        return self._rate(context) * volume
+
+
+class WeightStrategy(_InventoryAttributeStrategy):
+    """
+    무게 기반 비용 (Entity의 weight)
+
+    Entity가 없는 아이템은 default_weight로 봅니다.
+    """
+
+    def __init__(self, rate: Optional[float] = None, default_weight: float = 1.0):
+        """
+        Args:
+            rate: 단위 무게당 비용율 (생략하면 자동창고의 cost)
+            default_weight: Entity가 없는 아이템의 무게
+        """
+        self.rate = rate
+        self.default_weight = default_weight
+
+    def config(self) -> Dict[str, Any]:
+        return {"rate": self.rate, "default_weight": self.default_weight}
+
+    def _rate(self, context: "ASRS") -> float:
+        return context.cost if self.rate is None else self.rate
+
+    def _total(self, context: "ASRS") -> float:
+        totals = context.inventory_totals
+        weight = float(totals.weights.sum()) + self.default_weight * float(totals.unsized.sum())
+        return self._rate(context) * weight
+
+    def item_rate(self, context: "ASRS", item: "Item", position: Optional["Position"] = None) -> float:
+        weight = self.default_weight if item.entity is None else item.entity.weight
+        return self._rate(context) * weight
+
+
+class TieredOccupancyStrategy(StorageCostStrategy):
+    """
+    셀 적재율 구간별 비용율
+
+    셀의 적재율(아이템 수 / 셀 용량)이 tiers[i]의 상한 이하인 첫 구간의 배율을
+    cost에 곱한 비용율이 그 셀의 모든 아이템에 적용됩니다. 입고/출고로 셀의 구간이
+    바뀌면 보관 시간 누적 비용도 그 시각부터 셀의 모든 아이템에 새 비용율을 적용합니다.
+    """
+
+    incremental = True
+    occupancy_dependent = True
+
+    def __init__(self, tiers: Sequence[Tuple[float, float]] = ((0.5, 1.0), (0.8, 1.5), (1.0, 2.0))):
+        """
+        Args:
+            tiers: (적재율 상한, cost 배율) 목록 (상한 오름차순)
+        """
+        self.bounds = np.array([bound for bound, _ in tiers], dtype=np.float64)
+        self.multipliers = np.array([multiplier for _, multiplier in tiers], dtype=np.float64)
+
+    def config(self) -> Dict[str, Any]:
+        return {"tiers": [list(tier) for tier in zip(self.bounds.tolist(), self.multipliers.tolist())]}
+
+    def _tiers(self, context: "ASRS", counts: np.ndarray) -> np.ndarray:
+        return np.minimum(np.searchsorted(self.bounds, counts / context.max_items_per_cell, side="left"),
+                          len(self.bounds) - 1)
+
+    def calculate(self, context: "ASRS", item_count: Count) -> Count:
+        counts = np.asarray(item_count)
+        costs = context.cost * self.multipliers[self._tiers(context, counts)] * counts
+        return float(costs) if costs.ndim == 0 else costs
+
+    def count_rate(self, context: "ASRS", item_count: int) -> float:
+        return context.cost * float(self.multipliers[self._tiers(context, np.asarray(item_count))])
+
+    def item_rate(self, context: "ASRS", item: "Item", position: Optional["Position"] = None) -> float:
+        if position is None:
+            return context.cost * float(self.multipliers[0])
+        return self.count_rate(context, context.occupancy.count_at(position))
+
+
+class PerZoneStrategy(StorageCostStrategy):
+    """
+    구역별 비용율
+
+    zone_map은 셀별 구역 번호 ((x, y, z) 배열)이며, 생략하면 층(z)을 아래에서부터
+    len(zone_rates)개 구역으로 나눕니다. 구역 i의 비용율은 cost * zone_rates[i]입니다.
+    """
+
+    def __init__(self, zone_rates: Sequence[float] = (1.0,), zone_map: Optional[np.ndarray] = None):
+        self.zone_rates = np.asarray(zone_rates, dtype=np.float64)
+        self.zone_map = zone_map
+        self._rate_maps: Dict[Tuple[int, int, int], np.ndarray] = {}
+
+    def config(self) -> Dict[str, Any]:
+        zone_map = None if self.zone_map is None else np.asarray(self.zone_map).tolist()
+        return {"zone_rates": self.zone_rates.tolist(), "zone_map": zone_map}
+
+    def cell_rates(self, context: "ASRS") -> np.ndarray:
+        """셀별 cost 배율 ((x, y, z) 배열)"""
+        shape = (context.max_x, context.max_y, context.max_z)
+        rates = self._rate_maps.get(shape)
+        if rates is None:
+            zone_map = self.zone_map
+            if zone_map is None:
+                layer_zones = np.arange(context.max_z) * len(self.zone_rates) // context.max_z
+                zone_map = np.broadcast_to(layer_zones, shape)
+            rates = self._rate_maps[shape] = self.zone_rates[zone_map]
+        return rates
+
+    def calculate(self, context: "ASRS", item_count: Count) -> Count:
+        return context.cost * float(self.zone_rates.mean()) * item_count
+
+    def calculate_total(self, context: "ASRS") -> float:
+        return context.cost * float(np.vdot(self.cell_rates(context), context.occupancy.counts))
+
+    def item_rate(self, context: "ASRS", item: "Item", position: Optional["Position"] = None) -> float:
+        if position is None:
+            return self.calculate(context, 1)
+        return context.cost * float(self.cell_rates(context)[position.x, position.y, position.z])
@@ -1,11 +1,92 @@
+import asyncio
 import time
+from typing import Callable, List, Optional, Tuple, TypeVar
+
+from .simulation_clock import SimulationClock
+
+T = TypeVar("T")
 
 
 class WorkTimeConfig:
-    def __init__(self):
+    def __init__(self, realtime: bool = False, clock: Optional[SimulationClock] = None):
           self.inbound_time: float = 1.0
           self.outbound_time: float = 1.0
+          self.realtime = realtime  # True면 실제 시간만큼 대기 (라이브 데모용)
+          self.clock = clock if clock is not None else SimulationClock()
+          self._deferred_sleep: Optional[float] = None  # run_deferred 중 미뤄둔 실제 대기 시간
+
+    def _sleep(self, duration: float):
+        if not self.realtime:
+            return
+        if self._deferred_sleep is not None:
+            self._deferred_sleep += duration
+        else:
+            time.sleep(duration)
+
+    def delay_time(self, input_time: float) -> Tuple[float, float]:
+        """
+        작업 시간만큼 시뮬레이션 시계를 진행
+
+        Args:
+            input_time: 작업 소요 시간 (초)
+
+        Returns:
+            작업의 (시작 시각, 종료 시각)
+        """
+        start_time = self.clock.now
+        finish_time = self.clock.advance(input_time)
+        self._sleep(input_time)
+        return start_time, finish_time
+
+    def delay_times(self, input_time: float, count: int, on_start: Optional[Callable[[int], None]] = None,
+                    on_finish: Optional[Callable[[int], None]] = None) -> List[Tuple[float, float]]:
+        """
+        같은 작업 count건을 연속으로 처리한 만큼 시계를 진행
+
+        Args:
+            input_time: 작업 한 건의 소요 시간 (초)
+            count: 작업 건수
+            on_start: 시계를 작업 index의 시작 시각으로 맞춘 뒤 호출 (index를 인자로 받음)
+            on_finish: 시계를 작업 index의 종료 시각으로 맞춘 뒤 호출 (index를 인자로 받음)
+
+        Returns:
+            작업별 (시작 시각, 종료 시각) 목록
+        """
+        intervals = []
+        start_time = self.clock.now
+        for index in range(count):
+            if on_start is not None:
+                self.clock.advance_to(start_time)
+                on_start(index)
+            finish_time = start_time + input_time
+            intervals.append((start_time, finish_time))
+            if on_finish is not None:
+                self.clock.advance_to(finish_time)
+                on_finish(index)
+            start_time = finish_time
+        self.clock.advance_to(start_time)
+        if count > 0:
+            self._sleep(input_time * count)
+        return intervals
+
+    def run_deferred(self, operation: Callable[..., T], *args) -> Tuple[T, float]:
+        """
+        실제 대기 없이 작업을 실행하고, 대기했어야 할 시간을 함께 반환
+
+        비동기 API가 time.sleep 대신 asyncio.sleep으로 기다릴 수 있도록 합니다.
 
-    def delay_time(self, input_time: int):
-        time.sleep(input_time)
+        Returns:
+            (작업 결과, 미뤄둔 실제 대기 시간). realtime이 아니면 대기 시간은 0
+        """
+        outer = self._deferred_sleep
+        self._deferred_sleep = 0.0
+        try:
+            result = operation(*args)
+            deferred = self._deferred_sleep
+        finally:
+            self._deferred_sleep = outer
+        return result, deferred
 
+    async def sleep_async(self, duration: float):
+        """duration만큼 이벤트 루프를 막지 않고 대기 (대기 시간이 0이어도 다른 작업에 양보)"""
+        await asyncio.sleep(duration if self.realtime else 0)
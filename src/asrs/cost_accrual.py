@@ -0,0 +1,123 @@
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
+
+from .cell import Cell, CellObserver
+from .item import Item
+from .position import Position
+
+if TYPE_CHECKING:
+    from .asrs import ASRS
+    from .config.storage_cost_policy import StorageCostStrategy
+
+
+class StorageCostAccrual(CellObserver):
+    """
+    보관 시간에 따라 쌓이는 보관유지비용의 이벤트 기반 적분
+
+    아이템 i의 비용은 rate_i * (출고 시각 - 입고 시각) / cost_time이며, 입고/출고
+    때마다 세 값만 갱신합니다.
+
+    - closed: 이미 출고된 아이템의 비용 합 (rate * 시간)
+    - open_rate: 보관 중인 아이템의 rate 합
+    - open_rate_time: 보관 중인 아이템의 rate * 적분 시작 시각 합
+
+    따라서 시각 t까지의 누적 비용은 (closed + open_rate * t - open_rate_time) / cost_time으로
+    셀을 훑지 않고 O(1)에 계산됩니다. 시각 순서와 무관한 합이므로 크레인마다 시계가
+    다른 경우에도 성립합니다. rate는 현재 보관유지비용 전략의 item_rate입니다.
+
+    비용율이 셀의 아이템 수에 따라 바뀌는 전략(occupancy_dependent, 예: 적재율 구간)은
+    입고/출고로 셀의 비용율이 바뀔 때 그 셀에 남은 아이템의 지난 비용을 이전 비용율로
+    closed에 보정하고 이후는 새 비용율로 적분합니다 (셀 하나의 아이템만 훑음).
+    """
+
+    def __init__(self, context: "ASRS"):
+        self.context = context
+        self.closed = 0.0
+        self.open_rate = 0.0
+        self.open_rate_time = 0.0
+        self.rebase_time = float("-inf")  # 마지막으로 rate가 바뀐 시각
+
+    def _rate(self, item: Item, position: Position) -> float:
+        return self._strategy().item_rate(self.context, item, position)
+
+    def _start_time(self, item: Item) -> float:
+        return max(item.stored_time, self.rebase_time)
+
+    def _strategy(self) -> "StorageCostStrategy":
+        context = self.context
+        return context.storage_cost_strategies[context.storage_cost_policy]
+
+    def _change_cell_rate(self, cell: Cell, old_rate: float, new_rate: float, now: float, skip: Optional[Item] = None):
+        """셀에 남은 아이템의 비용율을 now부터 old_rate에서 new_rate로 바꿈"""
+        delta = new_rate - old_rate
+        for item in cell.items_view():
+            if item is skip:
+                continue
+            start_time = self._start_time(item)
+            # 나중에 new_rate * (출고 시각 - 시작 시각)으로 닫히므로 지난 구간의 차이를 미리 보정
+            self.closed -= delta * (now - start_time)
+            self.open_rate += delta
+            self.open_rate_time += delta * start_time
+
+    def on_item_added(self, cell: Cell, item: Item):
+        now = self.context.clock.now
+        item.stored_time = now
+        strategy = self._strategy()
+        if strategy.occupancy_dependent:
+            count = cell.item_count()
+            rate = strategy.count_rate(self.context, count)
+            old_rate = strategy.count_rate(self.context, count - 1)
+            if count > 1 and old_rate != rate:
+                self._change_cell_rate(cell, old_rate, rate, now, skip=item)
+        else:
+            rate = self._rate(item, cell.position)
+        self.open_rate += rate
+        self.open_rate_time += rate * self._start_time(item)
+
+    def on_item_removed(self, cell: Cell, item: Item):
+        now = self.context.clock.now
+        strategy = self._strategy()
+        if strategy.occupancy_dependent:
+            count = cell.item_count()
+            rate = strategy.count_rate(self.context, count + 1)
+            new_rate = strategy.count_rate(self.context, count)
+            if count > 0 and new_rate != rate:
+                self._change_cell_rate(cell, rate, new_rate, now)
+        else:
+            rate = self._rate(item, cell.position)
+        start_time = self._start_time(item)
+        self.closed += rate * (now - start_time)
+        self.open_rate -= rate
+        self.open_rate_time -= rate * start_time
+        item.stored_time = None
+
+    def load_items(self, items: Iterable[Tuple[Position, Item]]):
+        """관찰자 통지 없이 보관 중인 (위치, 아이템)을 반영 (stored_time이 이미 정해진 아이템)"""
+        for position, item in items:
+            rate = self._rate(item, position)
+            self.open_rate += rate
+            self.open_rate_time += rate * self._start_time(item)
+
+    def rebase(self, items: Iterable[Tuple[Position, Item]], now: Optional[float] = None):
+        """
+        rate가 바뀌기 전까지의 비용을 closed로 옮기고 now부터 새 rate로 적분
+
+        Args:
+            items: 보관 중인 모든 (위치, 아이템)
+            now: 기준 시각 (생략하면 자동창고 시계의 현재 시각). 보관 중인 아이템의
+                입고 시각보다 이르면 안 됩니다.
+        """
+        if now is None:
+            now = self.context.clock.now
+        self.closed += self.open_rate * now - self.open_rate_time
+        self.rebase_time = now
+        self.open_rate = sum(self._rate(item, position) for position, item in items)
+        self.open_rate_time = self.open_rate * now
+
+    def accrued(self, at: float) -> float:
+        """
+        시각 at까지 쌓인 보관유지비용
+
+        at이 보관 중인 아이템의 입고 시각보다 이르면 그 아이템은 음수 비용이 되므로,
+        합계가 음수가 되지 않도록 0으로 자릅니다.
+        """
+        return max(0.0, (self.closed + self.open_rate * at - self.open_rate_time) / self.context.cost_time)
@@ -0,0 +1,210 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .config.simulation_clock import SimulationClock
+from .crane_request import BatchingPolicy, CraneRequest
+from .item import Item
+from .position import Position
+from .stacker_crane import StackerCrane
+from .travel_time_model import TravelTimeModel
+
+
+@dataclass(frozen=True)
+class CranePartition:
+    """크레인 한 대가 담당하는 (x, y, z) 구간 (각 구간은 [시작, 끝) )"""
+    x_range: Tuple[int, int]
+    y_range: Tuple[int, int]
+    z_range: Tuple[int, int]
+
+    def contains(self, position: Position) -> bool:
+        return (self.x_range[0] <= position.x < self.x_range[1] and
+                self.y_range[0] <= position.y < self.y_range[1] and
+                self.z_range[0] <= position.z < self.z_range[1])
+
+    def nearest(self, position: Position) -> Position:
+        """구간 안에서 position과 가장 가까운 셀 (구간 안이면 position 그대로)"""
+        return Position(min(max(position.x, self.x_range[0]), self.x_range[1] - 1),
+                        min(max(position.y, self.y_range[0]), self.y_range[1] - 1),
+                        min(max(position.z, self.z_range[0]), self.z_range[1] - 1))
+
+
+@dataclass(frozen=True)
+class CraneStatistics:
+    """크레인별 가동 통계"""
+    crane_id: int
+    operation_count: int
+    busy_time: float
+    utilization: float
+    mean_wait_time: float
+    mean_queue_length: float
+    max_queue_length: int
+
+
+class CraneFleet:
+    """
+    구역을 나눠 담당하는 스태커크레인 묶음
+
+    요청은 위치를 담당하는 크레인으로 전달되고, 각 크레인은 자기 시계 위에서
+    작업하므로 서로 다른 크레인의 작업은 시뮬레이션 시간상 동시에 진행됩니다.
+    크레인이 한 대뿐이면 크레인 시계로 자동창고 시계를 그대로 사용하므로, 크레인
+    작업이 자동창고 시계를 진행시킵니다.
+    """
+
+    def __init__(
+        self,
+        asrs_system,
+        partitions: Sequence[CranePartition],
+        travel_model: Optional[TravelTimeModel] = None
+    ):
+        """
+        Raises:
+            ValueError: 구역이 없거나 랙 전체를 덮지 않는 경우 발생합니다.
+        """
+        if not partitions:
+            raise ValueError("At least one crane partition is required.")
+        self.asrs_system = asrs_system
+        self.partitions = list(partitions)
+
+        # 셀별 담당 크레인 번호 (구역이 겹치면 앞선 구역이 우선)
+        self._owners = np.full((asrs_system.max_x, asrs_system.max_y, asrs_system.max_z), -1, dtype=np.int32)
+        for crane_id in reversed(range(len(self.partitions))):
+            partition = self.partitions[crane_id]
+            self._owners[partition.x_range[0]:partition.x_range[1],
+                         partition.y_range[0]:partition.y_range[1],
+                         partition.z_range[0]:partition.z_range[1]] = crane_id
+        if (self._owners < 0).any():
+            raise ValueError("Crane partitions must cover the whole rack.")
+
+        single = len(self.partitions) == 1
+        # 각 크레인은 I/O 지점(구역 밖이면 구역에서 가장 가까운 셀)에서 시작
+        io_point = travel_model.io_point if travel_model is not None else Position(0, 0, 0)
+        self.cranes = [
+            StackerCrane(asrs_system, travel_model,
+                         timeline=asrs_system.clock if single else SimulationClock(asrs_system.clock.now),
+                         crane_id=crane_id,
+                         home_position=partition.nearest(io_point))
+            for crane_id, partition in enumerate(self.partitions)
+        ]
+
+    @classmethod
+    def by_aisle(
+        cls,
+        asrs_system,
+        crane_count: int = 1,
+        cranes_per_aisle: int = 1,
+        travel_model: Optional[TravelTimeModel] = None
+    ) -> "CraneFleet":
+        """
+        통로(x) 단위로 랙을 나눠 크레인을 배치
+
+        Args:
+            crane_count: 전체 크레인 수
+            cranes_per_aisle: 통로 하나(또는 통로 묶음)를 y 방향으로 나눠 맡는 크레인 수
+
+        Raises:
+            ValueError: 크레인 수가 랙 크기나 cranes_per_aisle과 맞지 않는 경우 발생합니다.
+        """
+        if crane_count < 1 or cranes_per_aisle < 1 or crane_count % cranes_per_aisle != 0:
+            raise ValueError("crane_count must be a positive multiple of cranes_per_aisle.")
+        aisle_groups = crane_count // cranes_per_aisle
+        if aisle_groups > asrs_system.max_x or cranes_per_aisle > asrs_system.max_y:
+            raise ValueError("Too many cranes for the rack dimensions.")
+
+        partitions = []
+        for x_cells in np.array_split(np.arange(asrs_system.max_x), aisle_groups):
+            for y_cells in np.array_split(np.arange(asrs_system.max_y), cranes_per_aisle):
+                partitions.append(CranePartition(
+                    (int(x_cells[0]), int(x_cells[-1]) + 1),
+                    (int(y_cells[0]), int(y_cells[-1]) + 1),
+                    (0, asrs_system.max_z)))
+        return cls(asrs_system, partitions, travel_model)
+
+    def crane_for(self, position: Position) -> StackerCrane:
+        """위치를 담당하는 크레인 반환 (랙 밖의 위치는 첫 번째 크레인)"""
+        if self.asrs_system._is_valid_position(position):
+            return self.cranes[self._owners[position.x, position.y, position.z]]
+        return self.cranes[0]
+
+    def put_item(self, item: Item, position: Position) -> bool:
+        """담당 크레인을 통한 입고"""
+        return self.crane_for(position).put_item(item, position)
+
+    def get_item(self, position: Position) -> Optional[Item]:
+        """담당 크레인을 통한 출고"""
+        return self.crane_for(position).get_item(position)
+
+    def _group_by_crane(self, positions: Sequence[Position]) -> Dict[int, List[int]]:
+        groups: Dict[int, List[int]] = {}
+        for index, position in enumerate(positions):
+            groups.setdefault(self.crane_for(position).crane_id, []).append(index)
+        return groups
+
+    def put_items(self, pairs: Iterable[Tuple[Item, Position]]) -> List[bool]:
+        """크레인별로 나눠 일괄 입고 (결과는 요청 순서)"""
+        pairs = list(pairs)
+        results: List[bool] = [False] * len(pairs)
+        for crane_id, indices in self._group_by_crane([position for _, position in pairs]).items():
+            crane_results = self.cranes[crane_id].put_items([pairs[index] for index in indices])
+            for index, result in zip(indices, crane_results):
+                results[index] = result
+        return results
+
+    def get_items(self, positions: Iterable[Position]) -> List[Optional[Item]]:
+        """크레인별로 나눠 일괄 출고 (결과는 요청 순서)"""
+        positions = list(positions)
+        results: List[Optional[Item]] = [None] * len(positions)
+        for crane_id, indices in self._group_by_crane(positions).items():
+            crane_results = self.cranes[crane_id].get_items([positions[index] for index in indices])
+            for index, result in zip(indices, crane_results):
+                results[index] = result
+        return results
+
+    def set_batching(self, batching: Optional[BatchingPolicy]):
+        """모든 크레인의 대기열 일괄 처리 조건 설정 (None이면 일괄 처리 해제)"""
+        for crane in self.cranes:
+            crane.batching = batching
+
+    def submit_put(self, item: Item, position: Position) -> CraneRequest:
+        """담당 크레인의 대기열에 입고 요청 추가"""
+        return self.crane_for(position).submit_put(item, position)
+
+    def submit_get(self, position: Position, priority: int = 0) -> CraneRequest:
+        """담당 크레인의 대기열에 출고 요청 추가"""
+        return self.crane_for(position).submit_get(position, priority)
+
+    def poll(self) -> List[CraneRequest]:
+        """일괄 처리 조건을 만족한 크레인들의 대기열 처리"""
+        return [request for crane in self.cranes for request in crane.poll()]
+
+    def flush(self) -> List[CraneRequest]:
+        """모든 크레인의 대기열 처리"""
+        return [request for crane in self.cranes for request in crane.flush()]
+
+    @property
+    def makespan(self) -> float:
+        """모든 크레인이 작업을 마치는 시각"""
+        return max(crane.timeline.now for crane in self.cranes)
+
+    def statistics(self, horizon: Optional[float] = None) -> List[CraneStatistics]:
+        """
+        크레인별 가동률과 대기열 통계
+
+        Args:
+            horizon: 가동률 계산 기준 시간 (생략하면 전체 크레인의 makespan)
+        """
+        if horizon is None:
+            horizon = self.makespan
+        return [
+            CraneStatistics(
+                crane_id=crane.crane_id,
+                operation_count=crane.operation_count,
+                busy_time=crane.busy_time,
+                utilization=crane.busy_time / horizon if horizon > 0 else 0.0,
+                mean_wait_time=crane.mean_wait_time,
+                mean_queue_length=crane.mean_queue_length,
+                max_queue_length=crane.max_queue_length,
+            )
+            for crane in self.cranes
+        ]
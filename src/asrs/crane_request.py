@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from .item import Item
+from .operation_record import OperationType
+from .position import Position
+
+
+@dataclass
+class CraneRequest:
+    """스태커크레인 대기열의 입고/출고 요청"""
+    operation: OperationType
+    position: Position
+    item: Optional[Item] = None  # 입고 요청의 아이템
+    arrival_time: float = 0.0
+    result: Union[bool, Item, None] = None  # 입고 성공 여부 또는 출고된 아이템
+    completed: bool = False
+    priority: int = 0
+    deadline: Optional[float] = None  # 이 시각까지 처리를 마쳐야 하는 요청
+    start_time: Optional[float] = None
+    finish_time: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class BatchingPolicy:
+    """
+    크레인 대기열의 일괄 처리 조건
+
+    가장 먼저 도착한 요청이 time_window만큼 기다렸거나 대기 요청이 max_batch_size개가
+    되면 대기열 전체를 한 묶음으로 처리합니다. 우선순위가 deadline_priority 이상인
+    요청은 도착 후 max_delay 안에 처리를 마쳐야 하는 마감 시각을 가집니다.
+    조건은 요청을 추가하거나 StackerCrane.poll을 호출할 때만 확인합니다.
+    """
+    time_window: Optional[float] = None
+    max_batch_size: Optional[int] = None
+    deadline_priority: int = 1
+    max_delay: float = float("inf")
+
+    def __post_init__(self):
+        if self.time_window is None and self.max_batch_size is None:
+            raise ValueError("Either time_window or max_batch_size is required.")
+        if self.time_window is not None and self.time_window < 0:
+            raise ValueError("time_window must be non-negative.")
+        if self.max_batch_size is not None and self.max_batch_size < 1:
+            raise ValueError("max_batch_size must be positive.")
+
+    def deadline_for(self, priority: int, arrival_time: float) -> Optional[float]:
+        """우선순위에 따른 마감 시각 (마감이 없으면 None)"""
+        if priority >= self.deadline_priority and self.max_delay != float("inf"):
+            return arrival_time + self.max_delay
+        return None
+
+
+@dataclass(frozen=True)
+class DualCommandReport:
+    """이중 명령 사이클 처리 결과와 단일 명령 처리 대비 비교"""
+    dual_command_cycles: int
+    single_command_cycles: int
+    operation_count: int
+    # 대기열 처리에 실제로 걸린 시간 (크레인 시계로 측정한 이동 + 입출고, 대기 제외)
+    elapsed_time: float
+    # 같은 요청을 모두 I/O 지점에서 출발하는 단일 명령으로 처리했을 때의 추정 시간
+    single_command_elapsed_time: float
+
+    @property
+    def cycles_per_hour(self) -> float:
+        cycles = self.dual_command_cycles + self.single_command_cycles
+        return cycles * 3600.0 / self.elapsed_time if self.elapsed_time > 0 else 0.0
+
+    @property
+    def single_command_cycles_per_hour(self) -> float:
+        return (self.operation_count * 3600.0 / self.single_command_elapsed_time
+                if self.single_command_elapsed_time > 0 else 0.0)
+
+    @property
+    def operations_per_hour(self) -> float:
+        return self.operation_count * 3600.0 / self.elapsed_time if self.elapsed_time > 0 else 0.0
+
+    @property
+    def time_saving_ratio(self) -> float:
+        """단일 명령 대비 절감된 시간 비율"""
+        if self.single_command_elapsed_time <= 0:
+            return 0.0
+        return 1.0 - self.elapsed_time / self.single_command_elapsed_time
@@ -0,0 +1,184 @@
+import heapq
+from typing import Callable, List, Optional, Sequence, Set, Union
+
+import numpy as np
+
+from .cell import Cell, CellObserver
+from .item import Item
+from .position import Position
+
+
+class FreeSlotIndex(CellObserver):
+    """
+    이동 비용 순으로 정렬된 가용 셀 색인
+
+    모든 셀을 이동 비용 순위(rank)로 정렬해 구역(zone, 연속된 순위 구간)으로 나누고,
+    구역마다 커서(cursor)와 최소 힙을 둡니다.
+
+    - 커서 앞의 순위는 이미 살펴본 구간으로, 그중 가용 셀은 힙에 들어 있습니다.
+    - 커서 뒤의 순위는 아직 살펴보지 않은 구간으로, 조회할 때 NumPy로 묶음 단위
+      검사하며 가득 찬 셀을 건너뛸 때만 커서가 앞으로 움직입니다.
+
+    따라서 힙에는 커서 앞에서 출고로 빈자리가 생긴 셀만 들어가며(가득 찬 셀은 조회할
+    때 꺼내 버림), 모든 가용 셀을 미리 만들지 않습니다. 정렬과 색인은 처음 조회할
+    때 만들어지므로 put_item_auto를 쓰지 않는 자동창고는 비용이 없습니다.
+
+    적재 수량은 OccupancyIndex의 counts 배열을 그대로 읽으므로, 관찰자 목록에서
+    OccupancyIndex 뒤에 등록해야 합니다.
+    """
+
+    _SCAN_CHUNK = 1 << 12  # 커서 뒤를 처음 검사하는 셀 수 (검사할 때마다 두 배, 최대 _MAX_SCAN_CHUNK)
+    _MAX_SCAN_CHUNK = 1 << 16
+
+    def __init__(self, costs: Union[np.ndarray, Callable[[], np.ndarray]], counts: np.ndarray, capacity: int):
+        """
+        Args:
+            costs: (x, y, z) 모양의 셀별 이동 비용 (또는 처음 조회할 때 호출할 생성 함수)
+            counts: (x, y, z) 모양의 셀별 적재 수량 (OccupancyIndex.counts)
+            capacity: 셀당 최대 아이템 수
+        """
+        self.shape = counts.shape
+        self.size = counts.size
+        self.counts = counts
+        self.capacity = capacity
+        self._costs = costs
+        self._flat_counts = counts.reshape(-1)
+        self.order: Optional[np.ndarray] = None  # 순위 -> 평탄화된 셀 번호 (처음 조회할 때 생성)
+        self.rank_of: Optional[np.ndarray] = None  # 셀 번호 -> 순위
+        self._heaps: List[List[int]] = []
+        self._cursors: List[int] = []
+        self._queued: Set[int] = set()  # 힙에 들어 있는 순위
+        self.set_zones((1.0,))
+
+    @staticmethod
+    def chebyshev_costs(max_x: int, max_y: int, max_z: int) -> np.ndarray:
+        """이동 시간 모델이 없을 때 쓰는 (0, 0, 0)으로부터의 체비쇼프 칸 거리"""
+        return np.maximum(np.maximum(np.arange(max_x)[:, None, None], np.arange(max_y)[None, :, None]),
+                          np.arange(max_z)[None, None, :]).astype(np.float64)
+
+    @property
+    def costs(self) -> np.ndarray:
+        """셀별 이동 비용"""
+        if callable(self._costs):
+            self._costs = self._costs()
+        return self._costs
+
+    @property
+    def built(self) -> bool:
+        """순위 색인이 만들어졌는지 여부"""
+        return self.order is not None
+
+    @property
+    def zone_count(self) -> int:
+        return len(self.zone_shares)
+
+    def set_zones(self, shares: Sequence[float]):
+        """
+        순위를 비율에 따라 가까운 구역부터 나눔 (커서와 힙은 처음부터 다시 시작)
+
+        Args:
+            shares: 구역별 셀 비율 (합이 1이 되도록 정규화됨)
+        """
+        array = np.asarray(shares, dtype=np.float64)
+        if array.size == 0 or (array < 0).any() or array.sum() <= 0:
+            raise ValueError("Zone shares must be non-negative and sum to a positive value.")
+        self.zone_shares = tuple(shares)
+        bounds = np.rint(np.cumsum(array) / array.sum() * self.size).astype(np.int64)
+        self.zone_bounds = np.concatenate(([0], bounds))
+        self.zone_bounds[-1] = self.size
+        self.rebuild()
+
+    def rebuild(self):
+        """적재 수량이 관찰자 통지 없이 바뀐 경우 커서와 힙을 처음부터 다시 시작"""
+        self._cursors = self.zone_bounds[:-1].tolist()
+        self._heaps = [[] for _ in self._cursors]
+        self._queued = set()
+
+    def _build(self):
+        if self.order is None:
+            self.order = np.argsort(self.costs.reshape(-1), kind="stable")
+            self.rank_of = np.empty_like(self.order)
+            self.rank_of[self.order] = np.arange(self.size)
+
+    def _zone_of_rank(self, rank: int) -> int:
+        return int(np.searchsorted(self.zone_bounds, rank, side="right")) - 1
+
+    def zone_of(self, position: Position) -> int:
+        """위치가 속한 구역 번호"""
+        self._build()
+        return self._zone_of_rank(int(self.rank_of[np.ravel_multi_index((position.x, position.y, position.z),
+                                                                         self.shape)]))
+
+    def on_item_added(self, cell: Cell, item: Item):
+        # 가득 찬 셀은 조회할 때 힙에서 꺼내 버리거나 커서가 건너뜀
+        pass
+
+    def on_item_removed(self, cell: Cell, item: Item):
+        if self.order is None:
+            return
+        position = cell.position
+        flat = (position.x * self.shape[1] + position.y) * self.shape[2] + position.z
+        rank = int(self.rank_of[flat])
+        zone = self._zone_of_rank(rank)
+        # 커서 뒤의 셀은 검사할 때 찾으므로 커서 앞의 셀만 힙에 넣음
+        if rank < self._cursors[zone] and rank not in self._queued:
+            self._queued.add(rank)
+            heapq.heappush(self._heaps[zone], rank)
+
+    def _scan(self, zone: int) -> Optional[int]:
+        """커서부터 구역 끝까지 처음으로 가용한 셀의 순위 (가득 찬 셀은 커서가 건너뜀)"""
+        cursor = self._cursors[zone]
+        end = int(self.zone_bounds[zone + 1])
+        chunk = self._SCAN_CHUNK
+        while cursor < end:
+            stop = min(cursor + chunk, end)
+            available = np.flatnonzero(self._flat_counts[self.order[cursor:stop]] < self.capacity)
+            if available.size:
+                cursor += int(available[0])
+                self._cursors[zone] = cursor
+                return cursor
+            cursor = stop
+            chunk = min(chunk * 2, self._MAX_SCAN_CHUNK)
+        self._cursors[zone] = end
+        return None
+
+    def _head(self, zone: int) -> Optional[int]:
+        """구역에서 가장 가까운 가용 셀의 순위"""
+        heap = self._heaps[zone]
+        while heap:
+            if self._flat_counts[self.order[heap[0]]] < self.capacity:
+                # 힙의 순위는 모두 커서 앞이므로 커서 뒤보다 가까움
+                return heap[0]
+            self._queued.discard(heapq.heappop(heap))
+        return self._scan(zone)
+
+    def nearest(self, zones: Optional[Sequence[int]] = None) -> Optional[Position]:
+        """
+        이동 비용이 가장 작은 가용 셀
+
+        Args:
+            zones: 찾을 구역 번호 목록 (생략하면 전체)
+
+        Returns:
+            가용 셀 위치 (없으면 None)
+        """
+        self._build()
+        if zones is None:
+            zones = range(len(self._heaps))
+        best = None
+        for zone in zones:
+            rank = self._head(zone)
+            if rank is not None and (best is None or rank < best):
+                best = rank
+        if best is None:
+            return None
+        x, y, z = np.unravel_index(int(self.order[best]), self.shape)
+        return Position(int(x), int(y), int(z))
+
+    def nearest_in_zone_order(self, zones: Sequence[int]) -> Optional[Position]:
+        """zones 순서대로 구역을 살펴 처음으로 가용 셀이 있는 구역의 가장 가까운 셀"""
+        for zone in zones:
+            position = self.nearest((zone,))
+            if position is not None:
+                return position
+        return None
@@ -0,0 +1,76 @@
+from typing import Iterable, Optional
+
+import numpy as np
+
+from .cell import Cell, CellObserver
+from .item import Item
+
+
+class InventoryTotals(CellObserver):
+    """
+    (x, y, z)로 색인되는 셀별 아이템 속성 합계 배열
+
+    아이템별 보관 비용(storage_cost), 부피, 무게의 셀별 합과 Entity가 없는 아이템
+    수를 입고/출고 때 갱신하므로, 속성 기반 보관유지비용은 셀을 훑지 않고 배열
+    합으로 계산됩니다.
+
+    배열은 activate를 호출할 때(속성 기반 정책에서 처음 사용할 때) 할당하며, 그
+    전의 입고/출고는 무시합니다.
+    """
+
+    def __init__(self, max_x: int, max_y: int, max_z: int):
+        self.shape = (max_x, max_y, max_z)
+        self.storage_costs: Optional[np.ndarray] = None
+        self.volumes: Optional[np.ndarray] = None
+        self.weights: Optional[np.ndarray] = None
+        self.unsized: Optional[np.ndarray] = None  # Entity가 없는 아이템 수
+
+    @property
+    def active(self) -> bool:
+        """배열이 할당되어 입고/출고를 반영하고 있는지"""
+        return self.storage_costs is not None
+
+    def activate(self, cells: Iterable[Cell]):
+        """
+        배열을 할당하고 이미 들어 있는 아이템으로 채움 (이미 할당했으면 변화 없음)
+
+        Args:
+            cells: 아이템이 있을 수 있는 모든 셀
+        """
+        if self.active:
+            return
+        self.storage_costs = np.zeros(self.shape, dtype=np.float64)
+        self.volumes = np.zeros(self.shape, dtype=np.float64)
+        self.weights = np.zeros(self.shape, dtype=np.float64)
+        self.unsized = np.zeros(self.shape, dtype=np.int64)
+        for cell in cells:
+            for item in cell.items_view():
+                self._apply(cell, item, 1)
+
+    def _apply(self, cell: Cell, item: Item, sign: int):
+        index = (cell.position.x, cell.position.y, cell.position.z)
+        self.storage_costs[index] += sign * item.storage_cost
+        entity = item.entity
+        if entity is None:
+            self.unsized[index] += sign
+        else:
+            self.volumes[index] += sign * entity.width * entity.length * entity.height
+            self.weights[index] += sign * entity.weight
+
+    def on_item_added(self, cell: Cell, item: Item):
+        if self.storage_costs is not None:
+            self._apply(cell, item, 1)
+
+    def on_item_removed(self, cell: Cell, item: Item):
+        if self.storage_costs is not None:
+            self._apply(cell, item, -1)
+
+    def load_columns(self, flat_indices: np.ndarray, storage_costs: np.ndarray, volumes: np.ndarray,
+                     weights: np.ndarray, unsized: np.ndarray):
+        """관찰자 통지 없이 한꺼번에 들어온 아이템별 속성을 반영 (스냅샷 복원용, 할당 전이면 무시)"""
+        if not self.active:
+            return
+        np.add.at(self.storage_costs.reshape(-1), flat_indices, storage_costs)
+        np.add.at(self.volumes.reshape(-1), flat_indices, volumes)
+        np.add.at(self.weights.reshape(-1), flat_indices, weights)
+        np.add.at(self.unsized.reshape(-1), flat_indices, unsized.astype(np.int64))
@@ -1,12 +1,47 @@
+import sys
+import time
 from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from ..entity.Entity import Entity
 
 
 class Item:
     """창고에 저장되는 개체를 나타내는 클래스"""
 
-    def __init__(self, id: str, name: str, priority: int = 0, storage_cost: float = 0.01):
-        self.id = id
-        self.name = name
+    __slots__ = ("id", "name", "priority", "storage_cost", "created_time", "stored_time", "entity")
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        priority: int = 0,
+        storage_cost: float = 0.01,
+        created_time: Optional[float] = None,
+        entity: Optional["Entity"] = None
+    ):
+        """
+        Args:
+            id: 아이템 ID (같은 문자열은 intern 되어 공유됨)
+            name: 아이템 이름
+            priority: 출고 우선순위
+            storage_cost: 보관 비용
+            created_time: 생성 시각 (초). 생략하면 time.time(), 시뮬레이션에서는 가상 시계 시각을 전달
+            entity: 크기/무게 정보 (부피/무게 기반 보관유지비용에 사용)
+        """
+        self.id = sys.intern(id) if type(id) is str else id
+        self.name = sys.intern(name) if type(name) is str else name
         self.priority = priority
         self.storage_cost = storage_cost  # 보관 비용
-        self.created_at = datetime.now()
+        self.created_time = time.time() if created_time is None else created_time
+        self.stored_time: Optional[float] = None  # 셀에 들어간 시뮬레이션 시각 (보관 중이 아니면 None)
+        self.entity = entity
+
+    @property
+    def created_at(self) -> datetime:
+        """생성 시각 (created_time을 epoch 기준 초로 해석)"""
+        return datetime.fromtimestamp(self.created_time)
+
+    def __repr__(self) -> str:
+        return f"Item(id={self.id!r}, name={self.name!r}, priority={self.priority})"
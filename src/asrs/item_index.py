@@ -0,0 +1,99 @@
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+from .cell import Cell, CellObserver
+from .item import Item
+from .position import Position
+
+if TYPE_CHECKING:
+    from .snapshot import SnapshotInventory
+
+
+class ItemIndex(CellObserver):
+    """
+    아이템 ID -> 위치 역색인
+
+    셀에서 아이템이 추가/제거될 때마다 갱신되며, 위치별로 같은 ID의
+    아이템 개수를 함께 보관해 마지막 아이템이 빠질 때만 위치를 제거합니다.
+    """
+
+    def __init__(self):
+        self._positions: Dict[str, Dict[Position, int]] = {}
+        # 복원 재고 (ID별 위치는 처음 필요할 때 가져옴)
+        self._snapshot: Optional["SnapshotInventory"] = None
+        self._loaded_ids: Set[str] = set()
+
+    def attach_snapshot(self, inventory: "SnapshotInventory"):
+        """복원한 재고 연결"""
+        self._snapshot = inventory
+        self._loaded_ids = set()
+
+    def _ensure(self, item_id: str):
+        if item_id in self._loaded_ids:
+            return
+        self._loaded_ids.add(item_id)
+        baseline = self._snapshot.positions_of(item_id)
+        if baseline:
+            counts = self._positions.setdefault(item_id, {})
+            for position, count in baseline.items():
+                counts[position] = counts.get(position, 0) + count
+
+    def _load_all(self):
+        if self._snapshot is None:
+            return
+        for item_id in self._snapshot.ids:
+            self._ensure(item_id)
+        self._snapshot = None
+        self._loaded_ids = set()
+
+    def detach_snapshot(self):
+        """연결된 복원 재고의 위치를 모두 색인으로 읽어 들이고 연결을 끊음"""
+        self._load_all()
+
+    def on_item_added(self, cell: Cell, item: Item):
+        if self._snapshot is not None:
+            self._ensure(item.id)
+        counts = self._positions.get(item.id)
+        if counts is None:
+            counts = self._positions[item.id] = {}
+        counts[cell.position] = counts.get(cell.position, 0) + 1
+
+    def on_item_removed(self, cell: Cell, item: Item):
+        if self._snapshot is not None:
+            self._ensure(item.id)
+        counts = self._positions.get(item.id)
+        if counts is None:
+            return
+        remaining = counts.get(cell.position, 0) - 1
+        if remaining > 0:
+            counts[cell.position] = remaining
+            return
+        counts.pop(cell.position, None)
+        if not counts:
+            del self._positions[item.id]
+
+    def positions(self, item_id: str) -> List[Position]:
+        """아이템 ID가 저장된 모든 위치 반환"""
+        if self._snapshot is not None:
+            self._ensure(item_id)
+        counts = self._positions.get(item_id)
+        if counts is None:
+            return []
+        return list(counts)
+
+    def count_at(self, item_id: str, position: Position) -> int:
+        """특정 위치에 저장된 해당 ID의 아이템 개수"""
+        if self._snapshot is not None:
+            self._ensure(item_id)
+        counts = self._positions.get(item_id)
+        if counts is None:
+            return 0
+        return counts.get(position, 0)
+
+    def __contains__(self, item_id: object) -> bool:
+        if self._snapshot is not None and isinstance(item_id, str):
+            self._ensure(item_id)
+        return item_id in self._positions
+
+    def __len__(self) -> int:
+        self._load_all()
+        return len(self._positions)
@@ -0,0 +1,84 @@
+from typing import List
+
+import numpy as np
+
+from .cell import Cell, CellObserver
+from .item import Item
+from .position import Position
+
+
+class OccupancyIndex(CellObserver):
+    """
+    (x, y, z)로 색인되는 셀별 적재 수량 배열
+
+    셀에서 아이템이 추가/제거될 때마다 갱신되며, 빈 셀/가용 셀 조회를
+    NumPy 마스크 연산으로 처리합니다. 통로(aisle)는 x 좌표 단위로 구분합니다.
+    """
+
+    _SCAN_CHUNK = 1 << 16  # first_free_slots가 한 번에 검사하는 셀 수
+
+    def __init__(self, max_x: int, max_y: int, max_z: int):
+        self.counts = np.zeros((max_x, max_y, max_z), dtype=np.uint32)
+
+    def on_item_added(self, cell: Cell, item: Item):
+        position = cell.position
+        self.counts[position.x, position.y, position.z] += 1
+
+    def on_item_removed(self, cell: Cell, item: Item):
+        position = cell.position
+        self.counts[position.x, position.y, position.z] -= 1
+
+    def load_counts(self, flat_indices: np.ndarray, counts: np.ndarray):
+        """관찰자 통지 없이 한꺼번에 들어온 아이템 수를 반영 (스냅샷 복원용)"""
+        np.add.at(self.counts.reshape(-1), flat_indices, counts.astype(np.uint32))
+
+    @staticmethod
+    def _to_positions(coordinates: np.ndarray) -> List[Position]:
+        return [Position(x, y, z) for x, y, z in coordinates.tolist()]
+
+    def _unravel(self, flat_indices: np.ndarray) -> List[Position]:
+        return self._to_positions(np.column_stack(np.unravel_index(flat_indices, self.counts.shape)))
+
+    def count_at(self, position: Position) -> int:
+        """해당 위치의 아이템 개수"""
+        return int(self.counts[position.x, position.y, position.z])
+
+    def empty_mask(self) -> np.ndarray:
+        """빈 셀 마스크"""
+        return self.counts == 0
+
+    def available_mask(self, capacity: int) -> np.ndarray:
+        """용량이 남은 셀 마스크"""
+        return self.counts < capacity
+
+    def empty_positions(self) -> List[Position]:
+        """빈 셀들의 위치를 (x, y, z) 순서로 반환"""
+        return self._to_positions(np.argwhere(self.empty_mask()))
+
+    def available_positions(self, capacity: int) -> List[Position]:
+        """용량이 남은 셀들의 위치를 (x, y, z) 순서로 반환"""
+        return self._to_positions(np.argwhere(self.available_mask(capacity)))
+
+    def first_free_slots(self, n: int, capacity: int) -> List[Position]:
+        """(x, y, z) 순서로 앞에서부터 용량이 남은 셀 n개 반환"""
+        flat_counts = self.counts.reshape(-1)
+        found = []
+        remaining = n
+        for start in range(0, flat_counts.size, self._SCAN_CHUNK):
+            if remaining <= 0:
+                break
+            chunk = np.flatnonzero(flat_counts[start:start + self._SCAN_CHUNK] < capacity)[:remaining]
+            found.append(chunk + start)
+            remaining -= chunk.size
+        if not found:
+            return []
+        return self._unravel(np.concatenate(found))
+
+    def free_slots_in_layer(self, z: int, capacity: int) -> List[Position]:
+        """z 층에서 용량이 남은 셀들의 위치 반환"""
+        xy = np.argwhere(self.counts[:, :, z] < capacity)
+        return [Position(x, y, z) for x, y in xy.tolist()]
+
+    def free_count_per_aisle(self, capacity: int) -> np.ndarray:
+        """통로(x)별 용량이 남은 셀 개수"""
+        return np.count_nonzero(self.counts < capacity, axis=(1, 2))
@@ -0,0 +1,253 @@
+import os
+import struct
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+import msgpack
+
+from ..entity.Entity import Entity
+from .item import Item
+from .operation_record import OperationRecord, OperationType
+from .position import Position
+
+if TYPE_CHECKING:
+    from .asrs import ASRS
+
+MAGIC = b"ASRSJRNL"
+FORMAT_VERSION = 2
+_FILE_HEADER = struct.Struct("<8sH")
+# 작업 종류, x, y, z, 시작 시각, 종료 시각, 우선순위, 보관 비용, 생성 시각, Entity 번호(-1: 없음), ID 길이, 이름 길이
+_RECORD = struct.Struct("<BiiiddqddiHH")
+# Entity 정의 레코드: 종류, Entity 번호, msgpack 길이 (뒤에 msgpack으로 직렬화한 Entity 필드)
+_ENTITY_RECORD = struct.Struct("<BiI")
+_OPERATION_CODES = {OperationType.PUT: 0, OperationType.GET: 1}
+_OPERATIONS = {code: operation for operation, code in _OPERATION_CODES.items()}
+_ENTITY_CODE = 2
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    """저널에 기록된 작업 한 건 (입고는 아이템 전체 정보, 출고는 아이템 ID만)"""
+    operation: OperationType
+    position: Position
+    start_time: float
+    finish_time: float
+    item_id: str
+    name: str = ""
+    priority: int = 0
+    storage_cost: float = 0.0
+    created_time: float = 0.0
+    entity: Optional[Entity] = None
+
+    def to_record(self) -> OperationRecord:
+        return OperationRecord(self.operation, self.item_id, self.position, self.start_time, self.finish_time)
+
+    def to_item(self) -> Item:
+        return Item(self.item_id, self.name, self.priority, self.storage_cost, self.created_time, entity=self.entity)
+
+
+class OperationJournal:
+    """
+    입고/출고 작업의 추가 전용(append-only) 바이너리 저널
+
+    작업은 메모리 버퍼에 모아 group_size건마다 한 번에 파일에 쓰고(group commit),
+    fsync는 마지막 fsync 후 fsync_interval초가 지난 쓰기에서만 호출합니다.
+    fsync_interval이 0이면 쓸 때마다, None이면 fsync 없이 운영체제에 맡깁니다.
+
+    입고 아이템의 Entity는 처음 나올 때 Entity 정의 레코드로 한 번 기록하고 이후
+    작업은 번호로 가리킵니다. 번호는 저널을 열 때마다 새로 매기며, 읽을 때는 가장
+    최근 정의를 사용합니다.
+    """
+
+    def __init__(self, path: str, group_size: int = 1024, fsync_interval: Optional[float] = 1.0):
+        """
+        Args:
+            path: 저널 파일 경로 (이미 있으면 이어서 기록)
+            group_size: 한 번에 파일에 쓰는 작업 수
+            fsync_interval: fsync 최소 간격 (초, 실제 시간)
+
+        Raises:
+            ValueError: group_size가 1보다 작거나 기존 파일이 저널이 아닌 경우 발생합니다.
+        """
+        if group_size < 1:
+            raise ValueError("group_size must be positive.")
+        self.path = path
+        self.group_size = group_size
+        self.fsync_interval = fsync_interval
+        self._buffer = bytearray()
+        self._pending = 0
+        self.record_count = 0
+        self.flush_count = 0
+        self.fsync_count = 0
+        self._last_fsync = time.monotonic()
+        # id(Entity) -> (번호, Entity) (객체가 살아 있는 동안 id가 재사용되지 않도록 참조 유지)
+        self._entity_codes: Dict[int, Tuple[int, Entity]] = {}
+
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            _check_header(path)
+        self._file = open(path, "ab")
+        if not exists:
+            self._file.write(_FILE_HEADER.pack(MAGIC, FORMAT_VERSION))
+
+    def record(self, operation: OperationType, item: Item, position: Position, start_time: float,
+               finish_time: float):
+        """작업 한 건을 버퍼에 기록 (group_size건이 모이면 파일에 씀)"""
+        item_id = item.id.encode("utf-8")
+        name = item.name.encode("utf-8") if operation == OperationType.PUT else b""
+        entity_code = -1
+        if operation == OperationType.PUT and item.entity is not None:
+            entity_code = self._entity_code(item.entity)
+        self._buffer += _RECORD.pack(
+            _OPERATION_CODES[operation], position.x, position.y, position.z, start_time, finish_time,
+            item.priority, item.storage_cost, item.created_time, entity_code, len(item_id), len(name))
+        self._buffer += item_id
+        self._buffer += name
+        self._pending += 1
+        self.record_count += 1
+        if self._pending >= self.group_size:
+            self.flush()
+
+    def _entity_code(self, entity: Entity) -> int:
+        known = self._entity_codes.get(id(entity))
+        if known is not None:
+            return known[0]
+        code = len(self._entity_codes)
+        self._entity_codes[id(entity)] = (code, entity)
+        payload = msgpack.packb(asdict(entity))
+        self._buffer += _ENTITY_RECORD.pack(_ENTITY_CODE, code, len(payload))
+        self._buffer += payload
+        return code
+
+    def flush(self, fsync: bool = False):
+        """
+        버퍼의 작업을 파일에 씀
+
+        Args:
+            fsync: True면 fsync_interval과 관계없이 fsync
+        """
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+            self._pending = 0
+            self.flush_count += 1
+        self._file.flush()
+        now = time.monotonic()
+        if fsync or (self.fsync_interval is not None and now - self._last_fsync >= self.fsync_interval):
+            os.fsync(self._file.fileno())
+            self.fsync_count += 1
+            self._last_fsync = now
+
+    def close(self):
+        """남은 작업을 쓰고 fsync 후 파일을 닫음"""
+        if self._file.closed:
+            return
+        self.flush(fsync=self.fsync_interval is not None)
+        self._file.close()
+
+    def __enter__(self) -> "OperationJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def read(path: str, until: Optional[float] = None) -> Iterator[JournalEntry]:
+        """
+        저널의 작업을 기록 순서대로 읽음
+
+        마지막 작업이 쓰다 만 상태(비정상 종료)면 그 작업은 건너뜁니다.
+
+        Args:
+            until: 이 시각 이후에 끝난 작업은 건너뜀 (시뮬레이션 시각). 크레인이 여럿이면
+                기록 순서와 종료 시각 순서가 다를 수 있으므로 끝까지 읽어 걸러냅니다.
+        """
+        _check_header(path)
+        with open(path, "rb") as file:
+            data = file.read()
+        entities: Dict[int, Entity] = {}
+        offset = _FILE_HEADER.size
+        while offset < len(data):
+            if data[offset] == _ENTITY_CODE:
+                if offset + _ENTITY_RECORD.size > len(data):
+                    return
+                _, entity_code, length = _ENTITY_RECORD.unpack_from(data, offset)
+                body = offset + _ENTITY_RECORD.size
+                if body + length > len(data):
+                    return
+                entities[entity_code] = Entity(**msgpack.unpackb(data[body:body + length]))
+                offset = body + length
+                continue
+            if offset + _RECORD.size > len(data):
+                return
+            (code, x, y, z, start_time, finish_time, priority, storage_cost, created_time, entity_code,
+             id_length, name_length) = _RECORD.unpack_from(data, offset)
+            body = offset + _RECORD.size
+            end = body + id_length + name_length
+            if end > len(data):
+                return
+            offset = end
+            if until is not None and finish_time > until:
+                continue
+            yield JournalEntry(
+                _OPERATIONS[code], Position(x, y, z), start_time, finish_time,
+                data[body:body + id_length].decode("utf-8"), data[body + id_length:end].decode("utf-8"),
+                priority, storage_cost, created_time, entities.get(entity_code) if entity_code >= 0 else None)
+
+    @classmethod
+    def replay(cls, path: str, asrs: "ASRS", until: Optional[float] = None) -> int:
+        """
+        저널을 자동창고에 다시 적용해 until 시각까지의 상태를 복원
+
+        연속된 입고는 묶어서 일괄 입고 경로로, 연속된 출고는 기록된 아이템을 ID로
+        꺼내는 경로로 적용하며(재적용하는 자동창고의 출고 정책과 무관), 작업 시간
+        지연 없이 입고는 기록된 종료 시각, 출고는 시작 시각에 반영하므로 보관 시간
+        누적 비용도 원래 실행과 같습니다 (시계는 되돌리지 않으므로 크레인이 여럿이라
+        기록 순서와 시각 순서가 다르면 앞선 시각의 작업은 그때까지의 최근 시각에
+        반영됩니다). 운영 기록(operation_log)에는 저널의 작업이 그대로 추가됩니다.
+
+        Args:
+            path: 저널 파일 경로
+            asrs: 작업을 적용할 자동창고 (보통 새로 만든 자동창고)
+            until: 이 시각까지 끝난 작업만 적용
+
+        Returns:
+            적용한 작업 수
+        """
+        applied = 0
+        run: List[JournalEntry] = []
+        for entry in cls.read(path, until):
+            if run and run[0].operation != entry.operation:
+                applied += _apply_run(asrs, run)
+                run = []
+            run.append(entry)
+        if run:
+            applied += _apply_run(asrs, run)
+        return applied
+
+
+def _check_header(path: str):
+    with open(path, "rb") as file:
+        header = file.read(_FILE_HEADER.size)
+    if len(header) != _FILE_HEADER.size:
+        raise ValueError("Not an ASRS journal file.")
+    magic, version = _FILE_HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError("Not an ASRS journal file.")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported journal version: {version}")
+
+
+def _apply_run(asrs: "ASRS", run: List[JournalEntry]) -> int:
+    # 원래 작업과 같이 입고는 종료 시각, 출고는 시작 시각에 셀에 반영 (보관 시간 누적 비용)
+    if run[0].operation == OperationType.PUT:
+        pairs: List[Tuple[Item, Position]] = [(entry.to_item(), entry.position) for entry in run]
+        asrs.insert_items(pairs, [entry.finish_time for entry in run])
+    else:
+        for entry in run:
+            asrs.clock.advance_to(entry.start_time)
+            asrs.remove_items_by_id([(entry.position, entry.to_item())])
+    asrs.operation_log.extend(entry.to_record() for entry in run)
+    asrs.clock.advance_to(run[-1].finish_time)
+    return len(run)
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from enum import Enum
+
+from .position import Position
+
+
+class OperationType(Enum):
+    """작업 종류를 나타내는 열거형"""
+    PUT = "PUT"
+    GET = "GET"
+
+
+@dataclass(slots=True)
+class OperationRecord:
+    """입출고 작업 한 건의 시뮬레이션 시각 기록"""
+    operation: OperationType
+    item_id: str
+    position: Position
+    start_time: float
+    finish_time: float
@@ -1,18 +1,58 @@
+from typing import ClassVar, Dict, Tuple
+
+
 class Position:
-    """x,y,z 좌표를 나타내는 클래스"""
+    """
+    x,y,z 좌표를 나타내는 클래스
+
+    좌표마다 인스턴스가 하나만 만들어지는 불변(flyweight) 객체입니다.
+    같은 좌표로 생성하면 캐시된 인스턴스가 반환됩니다.
+    """
+
+    __slots__ = ("x", "y", "z", "_hash")
+
+    _cache: ClassVar[Dict[Tuple[int, int, int], "Position"]] = {}
+
+    def __new__(cls, x: int, y: int, z: int):
+        key = (x, y, z)
+        position = cls._cache.get(key)
+        if position is None:
+            position = object.__new__(cls)
+            object.__setattr__(position, "x", x)
+            object.__setattr__(position, "y", y)
+            object.__setattr__(position, "z", z)
+            object.__setattr__(position, "_hash", hash(key))
+            cls._cache[key] = position
+        return position
+
+    @classmethod
+    def cache_size(cls) -> int:
+        """캐시된 좌표 인스턴스 수"""
+        return len(cls._cache)
+
+    @classmethod
+    def clear_cache(cls):
+        """좌표 캐시 비우기 (이미 만들어진 인스턴스는 그대로 유효)"""
+        cls._cache.clear()
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Position is immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError("Position is immutable.")
 
-    def __init__(self, x: int, y: int, z: int):
-        self.x = x
-        self.y = y
-        self.z = z
+    def __reduce__(self):
+        return Position, (self.x, self.y, self.z)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Position):
             return False
         return self.x == other.x and self.y == other.y and self.z == other.z
 
     def __hash__(self):
-        return hash((self.x, self.y, self.z))
+        return self._hash
 
     def __repr__(self):
         return f"Position({self.x}, {self.y}, {self.z})"
@@ -0,0 +1,166 @@
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .item import Item
+from .operation_record import OperationType
+from .position import Position
+
+if TYPE_CHECKING:
+    from .asrs import ASRS
+
+
+class SlottingPolicy(Enum):
+    """입고 위치 지정(slotting) 정책"""
+    CLOSEST_OPEN = "closest_open"
+    RANDOM = "random"
+    CLASS_BASED = "class_based"
+    PRIORITY_ZONED = "priority_zoned"
+
+
+class SlottingStrategy(ABC):
+    """입고 위치 지정 전략을 위한 추상 클래스"""
+
+    # FreeSlotIndex의 구역별 셀 비율 (가까운 구역부터)
+    zone_shares: Tuple[float, ...] = (1.0,)
+
+    @abstractmethod
+    def select_position(self, context: "ASRS", item: Item) -> Optional[Position]:
+        pass
+
+
+class ClosestOpenStrategy(SlottingStrategy):
+    """I/O 지점에서 이동 비용이 가장 작은 가용 셀"""
+
+    def select_position(self, context: "ASRS", item: Item) -> Optional[Position]:
+        return context.free_slots.nearest()
+
+
+class RandomStrategy(SlottingStrategy):
+    """
+    가용 셀 중 무작위 선택
+
+    무작위로 뽑은 셀이 가득 차 있으면 다시 뽑고, max_attempts번 실패하면
+    가용 셀 전체에서 고릅니다.
+    """
+
+    def __init__(self, seed: Optional[int] = None, max_attempts: int = 64):
+        self.rng = np.random.default_rng(seed)
+        self.max_attempts = max_attempts
+
+    def select_position(self, context: "ASRS", item: Item) -> Optional[Position]:
+        flat_counts = context.occupancy.counts.reshape(-1)
+        capacity = context.max_items_per_cell
+        for flat in self.rng.integers(flat_counts.size, size=self.max_attempts).tolist():
+            if flat_counts[flat] < capacity:
+                break
+        else:
+            available = np.flatnonzero(flat_counts < capacity)
+            if available.size == 0:
+                return None
+            flat = int(available[self.rng.integers(available.size)])
+        x, y, z = np.unravel_index(flat, context.occupancy.counts.shape)
+        return Position(int(x), int(y), int(z))
+
+
+class ClassBasedStrategy(SlottingStrategy):
+    """
+    회전율 기반 ABC 등급 지정
+
+    가까운 셀부터 A/B/C 구역으로 나누고, 출고 횟수가 많은 아이템일수록 가까운
+    구역에 둡니다. 출고 횟수는 운영 기록에서 reclassify_every번의 출고마다 다시
+    집계하며, 기록이 없는 아이템은 가장 먼 등급입니다. 배정된 구역이 가득 차면
+    더 먼 구역, 그다음 더 가까운 구역 순서로 찾습니다.
+    """
+
+    def __init__(self, class_shares: Sequence[float] = (0.2, 0.3, 0.5), reclassify_every: int = 100):
+        """
+        Args:
+            class_shares: 등급별 아이템/셀 비율 (A등급부터)
+            reclassify_every: 등급을 다시 계산하는 출고 횟수 간격
+        """
+        self.zone_shares = tuple(class_shares)
+        self.reclassify_every = reclassify_every
+        self.retrievals: Dict[str, int] = {}
+        self.assigned_classes: Dict[str, int] = {}
+        self._classes: Dict[str, int] = {}
+        self._log_cursor = 0
+        self._pending_retrievals = 0
+
+    def assign_class(self, item_id: str, item_class: int):
+        """아이템 등급을 직접 지정 (0이 A등급)"""
+        self.assigned_classes[item_id] = item_class
+
+    def _collect_retrievals(self, operation_log: List):
+        for record in operation_log[self._log_cursor:]:
+            if record.operation == OperationType.GET:
+                self.retrievals[record.item_id] = self.retrievals.get(record.item_id, 0) + 1
+                self._pending_retrievals += 1
+        self._log_cursor = len(operation_log)
+
+    def reclassify(self):
+        """출고 횟수 순위로 등급 재계산"""
+        ranked = sorted(self.retrievals, key=self.retrievals.get, reverse=True)
+        bounds = np.rint(np.cumsum(self.zone_shares) / sum(self.zone_shares) * len(ranked)).astype(int).tolist()
+        self._classes = {}
+        start = 0
+        for item_class, end in enumerate(bounds):
+            for item_id in ranked[start:end]:
+                self._classes[item_id] = item_class
+            start = end
+        self._pending_retrievals = 0
+
+    def classify(self, context: "ASRS", item: Item) -> int:
+        """아이템의 등급 (0이 A등급)"""
+        if item.id in self.assigned_classes:
+            return self.assigned_classes[item.id]
+        if len(context.operation_log) < self._log_cursor:
+            # 운영 기록이 비워진 경우 처음부터 다시 집계
+            self._log_cursor = 0
+        self._collect_retrievals(context.operation_log)
+        if self._pending_retrievals >= self.reclassify_every or (self.retrievals and not self._classes):
+            self.reclassify()
+        return self._classes.get(item.id, len(self.zone_shares) - 1)
+
+    def select_position(self, context: "ASRS", item: Item) -> Optional[Position]:
+        item_class = min(self.classify(context, item), len(self.zone_shares) - 1)
+        zone_count = len(self.zone_shares)
+        zones = list(range(item_class, zone_count)) + list(range(item_class - 1, -1, -1))
+        return context.free_slots.nearest_in_zone_order(zones)
+
+
+class PriorityZonedStrategy(SlottingStrategy):
+    """
+    우선순위 구역 지정
+
+    우선순위가 thresholds[i] 이상인 첫 번째 i 구역에 두고, 어느 기준에도 못
+    미치면 가장 먼 구역에 둡니다. 구역이 가득 차면 더 먼 구역, 그다음 더 가까운
+    구역 순서로 찾습니다.
+    """
+
+    def __init__(self, thresholds: Sequence[int] = (2, 1), zone_shares: Optional[Sequence[float]] = None):
+        """
+        Args:
+            thresholds: 구역별 최소 우선순위 (가까운 구역부터, 내림차순)
+            zone_shares: 구역별 셀 비율 (생략하면 균등, 구역 수는 len(thresholds) + 1)
+        """
+        self.thresholds = tuple(thresholds)
+        zone_count = len(self.thresholds) + 1
+        if zone_shares is None:
+            zone_shares = (1.0,) * zone_count
+        if len(zone_shares) != zone_count:
+            raise ValueError("zone_shares must have one more entry than thresholds.")
+        self.zone_shares = tuple(zone_shares)
+
+    def zone_for(self, item: Item) -> int:
+        for zone, threshold in enumerate(self.thresholds):
+            if item.priority >= threshold:
+                return zone
+        return len(self.thresholds)
+
+    def select_position(self, context: "ASRS", item: Item) -> Optional[Position]:
+        zone = self.zone_for(item)
+        zones = list(range(zone, len(self.zone_shares))) + list(range(zone - 1, -1, -1))
+        return context.free_slots.nearest_in_zone_order(zones)
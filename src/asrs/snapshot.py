@@ -0,0 +1,266 @@
+import os
+import struct
+import sys
+from bisect import bisect_left
+from collections.abc import Sequence
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import msgpack
+import numpy as np
+
+from .item import Item
+from .position import Position
+
+if TYPE_CHECKING:
+    from ..entity.Entity import Entity
+
+MAGIC = b"ASRSSNAP"
+FORMAT_VERSION = 1
+_ALIGNMENT = 64  # 배열 페이로드 정렬 단위 (바이트)
+_PREFIX = struct.Struct("<8sQ")  # 매직 넘버, msgpack 헤더 길이
+
+
+def _aligned(size: int) -> int:
+    return (size + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def write_snapshot(path: str, header: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+    """
+    스냅샷 파일 쓰기
+
+    파일은 매직 넘버, msgpack 헤더, 64바이트 단위로 정렬된 연속 배열 페이로드
+    순서로 구성되므로 읽을 때 배열을 복사 없이 메모리 맵으로 사용할 수 있습니다.
+
+    같은 디렉터리의 임시 파일에 모두 쓴 뒤 os.replace로 교체하므로, 기존 파일을
+    메모리 맵으로 읽고 있는 쪽은 쓰는 도중에도 이전 내용을 그대로 봅니다.
+
+    Args:
+        path: 파일 경로
+        header: msgpack으로 직렬화할 메타데이터
+        arrays: 이름 -> NumPy 배열 (object dtype 제외)
+    """
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    layout = []
+    offset = 0
+    for name, array in arrays.items():
+        layout.append({"name": name, "dtype": array.dtype.str, "shape": list(array.shape), "offset": offset})
+        offset = _aligned(offset + array.nbytes)
+    header_bytes = msgpack.packb({"version": FORMAT_VERSION, "header": header, "arrays": layout})
+    payload_start = _aligned(_PREFIX.size + len(header_bytes))
+
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as file:
+            file.write(_PREFIX.pack(MAGIC, len(header_bytes)))
+            file.write(header_bytes)
+            for entry, array in zip(layout, arrays.values()):
+                file.write(b"\0" * (payload_start + entry["offset"] - file.tell()))
+                file.write(memoryview(array).cast("B") if array.size else b"")
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def read_snapshot(path: str, mmap: bool = True) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    스냅샷 파일 읽기
+
+    Args:
+        path: 파일 경로
+        mmap: True면 배열을 읽기 전용 메모리 맵으로 반환 (필요한 부분만 디스크에서 읽음)
+
+    Returns:
+        (헤더, 이름 -> 배열)
+
+    Raises:
+        ValueError: 스냅샷 파일이 아니거나 지원하지 않는 버전인 경우 발생합니다.
+    """
+    with open(path, "rb") as file:
+        prefix = file.read(_PREFIX.size)
+        if len(prefix) != _PREFIX.size:
+            raise ValueError("Not an ASRS snapshot file.")
+        magic, header_length = _PREFIX.unpack(prefix)
+        if magic != MAGIC:
+            raise ValueError("Not an ASRS snapshot file.")
+        meta = msgpack.unpackb(file.read(header_length))
+    if meta["version"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {meta['version']}")
+
+    payload_start = _aligned(_PREFIX.size + header_length)
+    buffer = np.memmap(path, dtype=np.uint8, mode="r") if mmap else np.fromfile(path, dtype=np.uint8)
+    arrays = {}
+    for entry in meta["arrays"]:
+        dtype = np.dtype(entry["dtype"])
+        start = payload_start + entry["offset"]
+        size = int(np.prod(entry["shape"], dtype=np.int64)) * dtype.itemsize
+        arrays[entry["name"]] = buffer[start:start + size].view(dtype).reshape(entry["shape"])
+    return meta["header"], arrays
+
+
+def encode_strings(strings: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """문자열 목록을 UTF-8 바이트 배열과 (개수 + 1) 길이의 오프셋 배열로 변환"""
+    encoded = [string.encode("utf-8") for string in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(data) for data in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+class StringTable(Sequence):
+    """
+    encode_strings로 만든 문자열 표 (필요한 항목만 디코딩)
+
+    스냅샷은 문자열을 정렬해 저장하므로 index는 이진 탐색입니다.
+    """
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray):
+        self._data = data
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        start, end = int(self._offsets[index]), int(self._offsets[index + 1])
+        return sys.intern(self._data[start:end].tobytes().decode("utf-8"))
+
+    def index(self, value: str, start: int = 0, stop: Optional[int] = None) -> int:
+        position = bisect_left(self, value)
+        if position < len(self) and self[position] == value:
+            return position
+        raise ValueError(f"{value!r} is not in the table")
+
+
+class SnapshotInventory:
+    """
+    스냅샷 파일의 재고 컬럼
+
+    아이템은 셀 번호 순, 셀 안에서는 입고 순으로 저장되어 있습니다. 복원된
+    자동창고는 셀과 아이템 ID 색인을 처음 접근할 때 여기서 꺼내 만듭니다.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray], shape: Tuple[int, int, int],
+                 entities: Sequence["Entity"] = ()):
+        self.shape = shape
+        self.cells = arrays["cells"]  # 아이템이 있는 셀 번호 (오름차순)
+        self.cell_offsets = arrays["cell_offsets"]
+        self.item_cells = arrays["item_cells"]
+        self.id_codes = arrays["id_codes"]
+        self.name_codes = arrays["name_codes"]
+        self.priorities = arrays["priorities"]
+        self.storage_costs = arrays["storage_costs"]
+        self.created_times = arrays["created_times"]
+        self.stored_times = arrays["stored_times"]
+        self.entity_codes = arrays["entity_codes"]  # entities 번호 (-1: Entity 없음)
+        self.entities = list(entities)
+        # 아이템 ID 코드 순으로 정렬한 아이템 번호와 ID별 시작 위치
+        self.id_order = arrays["id_order"]
+        self.id_offsets = arrays["id_offsets"]
+        self.ids = StringTable(arrays["id_data"], arrays["id_string_offsets"])
+        self.names = StringTable(arrays["name_data"], arrays["name_string_offsets"])
+
+    def __len__(self) -> int:
+        return len(self.item_cells)
+
+    def cell_counts(self) -> np.ndarray:
+        """cells 순서의 셀별 아이템 수"""
+        return np.diff(self.cell_offsets)
+
+    def entity_columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """아이템별 (부피, 무게, Entity 없음 여부) 배열"""
+        table = np.array([[entity.width * entity.length * entity.height, entity.weight]
+                          for entity in self.entities], dtype=np.float64).reshape(-1, 2)
+        codes = self.entity_codes
+        sized = codes >= 0
+        values = np.zeros((len(codes), 2), dtype=np.float64)
+        values[sized] = table[codes[sized]]
+        return values[:, 0], values[:, 1], ~sized
+
+    def position_of(self, flat_index: int) -> Position:
+        rest, z = divmod(int(flat_index), self.shape[2])
+        x, y = divmod(rest, self.shape[1])
+        return Position(x, y, z)
+
+    def _item(self, row: int) -> Item:
+        item = Item(self.ids[int(self.id_codes[row])], self.names[int(self.name_codes[row])],
+                    int(self.priorities[row]), float(self.storage_costs[row]), float(self.created_times[row]))
+        item.stored_time = float(self.stored_times[row])
+        code = int(self.entity_codes[row])
+        if code >= 0:
+            item.entity = self.entities[code]
+        return item
+
+    def items_at(self, flat_index: int) -> List[Item]:
+        """셀의 아이템을 입고 순서대로 생성 (아이템이 없으면 빈 목록)"""
+        index = int(np.searchsorted(self.cells, flat_index))
+        if index >= len(self.cells) or self.cells[index] != flat_index:
+            return []
+        return [self._item(row) for row in range(int(self.cell_offsets[index]), int(self.cell_offsets[index + 1]))]
+
+    def positions_of(self, item_id: str) -> Dict[Position, int]:
+        """아이템 ID의 위치별 개수"""
+        try:
+            code = self.ids.index(item_id)
+        except ValueError:
+            return {}
+        rows = self.id_order[self.id_offsets[code]:self.id_offsets[code + 1]]
+        cells, counts = np.unique(self.item_cells[rows], return_counts=True)
+        return {self.position_of(cell): count for cell, count in zip(cells.tolist(), counts.tolist())}
+
+
+def inventory_arrays(cells: List[Tuple[int, List[Item]]]) -> Tuple[Dict[str, np.ndarray], List[Dict[str, Any]]]:
+    """
+    (셀 번호, 입고 순 아이템 목록) 목록을 스냅샷 재고 컬럼으로 변환
+
+    Args:
+        cells: 셀 번호 오름차순, 아이템이 있는 셀만
+
+    Returns:
+        (재고 컬럼, Entity 표) - 같은 Entity 객체를 공유하는 아이템은 표의 한 항목을 가리킴
+    """
+    items = [item for _, cell_items in cells for item in cell_items]
+    ids = sorted({item.id for item in items})
+    names = sorted({item.name for item in items})
+    id_code_map = {item_id: code for code, item_id in enumerate(ids)}
+    name_code_map = {name: code for code, name in enumerate(names)}
+
+    counts = np.array([len(cell_items) for _, cell_items in cells], dtype=np.int64)
+    cell_offsets = np.zeros(len(cells) + 1, dtype=np.int64)
+    np.cumsum(counts, out=cell_offsets[1:])
+    cell_indices = np.array([flat for flat, _ in cells], dtype=np.int64)
+    id_codes = np.array([id_code_map[item.id] for item in items], dtype=np.int32)
+    id_offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(id_codes, minlength=len(ids)), out=id_offsets[1:])
+    id_data, id_string_offsets = encode_strings(ids)
+    name_data, name_string_offsets = encode_strings(names)
+    entity_codes_by_id: Dict[int, int] = {}
+    entities: List[Dict[str, Any]] = []
+    entity_codes = np.full(len(items), -1, dtype=np.int32)
+    for row, item in enumerate(items):
+        if item.entity is not None:
+            code = entity_codes_by_id.get(id(item.entity))
+            if code is None:
+                code = entity_codes_by_id[id(item.entity)] = len(entities)
+                entities.append(asdict(item.entity))
+            entity_codes[row] = code
+
+    return {
+        "cells": cell_indices,
+        "cell_offsets": cell_offsets,
+        "item_cells": np.repeat(cell_indices, counts),
+        "id_codes": id_codes,
+        "name_codes": np.array([name_code_map[item.name] for item in items], dtype=np.int32),
+        "priorities": np.array([item.priority for item in items], dtype=np.int64),
+        "storage_costs": np.array([item.storage_cost for item in items], dtype=np.float64),
+        "created_times": np.array([item.created_time for item in items], dtype=np.float64),
+        "stored_times": np.array([item.stored_time for item in items], dtype=np.float64),
+        "entity_codes": entity_codes,
+        "id_order": np.argsort(id_codes, kind="stable").astype(np.int64),
+        "id_offsets": id_offsets,
+        "id_data": id_data,
+        "id_string_offsets": id_string_offsets,
+        "name_data": name_data,
+        "name_string_offsets": name_string_offsets,
+    }, entities
@@ -0,0 +1,97 @@
+from typing import TYPE_CHECKING, Dict, Iterable
+
+import numpy as np
+
+from .cell import Cell, CellObserver
+from .config.storage_cost_policy import StorageCostPolicy
+from .item import Item
+
+if TYPE_CHECKING:
+    from .asrs import ASRS
+
+
+class StorageAggregates(CellObserver):
+    """
+    셀 변화에 따라 증분 갱신되는 자동창고 집계값
+
+    전체 아이템 수, 아이템이 있는 셀 수, 보관유지비용 정책별 합계를
+    입고/출고 시점에 갱신하여 조회를 O(1)로 처리합니다. 비용 합계는 셀 비용이
+    아이템 수만으로 정해지는(incremental) 정책만 관리합니다.
+    """
+
+    def __init__(self, context: "ASRS"):
+        self.context = context
+        self.total_items = 0
+        self.occupied_cells = 0
+        self.cost_totals: Dict[StorageCostPolicy, float] = {
+            policy: 0.0 for policy, strategy in context.storage_cost_strategies.items() if strategy.incremental
+        }
+
+    def _cell_cost(self, policy: StorageCostPolicy, items_count: int) -> float:
+        if items_count == 0:
+            return 0.0
+        return self.context.storage_cost_strategies[policy].calculate(self.context, items_count)
+
+    def _apply_count_change(self, before: int, after: int):
+        self.total_items += after - before
+        if before == 0:
+            self.occupied_cells += 1
+        elif after == 0:
+            self.occupied_cells -= 1
+        for policy in self.cost_totals:
+            self.cost_totals[policy] += self._cell_cost(policy, after) - self._cell_cost(policy, before)
+
+    def on_item_added(self, cell: Cell, item: Item):
+        after = cell.item_count()
+        self._apply_count_change(after - 1, after)
+
+    def on_item_removed(self, cell: Cell, item: Item):
+        after = cell.item_count()
+        self._apply_count_change(after + 1, after)
+
+    def load_counts(self, counts: Iterable[int]):
+        """관찰자 통지 없이 한꺼번에 채워진 셀들의 아이템 수를 반영 (스냅샷 복원용)"""
+        # 셀 비용은 아이템 수에만 의존하므로 같은 수의 셀을 묶어 계산
+        values, multiplicities = np.unique(np.asarray(counts, dtype=np.int64), return_counts=True)
+        for items_count, cells in zip(values.tolist(), multiplicities.tolist()):
+            self.total_items += items_count * cells
+            if items_count > 0:
+                self.occupied_cells += cells
+            for policy in self.cost_totals:
+                self.cost_totals[policy] += self._cell_cost(policy, items_count) * cells
+
+    def recalculate_costs(self, cells: Iterable[Cell]):
+        """비용 설정이 바뀐 경우 정책별 비용 합계를 다시 계산"""
+        for policy in self.cost_totals:
+            self.cost_totals[policy] = 0.0
+        for cell in cells:
+            items_count = cell.item_count()
+            for policy in self.cost_totals:
+                self.cost_totals[policy] += self._cell_cost(policy, items_count)
+
+    def verify(self, cells: Iterable[Cell]):
+        """
+        전체 셀을 스캔한 결과와 집계값을 비교 (디버그용)
+
+        Raises:
+            RuntimeError: 집계값이 스캔 결과와 다른 경우 발생합니다.
+        """
+        total_items = 0
+        occupied_cells = 0
+        cost_totals = {policy: 0.0 for policy in self.cost_totals}
+        for cell in cells:
+            items_count = cell.item_count()
+            total_items += items_count
+            if items_count > 0:
+                occupied_cells += 1
+            for policy in cost_totals:
+                cost_totals[policy] += self._cell_cost(policy, items_count)
+
+        if total_items != self.total_items or occupied_cells != self.occupied_cells:
+            raise RuntimeError(
+                f"Aggregate mismatch: total_items={self.total_items} (scan {total_items}), "
+                f"occupied_cells={self.occupied_cells} (scan {occupied_cells})")
+        for policy, scanned in cost_totals.items():
+            if abs(scanned - self.cost_totals[policy]) > 1e-9 * max(1.0, abs(scanned)):
+                raise RuntimeError(
+                    f"Aggregate mismatch: cost[{policy.value}]={self.cost_totals[policy]} (scan {scanned})")
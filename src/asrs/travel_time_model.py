@@ -0,0 +1,106 @@
+from dataclasses import dataclass
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from .position import Position
+
+
+@dataclass(frozen=True)
+class AxisKinematics:
+    """스태커크레인 한 축의 운동 특성"""
+    max_speed: float  # 최고 속도 (m/s)
+    acceleration: float  # 가속도 = 감속도 (m/s^2)
+    pitch: float = 1.0  # 인접 셀 간 거리 (m)
+
+    def __post_init__(self):
+        if self.max_speed <= 0 or self.acceleration <= 0 or self.pitch <= 0:
+            raise ValueError("max_speed, acceleration and pitch must be positive.")
+
+    def travel_time(self, cells: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        정지 상태에서 출발해 cells 칸 떨어진 곳에 정지할 때까지의 시간 (사다리꼴 속도 프로파일)
+
+        최고 속도에 도달하지 못하는 짧은 거리는 삼각형 프로파일(2 * sqrt(d / a))로 계산합니다.
+        """
+        distance = np.abs(np.asarray(cells, dtype=np.float64)) * self.pitch
+        # 최고 속도까지 가속 후 감속하는 데 필요한 최소 거리
+        ramp_distance = self.max_speed ** 2 / self.acceleration
+        times = np.where(
+            distance >= ramp_distance,
+            distance / self.max_speed + self.max_speed / self.acceleration,
+            2.0 * np.sqrt(distance / self.acceleration),
+        )
+        return float(times) if times.ndim == 0 else times
+
+
+class TravelTimeModel:
+    """
+    스태커크레인 이동 시간 모델
+
+    세 축(x: 통로 간 이동, y: 통로 방향 수평 주행, z: 수직 승강)이 동시에 움직이므로
+    이동 시간은 축별 이동 시간의 최댓값(체비쇼프 방식)입니다. 축별 이동 시간은
+    칸 수에 대한 표로, 입출고 지점(I/O)에서 모든 셀까지의 이동 시간은 (x, y, z)
+    배열로 미리 계산해 두므로 이동 한 번의 비용은 표 조회입니다.
+    """
+
+    def __init__(
+        self,
+        max_x: int,
+        max_y: int,
+        max_z: int,
+        x_axis: AxisKinematics = AxisKinematics(max_speed=1.0, acceleration=0.5),
+        y_axis: AxisKinematics = AxisKinematics(max_speed=3.0, acceleration=1.0),
+        z_axis: AxisKinematics = AxisKinematics(max_speed=1.0, acceleration=0.8),
+        io_point: Optional[Position] = None
+    ):
+        self.max_x = max_x
+        self.max_y = max_y
+        self.max_z = max_z
+        self.axes = (x_axis, y_axis, z_axis)
+        self.io_point = io_point if io_point is not None else Position(0, 0, 0)
+
+        # 축별 칸 수 -> 이동 시간 표
+        self.x_table = np.atleast_1d(x_axis.travel_time(np.arange(max_x)))
+        self.y_table = np.atleast_1d(y_axis.travel_time(np.arange(max_y)))
+        self.z_table = np.atleast_1d(z_axis.travel_time(np.arange(max_z)))
+        self._x_times = self.x_table.tolist()
+        self._y_times = self.y_table.tolist()
+        self._z_times = self.z_table.tolist()
+
+        # I/O 지점에서 모든 셀까지의 이동 시간
+        self.io_table = self.times_from(self.io_point)
+
+    def travel_time(self, start: Position, end: Position) -> float:
+        """두 위치 사이의 이동 시간"""
+        return max(self._x_times[abs(end.x - start.x)],
+                   self._y_times[abs(end.y - start.y)],
+                   self._z_times[abs(end.z - start.z)])
+
+    def time_from_io(self, position: Position) -> float:
+        """I/O 지점에서 해당 위치까지의 이동 시간"""
+        return float(self.io_table[position.x, position.y, position.z])
+
+    def times_from(self, origin: Position) -> np.ndarray:
+        """origin에서 모든 셀까지의 이동 시간 배열 ((x, y, z) 모양)"""
+        x_times = self.x_table[np.abs(np.arange(self.max_x) - origin.x)]
+        y_times = self.y_table[np.abs(np.arange(self.max_y) - origin.y)]
+        z_times = self.z_table[np.abs(np.arange(self.max_z) - origin.z)]
+        return np.maximum(np.maximum(x_times[:, None, None], y_times[None, :, None]), z_times[None, None, :])
+
+    def travel_times(self, origin: Position, coordinates: np.ndarray) -> np.ndarray:
+        """origin에서 여러 위치((n, 3) 좌표 배열)까지의 이동 시간"""
+        deltas = np.abs(np.asarray(coordinates, dtype=np.int64).reshape(-1, 3) - (origin.x, origin.y, origin.z))
+        return np.maximum(np.maximum(self.x_table[deltas[:, 0]], self.y_table[deltas[:, 1]]),
+                          self.z_table[deltas[:, 2]])
+
+    def pair_table(self, positions: Sequence[Position]) -> np.ndarray:
+        """위치 목록의 모든 쌍에 대한 이동 시간 행렬"""
+        coordinates = np.array([(p.x, p.y, p.z) for p in positions], dtype=np.int64).reshape(-1, 3)
+        deltas = np.abs(coordinates[:, None, :] - coordinates[None, :, :])
+        return np.maximum(np.maximum(self.x_table[deltas[..., 0]], self.y_table[deltas[..., 1]]),
+                          self.z_table[deltas[..., 2]])
+
+    def cycle_time(self, position: Position) -> float:
+        """I/O 지점 -> 위치 -> I/O 지점 왕복 이동 시간 (단일 명령 사이클)"""
+        return 2.0 * self.time_from_io(position)
@@ -1,12 +1,59 @@
 import abc
+from typing import Optional, Union
+
+import numpy as np
+
+SeedLike = Union[None, int, np.random.SeedSequence, np.random.Generator]
 
 
 class Distribution(abc.ABC):
     """
     모든 확률 분포 클래스를 위한 추상 기본 클래스(ABC).
+
+    각 분포는 자신의 numpy.random.Generator(rng)에서 샘플을 추출합니다. 시드를
+    지정하지 않으면 운영체제 엔트로피로 처음 사용할 때 만들어집니다.
     """
 
+    def __init__(self, seed: SeedLike = None):
+        """
+        Args:
+            seed (SeedLike): 정수 시드, SeedSequence(예: StreamManager가 나눠준 스트림) 또는 Generator.
+        """
+        self.reseed(seed)
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """이 분포의 난수 생성기."""
+        rng: Optional[np.random.Generator] = getattr(self, "_rng", None)
+        if rng is None:
+            rng = self._rng = np.random.default_rng(getattr(self, "_seed", None))
+        return rng
+
+    def reseed(self, seed: SeedLike):
+        """
+        난수 생성기를 새 시드로 교체합니다.
+
+        Args:
+            seed (SeedLike): 정수 시드, SeedSequence 또는 Generator.
+        """
+        self._seed = seed
+        self._rng = None
+
     @abc.abstractmethod
     def generate(self) -> float:
         """분포로부터 단일 샘플을 추출합니다."""
         pass
+
+    def generate_many(self, n: int) -> np.ndarray:
+        """
+        분포로부터 n개의 샘플을 한 번에 추출합니다.
+
+        기본 구현은 generate()를 n번 호출하며, 하위 클래스는 벡터화된 구현으로 재정의합니다.
+
+        Args:
+            n (int): 샘플 개수.
+
+        Returns:
+            np.ndarray: 길이 n의 float64 배열.
+        """
+        return np.fromiter((self.generate() for _ in range(n)), dtype=np.float64, count=n)
@@ -0,0 +1,67 @@
+from typing import List
+
+import numpy as np
+
+from src.distributions.base import Distribution, SeedLike
+
+
+class BufferedDistribution(Distribution):
+    """
+    다른 분포의 샘플을 버퍼에 미리 뽑아두고 하나씩 반환하는 분포.
+
+    버퍼가 비면 감싼 분포의 generate_many로 buffer_size개를 한 번에 채우므로,
+    generate() 한 번의 비용은 리스트 인덱싱 수준입니다. 감싼 분포의 Generator에서
+    같은 순서로 추출하므로 결과는 버퍼 없이 generate()를 반복한 것과 같습니다.
+    """
+
+    def __init__(self, distribution: Distribution, buffer_size: int = 65536):
+        """
+        Args:
+            distribution (Distribution): 샘플을 추출할 분포.
+            buffer_size (int): 한 번에 채우는 샘플 개수.
+
+        Raises:
+            ValueError: buffer_size가 1보다 작은 경우 발생합니다.
+        """
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be positive.")
+        self.distribution = distribution
+        self.buffer_size = buffer_size
+        self._buffer: List[float] = []
+        self._index = 0
+
+    @property
+    def rng(self) -> np.random.Generator:
+        return self.distribution.rng
+
+    def reseed(self, seed: SeedLike):
+        """감싼 분포의 시드를 다시 지정하고 남은 버퍼를 버립니다."""
+        self.distribution.reseed(seed)
+        self._buffer = []
+        self._index = 0
+
+    @property
+    def buffered(self) -> int:
+        """버퍼에 남은 샘플 개수."""
+        return len(self._buffer) - self._index
+
+    def generate(self) -> float:
+        index = self._index
+        if index >= len(self._buffer):
+            self._buffer = self.distribution.generate_many(self.buffer_size).tolist()
+            index = 0
+        self._index = index + 1
+        return self._buffer[index]
+
+    def generate_many(self, n: int) -> np.ndarray:
+        # 버퍼에 남은 샘플을 먼저 사용하고 부족한 만큼만 감싼 분포에서 추출
+        start = self._index
+        taken = min(n, len(self._buffer) - start)
+        self._index = start + taken
+        head = np.array(self._buffer[start:start + taken], dtype=np.float64)
+        if taken == n:
+            return head
+        return np.concatenate((head, self.distribution.generate_many(n - taken)))
+
+    def __repr__(self) -> str:
+        return f"BufferedDistribution({self.distribution!r}, buffer_size={self.buffer_size})"
@@ -1,20 +1,27 @@
 from typing import Union
 
-from src.distributions.base import Distribution
+import numpy as np
+
+from src.distributions.base import Distribution, SeedLike
 
 
 class Constant(Distribution):
     """항상 동일한 상수 값을 반환하는 분포."""
 
-    def __init__(self, value: Union[int, float]):
+    def __init__(self, value: Union[int, float], seed: SeedLike = None):
         """
         Args:
             value (Union[int, float]): 반환될 상수 값.
+            seed (SeedLike): 다른 분포와 같은 인터페이스를 위한 인자 (사용하지 않음).
         """
         self.value = value
+        super().__init__(seed)
 
     def generate(self) -> float:
         return float(self.value)
 
+    def generate_many(self, n: int) -> np.ndarray:
+        return np.full(n, float(self.value))
+
     def __repr__(self) -> str:
         return f"Constant(value={self.value})"
@@ -0,0 +1,158 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src.distributions.base import Distribution, SeedLike
+
+
+class Empirical(Distribution):
+    """
+    관측값으로 만든 경험적 분포(Empirical Distribution).
+
+    - 이산(discrete=True): 관측된 값들을 관측 빈도에 비례해 추출합니다. Walker 별칭 표
+      (alias table)를 사용하므로 값의 종류 수와 관계없이 샘플 하나에 O(1)입니다.
+    - 연속(discrete=False): 정렬된 관측값(또는 분위수) 사이를 선형 보간한 역누적분포
+      함수로 추출하며, 역시 샘플 하나에 O(1)입니다.
+
+    두 경우 모두 샘플 하나에 균등 난수 하나를 사용하므로 generate()를 반복한 결과와
+    generate_many()의 결과가 같습니다. 표는 save_table로 .npy 파일에 저장한 뒤
+    from_table로 메모리 맵해 불러올 수 있습니다.
+    """
+
+    def __init__(self, observations: np.ndarray, discrete: bool = False, quantiles: Optional[int] = None,
+                 seed: SeedLike = None):
+        """
+        Args:
+            observations (np.ndarray): 관측값 배열.
+            discrete (bool): True면 관측된 값만 추출하는 이산 분포.
+            quantiles (Optional[int]): 연속 분포에서 관측값 대신 사용할 균등 간격 분위수 개수
+                (관측값이 매우 많을 때 표 크기를 줄임).
+            seed (SeedLike): 난수 생성기 시드 (정수, SeedSequence 또는 Generator).
+
+        Raises:
+            ValueError: 관측값이 없거나 유한하지 않은 값이 있거나 quantiles가 2보다 작은 경우 발생합니다.
+        """
+        observations = np.asarray(observations, dtype=np.float64).ravel()
+        if observations.size == 0:
+            raise ValueError("Empirical distribution needs at least one observation.")
+        if not np.all(np.isfinite(observations)):
+            raise ValueError("Observations must be finite.")
+        if discrete:
+            values, counts = np.unique(observations, return_counts=True)
+            probabilities, aliases = self.alias_table(counts / counts.sum())
+            table = np.vstack((values, probabilities, aliases))
+        else:
+            if quantiles is not None:
+                if quantiles < 2:
+                    raise ValueError("quantiles must be at least 2.")
+                knots = np.quantile(observations, np.linspace(0.0, 1.0, quantiles))
+            else:
+                knots = np.sort(observations)
+            table = knots.reshape(1, -1)
+        self._set_table(table)
+        super().__init__(seed)
+
+    def _set_table(self, table: np.ndarray):
+        self.table = table
+        self.discrete = table.shape[0] == 3
+        self._size = table.shape[1]
+        rows = [table[row] for row in range(table.shape[0])]
+        self.values = rows[0]
+        if self.discrete:
+            self.probabilities = rows[1]
+            self.aliases = rows[2]  # 별칭 번호 (float로 저장)
+        # generate()용 행: 메모리에 있는 표는 파이썬 리스트(인덱싱이 더 빠름),
+        # 메모리 맵 표는 시작 시 전체를 읽지 않도록 배열 그대로 사용
+        self._rows = rows if isinstance(table, np.memmap) else [row.tolist() for row in rows]
+
+    @staticmethod
+    def alias_table(probabilities: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vose 방법으로 Walker 별칭 표를 만듭니다.
+
+        Args:
+            probabilities (np.ndarray): 합이 1인 확률 배열.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (칸별 자기 값 선택 확률, 칸별 별칭 번호 - 표와 같은 float 배열).
+        """
+        size = len(probabilities)
+        scaled = np.asarray(probabilities, dtype=np.float64) * size
+        accept = np.ones(size, dtype=np.float64)
+        aliases = np.arange(size, dtype=np.float64)
+        small = np.flatnonzero(scaled < 1.0).tolist()
+        large = np.flatnonzero(scaled >= 1.0).tolist()
+        scaled = scaled.tolist()
+        while small and large:
+            less, more = small.pop(), large.pop()
+            accept[less] = scaled[less]
+            aliases[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # 남은 칸은 부동소수점 오차를 제외하면 확률 1
+        return accept, aliases
+
+    def generate(self) -> float:
+        rows = self._rows
+        if self.discrete:
+            scaled = self.rng.random() * self._size
+            index = min(int(scaled), self._size - 1)  # u가 1에 매우 가까울 때의 반올림 방지
+            if scaled - index >= rows[1][index]:
+                index = int(rows[2][index])
+            return float(rows[0][index])
+        values = rows[0]
+        if self._size == 1:
+            self.rng.random()
+            return float(values[0])
+        scaled = self.rng.random() * (self._size - 1)
+        index = min(int(scaled), self._size - 2)
+        low = values[index]
+        return float(low + (scaled - index) * (values[index + 1] - low))
+
+    def generate_many(self, n: int) -> np.ndarray:
+        if self.discrete:
+            scaled = self.rng.random(n) * self._size
+            index = np.minimum(scaled.astype(np.int64), self._size - 1)
+            alias = (scaled - index) >= self.probabilities[index]
+            index[alias] = self.aliases[index[alias]].astype(np.int64)
+            return self.values[index]
+        if self._size == 1:
+            self.rng.random(n)
+            return np.full(n, float(self.values[0]))
+        scaled = self.rng.random(n) * (self._size - 1)
+        index = np.minimum(scaled.astype(np.int64), self._size - 2)
+        low = self.values[index]
+        return low + (scaled - index) * (self.values[index + 1] - low)
+
+    def save_table(self, path: str):
+        """
+        샘플링 표를 .npy 파일로 저장합니다.
+
+        Args:
+            path (str): 파일 경로 (.npy).
+        """
+        np.save(path, np.ascontiguousarray(self.table))
+
+    @classmethod
+    def from_table(cls, path: str, mmap: bool = True, seed: SeedLike = None) -> "Empirical":
+        """
+        save_table로 저장한 표에서 분포를 만듭니다.
+
+        Args:
+            path (str): 파일 경로 (.npy).
+            mmap (bool): True면 표를 읽기 전용 메모리 맵으로 사용 (필요한 부분만 디스크에서 읽음).
+            seed (SeedLike): 난수 생성기 시드.
+
+        Raises:
+            ValueError: 경험적 분포 표가 아닌 경우 발생합니다.
+        """
+        table = np.load(path, mmap_mode="r" if mmap else None)
+        if table.ndim != 2 or table.shape[0] not in (1, 3) or table.shape[1] == 0:
+            raise ValueError("Not an empirical distribution table.")
+        distribution = cls.__new__(cls)
+        distribution._set_table(table)
+        Distribution.__init__(distribution, seed)
+        return distribution
+
+    def __repr__(self) -> str:
+        return f"Empirical(discrete={self.discrete}, size={self._size})"
@@ -1,15 +1,16 @@
 import numpy as np
 
-from src.distributions.base import Distribution
+from src.distributions.base import Distribution, SeedLike
 
 
 class Exponential(Distribution):
     """지수 분포(Exponential Distribution)."""
 
-    def __init__(self, mean: float):
+    def __init__(self, mean: float, seed: SeedLike = None):
         """
         Args:
             mean (float): 분포의 평균. 람다(lambda)의 역수입니다.
+            seed (SeedLike): 난수 생성기 시드 (정수, SeedSequence 또는 Generator).
 
         Raises:
             ValueError: 평균이 0보다 작거나 같은 경우 발생합니다.
@@ -17,10 +18,14 @@ class Exponential(Distribution):
         if mean <= 0:
             raise ValueError("Mean for Exponential distribution must be positive.")
         self.mean = mean
+        super().__init__(seed)
 
     def generate(self) -> float:
         # scale(평균)을 직접 인자로 받습니다.
-        return np.random.exponential(scale=self.mean)
+        return self.rng.exponential(scale=self.mean)
+
+    def generate_many(self, n: int) -> np.ndarray:
+        return self.rng.exponential(scale=self.mean, size=n)
 
     def __repr__(self) -> str:
         return f"Exponential(mean={self.mean})"
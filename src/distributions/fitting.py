@@ -0,0 +1,203 @@
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+from scipy import stats
+
+from src.distributions.base import Distribution, SeedLike
+from src.distributions.constant import Constant
+from src.distributions.exponential import Exponential
+from src.distributions.normal import Normal
+from src.distributions.triangular import Triangular
+from src.distributions.uniform import Uniform
+
+CACHE_VERSION = 1
+CRITERIA = ("aic", "ks")
+CONSTANT = "constant"  # 모든 관측값이 같을 때의 결과 계열
+
+
+@dataclass
+class FitResult:
+    """분포 하나의 적합 결과."""
+    family: str
+    params: Dict[str, float]
+    log_likelihood: float
+    aic: float
+    ks_statistic: float
+
+    def to_distribution(self, seed: SeedLike = None) -> Distribution:
+        """적합한 모수로 분포 객체를 만듭니다."""
+        if self.family == CONSTANT:
+            return Constant(self.params["value"], seed=seed)
+        return FAMILIES[self.family].build(self.params, seed)
+
+
+@dataclass(frozen=True)
+class _Family:
+    """적합 대상 분포 계열: scipy 분포, scipy 모수 추정, scipy 모수 <-> 패키지 분포 모수 변환."""
+    scipy_distribution: stats.rv_continuous
+    fit: Callable[[np.ndarray], tuple]
+    to_params: Callable[[tuple], Dict[str, float]]
+    from_params: Callable[[Dict[str, float]], tuple]
+    build: Callable[[Dict[str, float], SeedLike], Distribution]
+
+
+def _triangular_params(scipy_params: tuple) -> Dict[str, float]:
+    c, loc, scale = scipy_params
+    return {"min_val": loc, "mode": loc + c * scale, "max_val": loc + scale}
+
+
+def _triangular_scipy(params: Dict[str, float]) -> tuple:
+    scale = params["max_val"] - params["min_val"]
+    return (params["mode"] - params["min_val"]) / scale, params["min_val"], scale
+
+
+def _fit_triangular(data: np.ndarray) -> tuple:
+    # 관측 범위를 조금 넓힌 값에서 시작해야 경계의 로그우도가 -inf가 되지 않음
+    low, high = float(data.min()), float(data.max())
+    margin = (high - low) * 1e-3
+    loc, scale = low - margin, high - low + 2 * margin
+    # 삼각 분포의 평균 (min + mode + max) / 3에서 구한 최빈값을 초깃값으로 사용
+    c_guess = float(np.clip((3 * data.mean() - low - high - loc) / scale, 0.01, 0.99))
+    return stats.triang.fit(data, c_guess, loc=loc, scale=scale)
+
+
+FAMILIES: Dict[str, _Family] = {
+    "normal": _Family(
+        stats.norm,
+        stats.norm.fit,
+        lambda p: {"mean": p[0], "stddev": p[1]},
+        lambda params: (params["mean"], params["stddev"]),
+        lambda params, seed: Normal(params["mean"], params["stddev"], seed=seed),
+    ),
+    "uniform": _Family(
+        stats.uniform,
+        stats.uniform.fit,
+        lambda p: {"min_val": p[0], "max_val": p[0] + p[1]},
+        lambda params: (params["min_val"], params["max_val"] - params["min_val"]),
+        lambda params, seed: Uniform(params["min_val"], params["max_val"], seed=seed),
+    ),
+    "exponential": _Family(
+        stats.expon,
+        # 패키지의 Exponential은 0에서 시작하므로 loc를 0으로 고정
+        lambda data: stats.expon.fit(data, floc=0.0),
+        lambda p: {"mean": p[1]},
+        lambda params: (0.0, params["mean"]),
+        lambda params, seed: Exponential(params["mean"], seed=seed),
+    ),
+    "triangular": _Family(
+        stats.triang,
+        _fit_triangular,
+        _triangular_params,
+        _triangular_scipy,
+        lambda params, seed: Triangular(params["min_val"], params["mode"], params["max_val"], seed=seed),
+    ),
+}
+
+
+def data_key(data: np.ndarray) -> str:
+    """관측값 배열의 sha256 (float64, C 순서 기준)."""
+    return hashlib.sha256(memoryview(np.ascontiguousarray(data, dtype=np.float64)).cast("B")).hexdigest()
+
+
+def _fit_family(name: str, data: np.ndarray) -> Optional[FitResult]:
+    family = FAMILIES[name]
+    if name == "exponential" and data.min() < 0:
+        return None
+    try:
+        params = family.to_params(tuple(float(value) for value in family.fit(data)))
+        scipy_params = family.from_params(params)
+        log_likelihood = float(family.scipy_distribution.logpdf(data, *scipy_params).sum())
+    except (ValueError, RuntimeError, FloatingPointError, ZeroDivisionError):
+        return None
+    if not np.isfinite(log_likelihood):
+        return None
+    ks_statistic = float(stats.kstest(data, family.scipy_distribution.cdf, args=scipy_params).statistic)
+    return FitResult(name, params, log_likelihood, 2 * len(params) - 2 * log_likelihood, ks_statistic)
+
+
+def fit_distributions(data: np.ndarray, criterion: str = "aic", families: Optional[Sequence[str]] = None,
+                      cache_dir: Optional[str] = None) -> List[FitResult]:
+    """
+    관측값에 분포 계열별 최대우도 추정(scipy)을 적용하고 기준에 따라 정렬합니다.
+
+    모든 관측값이 같으면 Constant 하나만 반환합니다. 적합할 수 없는 계열(예: 음수
+    관측값의 Exponential, 우도가 0인 경계)은 결과에서 빠집니다.
+
+    Args:
+        data (np.ndarray): 관측값 배열.
+        criterion (str): "aic"(작을수록 좋음) 또는 "ks"(Kolmogorov-Smirnov 통계량, 작을수록 좋음).
+        families (Optional[Sequence[str]]): 적합할 계열 이름 (생략하면 FAMILIES 전체).
+        cache_dir (Optional[str]): 적합 결과를 저장할 디렉터리. 같은 관측값(sha256)과 계열의
+            결과가 있으면 다시 적합하지 않습니다.
+
+    Returns:
+        List[FitResult]: 기준이 좋은 순서의 적합 결과.
+
+    Raises:
+        ValueError: 관측값이 없거나 유한하지 않은 값이 있거나 기준/계열 이름이 잘못된 경우 발생합니다.
+    """
+    if criterion not in CRITERIA:
+        raise ValueError(f"criterion must be one of {CRITERIA}.")
+    names = list(FAMILIES) if families is None else list(families)
+    unknown = [name for name in names if name not in FAMILIES]
+    if unknown:
+        raise ValueError(f"Unknown distribution families: {unknown}")
+    data = np.asarray(data, dtype=np.float64).ravel()
+    if data.size == 0:
+        raise ValueError("Fitting needs at least one observation.")
+    if not np.all(np.isfinite(data)):
+        raise ValueError("Observations must be finite.")
+
+    if data.min() == data.max():
+        return [FitResult(CONSTANT, {"value": float(data[0])}, float("inf"), float("-inf"), 0.0)]
+
+    cache_path = None
+    results: Optional[List[FitResult]] = None
+    if cache_dir is not None:
+        key = hashlib.sha256(f"{CACHE_VERSION}:{data_key(data)}:{','.join(sorted(names))}".encode()).hexdigest()
+        cache_path = os.path.join(cache_dir, f"{key}.json")
+        results = _load_cache(cache_path)
+    if results is None:
+        results = [result for result in (_fit_family(name, data) for name in names) if result is not None]
+        if cache_path is not None:
+            _store_cache(cache_path, results)
+    return sorted(results, key=lambda result: result.aic if criterion == "aic" else result.ks_statistic)
+
+
+def best_fit(data: np.ndarray, criterion: str = "aic", families: Optional[Sequence[str]] = None,
+             cache_dir: Optional[str] = None, seed: SeedLike = None) -> Distribution:
+    """
+    관측값에 가장 잘 맞는 분포 객체를 반환합니다 (인자는 fit_distributions와 같음).
+
+    Raises:
+        ValueError: 적합할 수 있는 계열이 없는 경우에도 발생합니다.
+    """
+    results = fit_distributions(data, criterion, families, cache_dir)
+    if not results:
+        raise ValueError("No distribution family could be fitted to the data.")
+    return results[0].to_distribution(seed)
+
+
+def _load_cache(path: str) -> Optional[List[FitResult]]:
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            payload = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if payload.get("version") != CACHE_VERSION:
+        return None
+    return [FitResult(**result) for result in payload["results"]]
+
+
+def _store_cache(path: str, results: List[FitResult]):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    payload = {"version": CACHE_VERSION, "results": [asdict(result) for result in results]}
+    # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w", encoding="utf-8") as file:
+        json.dump(payload, file)
+    os.replace(temporary, path)
@@ -1,16 +1,17 @@
 import numpy as np
 
-from src.distributions.base import Distribution
+from src.distributions.base import Distribution, SeedLike
 
 
 class Normal(Distribution):
     """정규 분포(Normal Distribution)."""
 
-    def __init__(self, mean: float, stddev: float):
+    def __init__(self, mean: float, stddev: float, seed: SeedLike = None):
         """
         Args:
             mean (float): 분포의 평균 (mu).
             stddev (float): 분포의 표준편차 (sigma).
+            seed (SeedLike): 난수 생성기 시드 (정수, SeedSequence 또는 Generator).
 
         Raises:
             ValueError: 표준편차가 0보다 작은 경우 발생합니다.
@@ -19,9 +20,13 @@ class Normal(Distribution):
             raise ValueError("Standard deviation cannot be negative.")
         self.mean = mean
         self.stddev = stddev
+        super().__init__(seed)
 
     def generate(self) -> float:
-        return np.random.normal(loc=self.mean, scale=self.stddev)
+        return self.rng.normal(loc=self.mean, scale=self.stddev)
+
+    def generate_many(self, n: int) -> np.ndarray:
+        return self.rng.normal(loc=self.mean, scale=self.stddev, size=n)
 
     def __repr__(self) -> str:
         return f"Normal(mean={self.mean}, stddev={self.stddev})"
@@ -0,0 +1,90 @@
+import hashlib
+from typing import Dict, Tuple, TypeVar, Union
+
+import numpy as np
+
+from src.distributions.base import Distribution
+
+D = TypeVar("D", bound=Distribution)
+
+
+def _category_key(category: str) -> int:
+    """범주 이름을 spawn_key용 32비트 정수로 변환 (실행마다 같은 값)."""
+    return int.from_bytes(hashlib.sha256(category.encode("utf-8")).digest()[:4], "little")
+
+
+class StreamManager:
+    """
+    시뮬레이션 난수 스트림 관리자.
+
+    하나의 루트 SeedSequence에서 (범주, 번호)마다 고유한 spawn_key를 가진 자식
+    SeedSequence를 만들어 나눠줍니다. 자식 스트림은 서로 겹치지 않고 독립적이며,
+    요청 순서와 관계없이 같은 (범주, 번호)에는 항상 같은 스트림이 배정되므로
+    입고원(source), 크레인, 반복 실행(replication)별 난수를 따로 재현할 수 있습니다.
+    """
+
+    REPLICATION = "replication"  # replication()이 사용하는 범주 이름
+
+    def __init__(self, seed: Union[None, int, np.random.SeedSequence] = None):
+        """
+        Args:
+            seed (Union[None, int, SeedSequence]): 루트 시드. 생략하면 운영체제 엔트로피를 사용하며,
+                실제 값은 entropy로 확인해 재현에 사용할 수 있습니다.
+        """
+        self.root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self._generators: Dict[Tuple[str, int], np.random.Generator] = {}
+
+    @property
+    def entropy(self) -> int:
+        """루트 시드의 엔트로피 (같은 값으로 StreamManager를 만들면 같은 스트림을 얻음)."""
+        return self.root.entropy
+
+    def seed_sequence(self, category: str, index: int = 0) -> np.random.SeedSequence:
+        """
+        (범주, 번호)의 자식 SeedSequence를 반환합니다.
+
+        Args:
+            category (str): 스트림 범주 (예: "source", "crane").
+            index (int): 범주 안의 번호 (예: 크레인 번호).
+
+        Raises:
+            ValueError: 번호가 음수인 경우 발생합니다.
+        """
+        if index < 0:
+            raise ValueError("Stream index cannot be negative.")
+        root = self.root
+        return np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key + (_category_key(category), index),
+                                      pool_size=root.pool_size)
+
+    def generator(self, category: str, index: int = 0) -> np.random.Generator:
+        """(범주, 번호)의 Generator를 반환합니다 (같은 키에는 같은 객체)."""
+        key = (category, index)
+        generator = self._generators.get(key)
+        if generator is None:
+            generator = self._generators[key] = np.random.default_rng(self.seed_sequence(category, index))
+        return generator
+
+    def bind(self, distribution: D, category: str, index: int = 0) -> D:
+        """
+        분포가 (범주, 번호) 스트림에서 샘플을 추출하도록 시드를 다시 지정합니다.
+
+        같은 키로 여러 분포를 묶으면 각 분포는 같은 시드의 별도 Generator를 가지므로,
+        분포마다 다른 키를 사용해야 합니다.
+
+        Returns:
+            D: 시드를 다시 지정한 분포 (체이닝용).
+        """
+        distribution.reseed(self.seed_sequence(category, index))
+        return distribution
+
+    def replication(self, index: int) -> "StreamManager":
+        """
+        반복 실행 index의 하위 관리자를 반환합니다.
+
+        하위 관리자의 스트림은 다른 반복 실행과 이 관리자의 스트림 모두와 겹치지
+        않으므로, 병렬 반복 실행에 각각 넘겨줄 수 있습니다.
+
+        Args:
+            index (int): 반복 실행 번호.
+        """
+        return StreamManager(self.seed_sequence(self.REPLICATION, index))
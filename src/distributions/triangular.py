@@ -1,17 +1,18 @@
 import numpy as np
 
-from src.distributions.base import Distribution
+from src.distributions.base import Distribution, SeedLike
 
 
 class Triangular(Distribution):
     """삼각 분포(Triangular Distribution)."""
 
-    def __init__(self, min_val: float, mode: float, max_val: float):
+    def __init__(self, min_val: float, mode: float, max_val: float, seed: SeedLike = None):
         """
         Args:
             min_val (float): 가능한 최솟값.
             mode (float): 최빈값 (가장 확률이 높은 값).
             max_val (float): 가능한 최댓값.
+            seed (SeedLike): 난수 생성기 시드 (정수, SeedSequence 또는 Generator).
 
         Raises:
             ValueError: min_val <= mode <= max_val 조건이 만족되지 않을 경우 발생합니다.
@@ -21,9 +22,13 @@ class Triangular(Distribution):
         self.min_val = min_val
         self.mode = mode
         self.max_val = max_val
+        super().__init__(seed)
 
     def generate(self) -> float:
-        return np.random.triangular(left=self.min_val, mode=self.mode, right=self.max_val)
+        return self.rng.triangular(left=self.min_val, mode=self.mode, right=self.max_val)
+
+    def generate_many(self, n: int) -> np.ndarray:
+        return self.rng.triangular(left=self.min_val, mode=self.mode, right=self.max_val, size=n)
 
     def __repr__(self) -> str:
         return f"Triangular(min_val={self.min_val}, mode={self.mode}, max_val={self.max_val})"
@@ -1,16 +1,17 @@
 import numpy as np
 
-from src.distributions.base import Distribution
+from src.distributions.base import Distribution, SeedLike
 
 
 class Uniform(Distribution):
     """균등 분포(Uniform Distribution)."""
 
-    def __init__(self, min_val: float, max_val: float):
+    def __init__(self, min_val: float, max_val: float, seed: SeedLike = None):
         """
         Args:
             min_val (float): 가능한 최솟값 (포함).
             max_val (float): 가능한 최댓값 (포함).
+            seed (SeedLike): 난수 생성기 시드 (정수, SeedSequence 또는 Generator).
 
         Raises:
             ValueError: min_val이 max_val보다 큰 경우 발생합니다.
@@ -19,9 +20,13 @@ class Uniform(Distribution):
             raise ValueError("min_val cannot be greater than max_val.")
         self.min_val = min_val
         self.max_val = max_val
+        super().__init__(seed)
 
     def generate(self) -> float:
-        return np.random.uniform(low=self.min_val, high=self.max_val)
+        return self.rng.uniform(low=self.min_val, high=self.max_val)
+
+    def generate_many(self, n: int) -> np.ndarray:
+        return self.rng.uniform(low=self.min_val, high=self.max_val, size=n)
 
     def __repr__(self) -> str:
         return f"Uniform(min_val={self.min_val}, max_val={self.max_val})"
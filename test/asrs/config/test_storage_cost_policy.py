@@ -1,7 +1,10 @@
+import pytest
 from pytest import approx
 
 from src.asrs.asrs import ASRS
-from src.asrs.config.storage_cost_policy import StorageCostPolicy
+from src.asrs.columnar_asrs import ColumnarASRS
+from src.asrs.config.storage_cost_policy import StorageCostPolicy, PerZoneStrategy
+from src.entity.Entity import Entity
 from src.asrs.item import Item
 from src.asrs.position import Position
 
@@ -66,4 +69,114 @@ class TestStorageCostPolicy:
         # 각 셀마다: 1초 * 0.01 * 1개 = 0.01
         # 3개 셀: 0.01 * 3 = 0.03
         expected_cost = 0.03
-        assert total_cost == approx(expected_cost)
\ No newline at end of file
+        assert total_cost == approx(expected_cost)
+
+
+class TestStorageCostStrategies:
+    """아이템 속성/적재율/구역 기반 보관유지비용 전략 테스트"""
+
+    def setup_method(self):
+        self.asrs = ASRS(max_x=2, max_y=2, max_z=4, cost=0.1, max_items_per_cell=4)
+        self.box = Entity("box", width=1.0, length=2.0, height=3.0, weight=5.0, order=0)
+
+    def _total(self, policy: StorageCostPolicy) -> float:
+        self.asrs.set_storage_cost_policy(policy)
+        return self.asrs.calculate_total_storage_cost(self.asrs.cost)
+
+    def test_per_item_sums_item_storage_costs(self):
+        """아이템별 보관 비용의 합"""
+        self.asrs.put_item(Item("1", "a", storage_cost=0.5), Position(0, 0, 0))
+        self.asrs.put_item(Item("2", "b", storage_cost=0.25), Position(1, 1, 3))
+        assert self._total(StorageCostPolicy.PER_ITEM) == approx(0.75)
+
+        self.asrs.get_item(Position(0, 0, 0))
+        assert self._total(StorageCostPolicy.PER_ITEM) == approx(0.25)
+
+    def test_volume_and_weight_use_entity(self):
+        """Entity가 있으면 부피/무게, 없으면 기본값 1"""
+        self.asrs.put_item(Item("1", "a", entity=self.box), Position(0, 0, 0))
+        self.asrs.put_item(Item("2", "b"), Position(0, 0, 0))
+        assert self._total(StorageCostPolicy.VOLUME) == approx(0.1 * (6.0 + 1.0))
+        assert self._total(StorageCostPolicy.WEIGHT) == approx(0.1 * (5.0 + 1.0))
+
+    def test_tiered_occupancy_rates_by_cell_fill_ratio(self):
+        """적재율 50% 이하 1배, 80% 이하 1.5배, 그 이상 2배"""
+        for index in range(2):
+            self.asrs.put_item(Item(f"a{index}", "a"), Position(0, 0, 0))
+        for index in range(3):
+            self.asrs.put_item(Item(f"b{index}", "b"), Position(1, 0, 0))
+        for index in range(4):
+            self.asrs.put_item(Item(f"c{index}", "c"), Position(0, 1, 0))
+        expected = 0.1 * (2 * 1.0 + 3 * 1.5 + 4 * 2.0)
+        assert self._total(StorageCostPolicy.TIERED_OCCUPANCY) == approx(expected)
+        assert self.asrs.aggregates.cost_totals[StorageCostPolicy.TIERED_OCCUPANCY] == approx(expected)
+
+    def test_tiered_occupancy_accrues_across_tier_changes(self):
+        """셀의 구간이 바뀌면 그 시각부터 셀의 모든 아이템에 새 비용율을 적용"""
+        asrs = ASRS(max_x=1, max_y=1, max_z=1, inbound_time=0.0, outbound_time=0.0, cost=1.0, cost_time=1.0,
+                    max_items_per_cell=4, storage_cost_policy=StorageCostPolicy.TIERED_OCCUPANCY)
+        cell = Position(0, 0, 0)
+        asrs.put_item(Item("a", "a"), cell)  # 25%: 1배
+        asrs.clock.advance_to(10.0)
+        asrs.put_item(Item("b", "b"), cell)  # 50%: 1배
+        asrs.put_item(Item("c", "c"), cell)  # 75%: 1.5배
+        asrs.clock.advance_to(20.0)
+        asrs.get_item(cell)  # a 출고, 50%: 1배
+        asrs.clock.advance_to(30.0)
+
+        # a: 10 * 1 + 10 * 1.5, b/c: 10 * 1.5 + 10 * 1
+        assert asrs.accrued_storage_cost() == approx(25.0 + 2 * 25.0)
+        assert asrs.accrued_storage_cost(at=20.0) == approx(25.0 + 2 * 15.0)
+
+    def test_inventory_totals_allocated_on_first_attribute_policy(self):
+        """속성 합계 배열은 속성 기반 정책을 처음 사용할 때 현재 재고로 채워 할당"""
+        self.asrs.put_item(Item("1", "a", entity=self.box), Position(0, 0, 0))
+        assert not self.asrs._inventory_totals.active
+
+        assert self._total(StorageCostPolicy.VOLUME) == approx(0.1 * 6.0)
+        assert self.asrs._inventory_totals.active
+        self.asrs.put_item(Item("2", "b", storage_cost=0.3), Position(1, 0, 0))
+        assert self._total(StorageCostPolicy.PER_ITEM) == approx(0.3 + Item("x", "x").storage_cost)
+
+    def test_columnar_asrs_rejects_unsupported_policy(self):
+        with pytest.raises(ValueError):
+            ColumnarASRS(max_x=1, max_y=1, max_z=1, storage_cost_policy=StorageCostPolicy.VOLUME)
+
+    def test_per_zone_bands_layers(self):
+        """기본 구역은 층을 아래에서부터 균등하게 나눔"""
+        self.asrs.set_storage_cost_strategy(StorageCostPolicy.PER_ZONE, PerZoneStrategy(zone_rates=(1.0, 3.0)))
+        self.asrs.put_item(Item("1", "a"), Position(0, 0, 1))
+        self.asrs.put_item(Item("2", "b"), Position(0, 0, 2))
+        assert self._total(StorageCostPolicy.PER_ZONE) == approx(0.1 * (1.0 + 3.0))
+
+    def test_per_zone_accrues_by_item_position(self):
+        """보관 시간 누적 비용도 아이템이 있는 구역의 비용율을 사용"""
+        asrs = ASRS(max_x=1, max_y=1, max_z=2, cost=1.0, cost_time=1.0,
+                    storage_cost_policy=StorageCostPolicy.PER_ZONE)
+        asrs.set_storage_cost_strategy(StorageCostPolicy.PER_ZONE, PerZoneStrategy(zone_rates=(1.0, 2.0)))
+        asrs.insert_items([(Item("1", "a"), Position(0, 0, 0)), (Item("2", "b"), Position(0, 0, 1))])
+        asrs.clock.advance_to(asrs.clock.now + 10.0)
+        assert asrs.accrued_storage_cost() == approx(30.0)
+
+    def test_snapshot_keeps_entities_and_totals(self, tmp_path):
+        """스냅샷 복원 후에도 Entity와 속성 합계가 유지됨"""
+        self.asrs.put_item(Item("1", "a", entity=self.box), Position(0, 0, 0))
+        self.asrs.put_item(Item("2", "b", entity=self.box), Position(1, 0, 0))
+        self.asrs.put_item(Item("3", "c", storage_cost=0.3), Position(1, 0, 0))
+        path = str(tmp_path / "asrs.snap")
+        self.asrs.snapshot(path)
+
+        restored = ASRS.restore(path)
+        for policy in (StorageCostPolicy.VOLUME, StorageCostPolicy.WEIGHT, StorageCostPolicy.PER_ITEM):
+            restored.set_storage_cost_policy(policy)
+            assert restored.calculate_total_storage_cost(restored.cost) == approx(self._total(policy))
+        assert restored.get_items_at_position(Position(0, 0, 0))[0].entity == self.box
+
+    def test_totals_are_vectorized_over_large_inventory(self):
+        """아이템이 많아도 합계는 셀별 배열 합으로 계산"""
+        asrs = ASRS(max_x=20, max_y=20, max_z=20, max_items_per_cell=10)
+        pairs = [(Item(str(index), "bulk", storage_cost=0.5), Position(index % 20, index // 20 % 20, index // 400))
+                 for index in range(8000)]
+        asrs.insert_items(pairs)
+        asrs.set_storage_cost_policy(StorageCostPolicy.PER_ITEM)
+        assert asrs.calculate_total_storage_cost(asrs.cost) == approx(4000.0)
@@ -1,3 +1,61 @@
+import time
+
+import pytest
+
+from src.asrs.config.simulation_clock import SimulationClock
+from src.asrs.config.work_time_config import WorkTimeConfig
+
+
 class TestWorkTimeConfig:
     def test_work_time_config(self):
-        pass
\ No newline at end of file
+        config = WorkTimeConfig()
+
+        assert config.inbound_time == 1.0
+        assert config.outbound_time == 1.0
+        assert config.realtime is False
+        assert config.clock.now == 0.0
+
+    def test_delay_time_advances_virtual_clock(self):
+        config = WorkTimeConfig()
+
+        started = time.perf_counter()
+        assert config.delay_time(3600.0) == (0.0, 3600.0)
+        assert config.delay_time(1.5) == (3600.0, 3601.5)
+
+        # 가상 시계 모드에서는 실제로 대기하지 않아야 함
+        assert time.perf_counter() - started < 1.0
+        assert config.clock.now == 3601.5
+
+    def test_delay_time_realtime_sleeps(self):
+        config = WorkTimeConfig(realtime=True)
+
+        started = time.perf_counter()
+        config.delay_time(0.05)
+
+        assert time.perf_counter() - started >= 0.05
+        assert config.clock.now == 0.05
+
+    def test_shared_clock(self):
+        clock = SimulationClock(start_time=10.0)
+        config = WorkTimeConfig(clock=clock)
+
+        config.delay_time(2.0)
+        assert clock.now == 12.0
+
+
+class TestSimulationClock:
+    def test_advance(self):
+        clock = SimulationClock()
+        assert clock.advance(2.5) == 2.5
+        assert clock.now == 2.5
+
+    def test_advance_negative_raises_error(self):
+        clock = SimulationClock()
+        with pytest.raises(ValueError, match="Duration cannot be negative"):
+            clock.advance(-1.0)
+
+    def test_advance_to(self):
+        clock = SimulationClock(start_time=5.0)
+        assert clock.advance_to(8.0) == 8.0
+        # 과거 시각으로는 되돌아가지 않음
+        assert clock.advance_to(3.0) == 8.0
@@ -1,5 +1,5 @@
 import pytest
-from src.asrs import ASRS, Item, Position, OutputPolicy
+from src.asrs import ASRS, Item, Position, OutputPolicy, OperationType
 
 
 class TestASRS:
@@ -155,4 +155,47 @@ class TestASRS:
 
             # 그 위치에서 아이템 출고
             retrieved_item = self.asrs.stacker_crane_get(item_positions[0])
-            assert retrieved_item.id == expected_item.id
\ No newline at end of file
+            assert retrieved_item.id == expected_item.id
+
+    def test_virtual_clock_records_operations(self):
+        """가상 시계 기반 작업 시각 기록 테스트"""
+        asrs = ASRS(max_x=2, max_y=2, max_z=2, inbound_time=2.0, outbound_time=3.0)
+        position = Position(1, 0, 1)
+
+        asrs.put_item(self.item1, position)
+        asrs.get_item(position)
+
+        assert asrs.clock.now == 5.0
+        put_record, get_record = asrs.operation_log
+        assert put_record.operation == OperationType.PUT
+        assert put_record.item_id == "ITEM001"
+        assert (put_record.start_time, put_record.finish_time) == (0.0, 2.0)
+        assert get_record.operation == OperationType.GET
+        assert get_record.position == position
+        assert (get_record.start_time, get_record.finish_time) == (2.0, 5.0)
+
+    def test_failed_operations_do_not_advance_clock(self):
+        """실패한 작업은 시계를 진행시키지 않음"""
+        self.asrs.get_item(Position(0, 0, 0))
+        self.asrs.put_item(self.item1, Position(9, 9, 9))
+
+        assert self.asrs.clock.now == 0.0
+        assert self.asrs.operation_log == []
+
+    def test_iter_items_at_position(self):
+        """복사 없는 위치별 아이템 조회 테스트"""
+        position = Position(0, 0, 0)
+        assert list(self.asrs.iter_items_at_position(position)) == []
+        assert list(self.asrs.iter_items_at_position(Position(9, 9, 9))) == []
+
+        self.asrs.put_item(self.item1, position)
+        view = self.asrs.iter_items_at_position(position)
+        assert list(view) == [self.item1]
+
+    def test_create_item_uses_simulation_clock(self):
+        """시뮬레이션 시계 기준 아이템 생성 테스트"""
+        self.asrs.put_item(self.item1, Position(0, 0, 0))
+        item = self.asrs.create_item("ITEM009", "Clock Item", priority=4)
+
+        assert item.created_time == self.asrs.clock.now == 1.0
+        assert item.priority == 4
@@ -0,0 +1,92 @@
+import asyncio
+import time
+
+from src.asrs.asrs import ASRS
+from src.asrs.async_asrs import AsyncASRS
+from src.asrs.position import Position
+
+
+class TestAsyncASRS:
+    def setup_method(self):
+        """각 테스트 전에 실행되는 설정"""
+        self.asrs = ASRS(max_x=2, max_y=3, max_z=2, crane_count=2)
+        self.async_asrs = AsyncASRS(self.asrs)
+
+    def test_put_and_get(self):
+        """비동기 입출고 결과는 동기 API와 같음"""
+        async def scenario():
+            item = self.asrs.create_item("a", "item")
+            assert await self.async_asrs.put_item(item, Position(0, 1, 1))
+            assert await self.async_asrs.get_item(Position(0, 1, 1)) is item
+            assert await self.async_asrs.get_item(Position(0, 1, 1)) is None
+
+        asyncio.run(scenario())
+        assert self.asrs.clock.now == 2.0
+        assert len(self.asrs.operation_log) == 2
+
+    def test_batch_and_auto_slotting(self):
+        async def scenario():
+            items = [self.asrs.create_item(str(index), "item") for index in range(3)]
+            results = await self.async_asrs.put_items([(item, Position(1, 2, 0)) for item in items])
+            position = await self.async_asrs.put_item_auto(self.asrs.create_item("auto", "item"))
+            retrieved = await self.async_asrs.get_items([Position(1, 2, 0), position])
+            return results, retrieved
+
+        results, retrieved = asyncio.run(scenario())
+        assert results == [True, True, True]
+        assert [item.id for item in retrieved] == ["0", "auto"]
+
+    def test_concurrent_crane_operations(self):
+        """여러 코루틴의 크레인 작업이 한 이벤트 루프에서 처리됨"""
+        async def scenario():
+            puts = [self.async_asrs.stacker_crane_put(self.asrs.create_item(f"{x}-{y}", "item"), Position(x, y, 0))
+                    for x in range(2) for y in range(3)]
+            return await asyncio.gather(*puts)
+
+        assert asyncio.run(scenario()) == [True] * 6
+        assert self.async_asrs.get_total_item_count() == 6
+        assert [crane.operation_count for crane in self.asrs.crane_fleet.cranes] == [3, 3]
+
+    def test_realtime_delays_do_not_block_other_cranes(self):
+        """realtime 모드의 대기는 asyncio.sleep이므로 다른 크레인 작업과 겹침"""
+        asrs = ASRS(max_x=2, max_y=1, max_z=1, inbound_time=0.1, realtime=True, crane_count=2)
+        async_asrs = AsyncASRS(asrs)
+
+        async def scenario():
+            await asyncio.gather(
+                async_asrs.stacker_crane_put(asrs.create_item("a", "item"), Position(0, 0, 0)),
+                async_asrs.stacker_crane_put(asrs.create_item("b", "item"), Position(1, 0, 0)))
+
+        started = time.perf_counter()
+        asyncio.run(scenario())
+        elapsed = time.perf_counter() - started
+
+        assert 0.1 <= elapsed < 0.19
+
+    def test_realtime_same_crane_is_serialized(self):
+        """같은 크레인의 작업은 순서대로 대기"""
+        asrs = ASRS(max_x=1, max_y=2, max_z=1, inbound_time=0.05, realtime=True)
+        async_asrs = AsyncASRS(asrs)
+
+        async def scenario():
+            await asyncio.gather(
+                async_asrs.stacker_crane_put(asrs.create_item("a", "item"), Position(0, 0, 0)),
+                async_asrs.stacker_crane_put(asrs.create_item("b", "item"), Position(0, 1, 0)))
+
+        started = time.perf_counter()
+        asyncio.run(scenario())
+
+        assert time.perf_counter() - started >= 0.1
+
+
+class TestWorkTimeConfigDeferral:
+    def test_run_deferred_returns_sleep(self):
+        asrs = ASRS(max_x=1, max_y=1, max_z=1, inbound_time=5.0, realtime=True)
+        started = time.perf_counter()
+
+        result, delay = asrs.work_config.run_deferred(asrs.put_item, asrs.create_item("a", "item"), Position(0, 0, 0))
+
+        assert result is True
+        assert delay == 5.0
+        assert time.perf_counter() - started < 1.0
+        assert asrs.clock.now == 5.0
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+from pytest import approx
+from src.asrs.asrs import ASRS
+from src.asrs.batch import accept_within_capacity, flat_cell_indices, rank_within_groups
+from src.asrs.columnar_asrs import ColumnarASRS
+from src.asrs.item import Item
+from src.asrs.operation_record import OperationType
+from src.asrs.output_policy import OutputPolicy
+from src.asrs.position import Position
+from src.asrs.travel_time_model import TravelTimeModel
+
+
+class TestBatchHelpers:
+    def test_flat_cell_indices(self):
+        flat, valid = flat_cell_indices([Position(1, 2, 3), Position(4, 0, 0), Position(0, 0, 1)], 2, 3, 4)
+        np.testing.assert_array_equal(valid, [True, False, True])
+        np.testing.assert_array_equal(flat[valid], [23, 1])
+
+    def test_rank_within_groups(self):
+        np.testing.assert_array_equal(rank_within_groups(np.array([5, 3, 5, 5, 3])), [0, 0, 1, 2, 1])
+        assert rank_within_groups(np.array([], dtype=np.int64)).size == 0
+
+    def test_accept_within_capacity(self):
+        flat = np.array([0, 0, 1, 0, 1])
+        valid = np.array([True, True, True, True, False])
+        current_counts = np.array([1, 1, 0, 1, 0])
+        np.testing.assert_array_equal(
+            accept_within_capacity(flat, valid, current_counts, capacity=3), [True, True, True, False, False])
+
+
+@pytest.mark.parametrize("backend", [ASRS, ColumnarASRS])
+class TestBatchOperations:
+    def test_put_items_matches_sequential_puts(self, backend):
+        batch = backend(max_x=2, max_y=2, max_z=1, max_items_per_cell=2)
+        sequential = backend(max_x=2, max_y=2, max_z=1, max_items_per_cell=2)
+        requests = [(Item(f"ITEM{i}", "Item", priority=i % 3), position) for i, position in enumerate(
+            [Position(0, 0, 0), Position(1, 1, 0), Position(0, 0, 0), Position(5, 0, 0), Position(0, 0, 0),
+             Position(1, 1, 0), Position(0, 1, 0)])]
+
+        results = batch.put_items(requests)
+
+        assert results == [sequential.put_item(item, position) for item, position in requests]
+        assert results == [True, True, True, False, False, True, True]
+        assert batch.get_total_item_count() == 5
+        assert batch.clock.now == sequential.clock.now == 5.0
+        assert [(r.start_time, r.finish_time) for r in batch.operation_log] == \
+               [(r.start_time, r.finish_time) for r in sequential.operation_log]
+        for position in (Position(0, 0, 0), Position(1, 1, 0), Position(0, 1, 0)):
+            assert batch.get_items_at_position(position) == sequential.get_items_at_position(position)
+
+    def test_get_items(self, backend):
+        asrs = backend(max_x=2, max_y=2, max_z=1)
+        asrs.set_output_policy(OutputPolicy.LIFO)
+        position = Position(1, 0, 0)
+        items = [Item(f"ITEM{i}", "Item") for i in range(3)]
+        asrs.put_items([(item, position) for item in items])
+
+        results = asrs.get_items([position, Position(0, 0, 0), position, Position(9, 9, 9)])
+
+        assert results == [items[2], None, items[1], None]
+        assert asrs.get_total_item_count() == 1
+        get_records = [r for r in asrs.operation_log if r.operation == OperationType.GET]
+        assert [r.item_id for r in get_records] == ["ITEM2", "ITEM1"]
+        assert asrs.clock.now == 5.0
+
+    def test_stacker_crane_batch(self, backend):
+        asrs = backend(max_x=2, max_y=2, max_z=2)
+        pairs = [(Item("ITEM001", "Item"), Position(0, 1, 1)), (Item("ITEM002", "Item"), Position(1, 1, 1))]
+
+        assert asrs.stacker_crane_put_items(pairs) == [True, True]
+        assert asrs.stacker_crane.current_position == Position(1, 1, 1)
+        assert [item.id for item in asrs.stacker_crane_get_items([Position(0, 1, 1)])] == ["ITEM001"]
+        assert asrs.stacker_crane.current_position == Position(0, 1, 1)
+
+    def test_stacker_crane_batch_interleaves_moves(self, backend):
+        """처리될 요청만 이동하며, 요청마다 이동한 뒤 바로 입고/출고"""
+        model = TravelTimeModel(3, 3, 3)
+        asrs = backend(max_x=3, max_y=3, max_z=3, max_items_per_cell=1, travel_model=model)
+        crane = asrs.stacker_crane
+        near, far = Position(0, 1, 0), Position(2, 2, 2)
+        pairs = [(Item("A", "Item"), near), (Item("B", "Item"), Position(9, 9, 9)),
+                 (Item("C", "Item"), near), (Item("D", "Item"), far)]
+
+        assert asrs.stacker_crane_put_items(pairs) == [True, False, False, True]
+        assert crane.move_count == 2
+        first, second = asrs.operation_log
+        assert first.start_time == approx(model.travel_time(crane.home_position, near))
+        assert second.start_time == approx(first.finish_time + model.travel_time(near, far))
+
+        assert asrs.stacker_crane_get_items([far, far, near]) == [pairs[3][0], None, pairs[0][0]]
+        assert crane.move_count == 4
+
+    def test_empty_batches(self, backend):
+        asrs = backend(max_x=1, max_y=1, max_z=1)
+        assert asrs.put_items([]) == []
+        assert asrs.get_items([]) == []
@@ -74,3 +74,31 @@ class TestCell:
         removed_item = self.cell.remove_item_priority()
         # 같은 우선순위일 때는 max() 함수의 동작에 따라 첫 번째가 선택됨
         assert removed_item in [self.item2, item_same_priority]
+
+    def test_item_count(self):
+        assert self.cell.item_count() == 0
+        self.cell.add_item(self.item1)
+        self.cell.add_item(self.item2)
+        assert self.cell.item_count() == 2
+        assert len(self.cell) == 2
+
+    def test_items_view_reflects_cell_without_copy(self):
+        view = self.cell.items_view()
+        assert len(view) == 0
+
+        self.cell.add_item(self.item1)
+        self.cell.add_item(self.item2)
+
+        # 뷰는 셀의 현재 상태를 그대로 반영
+        assert len(view) == 2
+        assert list(view) == [self.item1, self.item2]
+        assert self.item1 in view
+        assert self.item3 not in view
+
+        self.cell.remove_item_fifo()
+        assert list(view) == [self.item2]
+
+    def test_items_view_is_read_only(self):
+        view = self.cell.items_view()
+        assert not hasattr(view, "append")
+        assert not hasattr(view, "clear")
@@ -0,0 +1,72 @@
+import pytest
+from src.asrs.asrs import ASRS
+from src.asrs.cell import Cell
+from src.asrs.cell_container import DequeItemContainer, PriorityItemContainer, create_item_container
+from src.asrs.item import Item
+from src.asrs.output_policy import OutputPolicy
+from src.asrs.position import Position
+
+
+class TestItemContainers:
+    def setup_method(self):
+        self.item1 = Item("ITEM001", "First Item", priority=1)
+        self.item2 = Item("ITEM002", "Second Item", priority=3)
+        self.item3 = Item("ITEM003", "Third Item", priority=3)
+        self.item4 = Item("ITEM004", "Fourth Item", priority=2)
+        self.items = [self.item1, self.item2, self.item3, self.item4]
+
+    def test_create_item_container(self):
+        assert isinstance(create_item_container(OutputPolicy.FIFO), DequeItemContainer)
+        assert isinstance(create_item_container(OutputPolicy.LIFO), DequeItemContainer)
+        assert isinstance(create_item_container(OutputPolicy.PRIORITY), PriorityItemContainer)
+
+    @pytest.mark.parametrize("container_class", [DequeItemContainer, PriorityItemContainer])
+    def test_retrieval_order(self, container_class):
+        container = container_class(self.items)
+
+        assert container.ordered_items() == self.items
+        assert container.pop_priority() == self.item2  # 같은 우선순위에서는 먼저 들어온 것
+        assert container.pop_fifo() == self.item1
+        assert container.pop_lifo() == self.item4
+        assert container.pop_priority() == self.item3
+        assert len(container) == 0
+        assert container.pop_fifo() is None
+        assert container.pop_lifo() is None
+        assert container.pop_priority() is None
+
+    def test_priority_container_keeps_fifo_among_ties(self):
+        container = PriorityItemContainer()
+        same_priority = [Item(f"ITEM{i}", "Same", priority=5) for i in range(10)]
+        for item in same_priority:
+            container.add(item)
+
+        assert [container.pop_priority() for _ in range(10)] == same_priority
+
+
+class TestCellPolicySwitch:
+    def test_set_policy_keeps_insertion_order(self):
+        cell = Cell(Position(0, 0, 0))
+        items = [Item("ITEM001", "First", priority=1), Item("ITEM002", "Second", priority=9),
+                 Item("ITEM003", "Third", priority=5)]
+        for item in items:
+            cell.add_item(item)
+
+        cell.set_policy(OutputPolicy.PRIORITY)
+        assert cell.get_items() == items
+        assert cell.remove_item_priority() == items[1]
+
+        cell.set_policy(OutputPolicy.FIFO)
+        assert cell.get_items() == [items[0], items[2]]
+        assert cell.remove_item_fifo() == items[0]
+
+    def test_asrs_policy_switch_reindexes_cells(self):
+        asrs = ASRS(max_x=2, max_y=2, max_z=2)
+        position = Position(1, 1, 1)
+        asrs.put_item(Item("ITEM001", "First", priority=1), position)
+        asrs.put_item(Item("ITEM002", "Second", priority=2), position)
+
+        asrs.set_output_policy(OutputPolicy.PRIORITY)
+        assert asrs.cells[position].policy == OutputPolicy.PRIORITY
+        # 정책 변경 이후 생성되는 셀도 같은 정책을 사용
+        assert asrs.cells[Position(0, 0, 0)].policy == OutputPolicy.PRIORITY
+        assert asrs.get_item(position).id == "ITEM002"
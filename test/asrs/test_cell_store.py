@@ -0,0 +1,83 @@
+import pytest
+from src.asrs.asrs import ASRS
+from src.asrs.cell_store import CellStore
+from src.asrs.item import Item
+from src.asrs.position import Position
+
+
+class TestCellStore:
+    def setup_method(self):
+        self.store = CellStore(2, 3, 4)
+
+    def test_len_is_rack_volume(self):
+        assert len(self.store) == 24
+        assert self.store.allocated_count() == 0
+
+    def test_iterates_all_positions_in_order(self):
+        positions = list(self.store)
+        assert len(positions) == 24
+        assert positions[0] == Position(0, 0, 0)
+        assert positions[1] == Position(0, 0, 1)
+        assert positions[-1] == Position(1, 2, 3)
+        # 순회만으로는 셀이 생성되지 않음
+        assert self.store.allocated_count() == 0
+
+    def test_getitem_creates_cell_on_first_access(self):
+        position = Position(1, 2, 3)
+        cell = self.store[position]
+
+        assert cell.position == position
+        assert self.store[position] is cell
+        assert self.store.allocated_count() == 1
+
+    def test_get_does_not_create_cell(self):
+        assert self.store.get(Position(0, 0, 0)) is None
+        assert self.store.allocated_count() == 0
+
+    def test_values_and_items_do_not_create_cells(self):
+        """values()/items()는 생성되지 않은 좌표를 빈 임시 셀로 반환"""
+        stored = self.store[Position(0, 1, 2)]
+        stored.add_item(Item("ITEM001", "First Item"))
+
+        pairs = list(self.store.items())
+        cells = list(self.store.values())
+
+        assert [position for position, _ in pairs] == list(self.store)
+        assert len(cells) == 24
+        assert dict(pairs)[Position(0, 1, 2)] is stored
+        assert sum(cell.item_count() for cell in cells) == 1
+        assert all(cell.is_empty() for position, cell in pairs if position != Position(0, 1, 2))
+        assert self.store.allocated_count() == 1
+
+    def test_out_of_bounds_position(self):
+        assert Position(2, 0, 0) not in self.store
+        with pytest.raises(KeyError):
+            self.store[Position(2, 0, 0)]
+
+    def test_is_empty_at(self):
+        position = Position(0, 1, 2)
+        assert self.store.is_empty_at(position) is True
+
+        self.store[position].add_item(Item("ITEM001", "First Item"))
+        assert self.store.is_empty_at(position) is False
+
+
+class TestSparseASRS:
+    def test_large_rack_construction_is_lazy(self):
+        asrs = ASRS(max_x=1000, max_y=100, max_z=50)
+
+        assert len(asrs.cells) == 5_000_000
+        assert asrs.cells.allocated_count() == 0
+
+    def test_only_written_cells_are_allocated(self):
+        asrs = ASRS(max_x=1000, max_y=100, max_z=50)
+        position = Position(999, 99, 49)
+
+        assert asrs.get_item(position) is None
+        assert asrs.get_items_at_position(position) == []
+        assert asrs.cells.allocated_count() == 0
+
+        asrs.put_item(Item("ITEM001", "First Item"), position)
+        assert asrs.cells.allocated_count() == 1
+        assert asrs.find_item_positions("ITEM001") == [position]
+        assert asrs.get_cell_capacity_info(Position(0, 0, 0))["current_items"] == 0
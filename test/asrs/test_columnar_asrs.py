@@ -0,0 +1,126 @@
+import random
+
+import numpy as np
+import pytest
+from pytest import approx
+from src.asrs.asrs import ASRS
+from src.asrs.columnar_asrs import ColumnarASRS
+from src.asrs.item import Item
+from src.asrs.output_policy import OutputPolicy
+from src.asrs.position import Position
+
+
+class TestColumnarASRS:
+    def setup_method(self):
+        self.asrs = ColumnarASRS(max_x=3, max_y=3, max_z=3, max_items_per_cell=3)
+        self.item1 = Item("ITEM001", "First Item", priority=1)
+        self.item2 = Item("ITEM002", "Second Item", priority=3)
+        self.item3 = Item("ITEM003", "Third Item", priority=3)
+        self.position = Position(1, 2, 0)
+
+    def _put_all(self):
+        for item in (self.item1, self.item2, self.item3):
+            assert self.asrs.put_item(item, self.position) is True
+
+    def test_put_and_capacity(self):
+        self._put_all()
+        assert self.asrs.put_item(Item("ITEM004", "Overflow"), self.position) is False
+        assert self.asrs.put_item(self.item1, Position(5, 5, 5)) is False
+        assert self.asrs.get_items_at_position(self.position) == [self.item1, self.item2, self.item3]
+        assert self.asrs.get_cell_capacity_info(self.position)["available_capacity"] == 0
+
+    @pytest.mark.parametrize("policy, expected", [
+        (OutputPolicy.FIFO, ["ITEM001", "ITEM002", "ITEM003"]),
+        (OutputPolicy.LIFO, ["ITEM003", "ITEM002", "ITEM001"]),
+        (OutputPolicy.PRIORITY, ["ITEM002", "ITEM003", "ITEM001"]),
+    ])
+    def test_output_policies(self, policy, expected):
+        self._put_all()
+        self.asrs.set_output_policy(policy)
+
+        assert [self.asrs.get_item(self.position).id for _ in range(3)] == expected
+        assert self.asrs.get_item(self.position) is None
+        assert self.asrs.get_total_item_count() == 0
+        assert self.position in self.asrs.get_empty_cells()
+
+    def test_queries(self):
+        other = Position(0, 0, 1)
+        self._put_all()
+        self.asrs.put_item(Item("ITEM001", "Again"), other)
+
+        assert sorted(self.asrs.find_item_positions("ITEM001"), key=repr) == [other, self.position]
+        assert self.asrs.find_item_positions("UNKNOWN") == []
+        assert len(self.asrs.get_empty_cells()) == 25
+        assert len(self.asrs.get_available_cells()) == 26
+        assert self.asrs.calculate_total_storage_cost(0.01) == approx(0.04)
+        assert self.asrs.total_item_storage_cost() == approx(0.04)
+        assert self.asrs.cell_counts()[1, 2, 0] == 3
+
+        columns = self.asrs.inventory_columns()
+        assert sorted(columns["item_ids"].tolist()) == ["ITEM001", "ITEM001", "ITEM002", "ITEM003"]
+        np.testing.assert_array_equal(np.sort(columns["priorities"]), [0, 1, 3, 3])
+
+    def test_stacker_crane_operations(self):
+        assert self.asrs.stacker_crane_put(self.item1, self.position) is True
+        assert self.asrs.stacker_crane_get(self.position) is self.item1
+        assert self.asrs.clock.now == 2.0
+
+    @pytest.mark.parametrize("policy", list(OutputPolicy))
+    def test_matches_object_backend(self, policy):
+        rng = random.Random(7)
+        reference = ASRS(max_x=2, max_y=2, max_z=2, max_items_per_cell=4)
+        reference.set_output_policy(policy)
+        self.asrs = ColumnarASRS(max_x=2, max_y=2, max_z=2, max_items_per_cell=4)
+        self.asrs.set_output_policy(policy)
+        positions = [Position(x, y, z) for x in range(2) for y in range(2) for z in range(2)]
+
+        for step in range(500):
+            position = rng.choice(positions)
+            if rng.random() < 0.55:
+                item = Item(f"ITEM{step % 13}", "Item", priority=rng.randint(0, 3))
+                assert self.asrs.put_item(item, position) == reference.put_item(item, position)
+            else:
+                assert self.asrs.get_item(position) is reference.get_item(position)
+
+        assert self.asrs.get_total_item_count() == reference.get_total_item_count()
+        for position in positions:
+            assert self.asrs.get_items_at_position(position) == reference.get_items_at_position(position)
+
+    @pytest.mark.parametrize("policy", list(OutputPolicy))
+    def test_batches_match_object_backend(self, policy):
+        """일괄 입고/출고를 섞어도 객체 백엔드와 같은 재고"""
+        rng = random.Random(11)
+        reference = ASRS(max_x=2, max_y=2, max_z=2, max_items_per_cell=5)
+        reference.set_output_policy(policy)
+        self.asrs = ColumnarASRS(max_x=2, max_y=2, max_z=2, max_items_per_cell=5)
+        self.asrs.set_output_policy(policy)
+        positions = [Position(x, y, z) for x in range(2) for y in range(2) for z in range(2)]
+
+        for step in range(100):
+            if rng.random() < 0.5:
+                pairs = [(Item(f"ITEM{step}-{index}", "Item", priority=rng.randint(0, 3)), rng.choice(positions))
+                         for index in range(rng.randint(1, 8))]
+                assert self.asrs.put_items(pairs) == reference.put_items(pairs)
+            else:
+                batch = [rng.choice(positions) for _ in range(rng.randint(1, 6))]
+                assert self.asrs.get_items(batch) == reference.get_items(batch)
+
+        for position in positions:
+            assert self.asrs.get_items_at_position(position) == reference.get_items_at_position(position)
+        assert sorted(item.id for item in self.asrs.get_total_items()) == \
+            sorted(item.id for item in reference.get_total_items())
+
+    def test_rows_are_densely_packed(self):
+        """컬럼 크기는 셀 용량이 아니라 아이템 수에 비례"""
+        asrs = ColumnarASRS(max_x=10, max_y=10, max_z=10, max_items_per_cell=1000)
+        pairs = [(Item(str(index), "Item"), Position(index % 10, index // 10 % 10, index // 100 % 10))
+                 for index in range(1500)]
+        assert all(asrs.put_items(pairs))
+        assert asrs.item_codes.size < 2 * 1500
+
+        asrs.get_items([position for _, position in pairs[:1000]])
+        assert asrs.get_total_item_count() == 500
+        assert asrs.total_item_storage_cost() == approx(500 * Item("x", "x").storage_cost)
+        # FIFO이므로 셀마다 먼저 들어온 아이템이 출고됨
+        assert {item.id for item in asrs.get_total_items()} == {str(index) for index in range(1000, 1500)}
+        assert asrs.find_item_positions("1499") == [pairs[1499][1]]
@@ -0,0 +1,113 @@
+from pytest import approx
+from src.asrs.asrs import ASRS
+from src.asrs.operation_journal import OperationJournal
+from src.asrs.position import Position
+from src.asrs.travel_time_model import TravelTimeModel
+
+
+class TestStorageCostAccrual:
+    def setup_method(self):
+        """각 테스트 전에 실행되는 설정"""
+        # 아이템 하나의 비용: cost_time(2초)마다 0.5
+        self.asrs = ASRS(max_x=2, max_y=2, max_z=1, inbound_time=1.0, outbound_time=1.0, cost=0.5, cost_time=2.0)
+
+    def test_cost_accrues_while_stored(self):
+        """보관 중인 아이템의 비용은 시간에 비례해 쌓임"""
+        self.asrs.put_item(self.asrs.create_item("a", "item"), Position(0, 0, 0))  # 시각 1에 입고
+
+        assert self.asrs.accrued_storage_cost() == approx(0.0)
+        assert self.asrs.accrued_storage_cost(at=5.0) == approx(0.5 * 4.0 / 2.0)
+
+    def test_retrieved_item_stops_accruing(self):
+        """출고된 아이템은 출고 시각까지의 비용만 남음"""
+        self.asrs.put_item(self.asrs.create_item("a", "item"), Position(0, 0, 0))  # 1
+        self.asrs.put_item(self.asrs.create_item("b", "item"), Position(0, 1, 0))  # 2
+        self.asrs.clock.advance(8.0)  # 10
+        self.asrs.get_item(Position(0, 0, 0))  # 시각 10에 출고 시작
+
+        expected_at_20 = 0.5 * (10.0 - 1.0) / 2.0 + 0.5 * (20.0 - 2.0) / 2.0
+        assert self.asrs.accrued_storage_cost(at=20.0) == approx(expected_at_20)
+
+    def test_matches_scan_over_operation_log(self):
+        """운영 기록으로 계산한 보관 시간 합과 일치"""
+        for index in range(6):
+            self.asrs.put_item(self.asrs.create_item(str(index), "item"), Position(index % 2, 0, 0))
+            self.asrs.clock.advance(index)
+        self.asrs.get_items([Position(0, 0, 0), Position(1, 0, 0)])
+        self.asrs.put_items([(self.asrs.create_item("batch", "item"), Position(1, 1, 0))])
+
+        now = self.asrs.clock.now
+        stored = sum(now - item.stored_time for item in self.asrs.get_total_items())
+        closed = self.asrs.cost_accrual.closed
+        assert self.asrs.accrued_storage_cost() == approx((closed + 0.5 * stored) / 2.0)
+        assert self.asrs.cost_accrual.open_rate == approx(0.5 * self.asrs.get_total_item_count())
+
+    def test_cost_change_applies_from_now(self):
+        """비용율이 바뀌면 그 시각부터 새 비용율로 쌓임"""
+        self.asrs.put_item(self.asrs.create_item("a", "item"), Position(0, 0, 0))  # 1
+        self.asrs.clock.advance_to(5.0)
+        self.asrs.cost = 1.0
+
+        assert self.asrs.accrued_storage_cost(at=9.0) == approx(0.5 * 4.0 / 2.0 + 1.0 * 4.0 / 2.0)
+        self.asrs.clock.advance_to(9.0)
+        self.asrs.get_item(Position(0, 0, 0))
+        assert self.asrs.accrued_storage_cost(at=100.0) == approx(3.0)
+
+    def test_crane_timelines(self):
+        """크레인마다 시계가 달라도 입고/출고 시각 기준으로 누적"""
+        asrs = ASRS(max_x=2, max_y=2, max_z=1, cost=1.0, cost_time=1.0, crane_count=2,
+                    travel_model=TravelTimeModel(2, 2, 1))
+        asrs.stacker_crane_put(asrs.create_item("a", "item"), Position(0, 1, 0))
+        asrs.stacker_crane_put(asrs.create_item("b", "item"), Position(1, 1, 0))
+        stored_times = [item.stored_time for item in asrs.get_total_items()]
+
+        assert stored_times[0] == approx(stored_times[1])
+        assert asrs.accrued_storage_cost(at=10.0) == approx(2 * (10.0 - stored_times[0]))
+
+    def test_default_time_covers_crane_timelines(self):
+        """크레인 시계가 자동창고 시계보다 앞서도 기본 기준 시각의 누적 비용은 음수가 아님"""
+        asrs = ASRS(max_x=2, max_y=2, max_z=1, cost=1.0, cost_time=1.0, crane_count=2,
+                    travel_model=TravelTimeModel(2, 2, 1))
+        asrs.stacker_crane_put(asrs.create_item("a", "item"), Position(0, 1, 0))
+        stored_time = asrs.get_total_items()[0].stored_time
+
+        assert stored_time > asrs.clock.now
+        assert asrs.accrued_storage_cost() == approx(0.0)
+        assert asrs.accrued_storage_cost(at=asrs.clock.now) == 0.0
+        # 비용율을 바꾸면 모든 크레인 시계 이후부터 새 비용율로 적분
+        asrs.cost = 2.0
+        makespan = asrs.crane_fleet.makespan
+        assert asrs.accrued_storage_cost(at=makespan + 1.0) == approx(makespan - stored_time + 2.0)
+
+    def test_batch_matches_sequential_operations(self):
+        """일괄 입고/출고도 하나씩 처리한 것과 같은 시각에 반영되어 누적 비용이 같음"""
+        positions = [Position(index % 2, index // 2, 0) for index in range(4)]
+        sequential = ASRS(max_x=2, max_y=2, max_z=1, inbound_time=1.0, outbound_time=1.0, cost=0.5, cost_time=2.0)
+        for index, position in enumerate(positions):
+            sequential.put_item(sequential.create_item(str(index), "item"), position)
+        self.asrs.put_items([(self.asrs.create_item(str(index), "item"), position)
+                             for index, position in enumerate(positions)])
+
+        assert [item.stored_time for item in self.asrs.get_total_items()] == approx([1.0, 2.0, 3.0, 4.0])
+        assert self.asrs.accrued_storage_cost(at=10.0) == approx(sequential.accrued_storage_cost(at=10.0))
+
+        for position in positions[:2]:
+            sequential.get_item(position)
+        self.asrs.get_items(positions[:2])
+        assert self.asrs.accrued_storage_cost(at=20.0) == approx(sequential.accrued_storage_cost(at=20.0))
+
+    def test_replay_matches_batched_run(self, tmp_path):
+        """저널을 다시 적용해도 일괄 작업의 누적 비용이 원래 실행과 같음"""
+        path = str(tmp_path / "ops.journal")
+        journal = OperationJournal(path)
+        asrs = ASRS(max_x=2, max_y=2, max_z=1, inbound_time=1.0, outbound_time=1.0, cost=0.5, cost_time=2.0,
+                    journal=journal)
+        asrs.put_items([(asrs.create_item(str(index), "item"), Position(index % 2, index // 2, 0))
+                        for index in range(4)])
+        asrs.get_items([Position(0, 0, 0), Position(1, 0, 0)])
+        journal.close()
+
+        replayed = ASRS(max_x=2, max_y=2, max_z=1, inbound_time=1.0, outbound_time=1.0, cost=0.5, cost_time=2.0)
+        OperationJournal.replay(path, replayed)
+
+        assert replayed.accrued_storage_cost(at=20.0) == approx(asrs.accrued_storage_cost(at=20.0))
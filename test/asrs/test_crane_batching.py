@@ -0,0 +1,102 @@
+import pytest
+from pytest import approx
+from src.asrs.asrs import ASRS
+from src.asrs.crane_request import BatchingPolicy
+from src.asrs.position import Position
+
+
+class TestBatchingPolicy:
+    def test_requires_a_release_condition(self):
+        with pytest.raises(ValueError):
+            BatchingPolicy()
+        with pytest.raises(ValueError):
+            BatchingPolicy(max_batch_size=0)
+
+    def test_deadline_only_for_high_priority(self):
+        policy = BatchingPolicy(time_window=1.0, deadline_priority=2, max_delay=3.0)
+        assert policy.deadline_for(2, 10.0) == 13.0
+        assert policy.deadline_for(1, 10.0) is None
+
+
+class TestCraneBatching:
+    def setup_method(self):
+        """각 테스트 전에 실행되는 설정"""
+        self.asrs = ASRS(max_x=1, max_y=10, max_z=1, inbound_time=1.0, outbound_time=1.0)
+        self.crane = self.asrs.stacker_crane
+
+    def test_released_on_batch_size(self):
+        """대기 요청 수가 max_batch_size가 되면 일괄 처리"""
+        self.asrs.set_crane_batching(BatchingPolicy(max_batch_size=3))
+        requests = [self.crane.submit_put(self.asrs.create_item(str(y), "item"), Position(0, y, 0))
+                    for y in (9, 1)]
+
+        assert self.crane.queue_depth == 2
+        assert not any(request.completed for request in requests)
+
+        requests.append(self.crane.submit_put(self.asrs.create_item("5", "item"), Position(0, 5, 0)))
+
+        assert self.crane.queue_depth == 0
+        assert all(request.completed and request.result for request in requests)
+        assert self.crane.batch_count == 1
+
+    def test_released_on_time_window(self):
+        """가장 오래된 요청이 time_window만큼 기다리면 일괄 처리"""
+        self.asrs.set_crane_batching(BatchingPolicy(time_window=5.0))
+        request = self.crane.submit_put(self.asrs.create_item("a", "item"), Position(0, 3, 0))
+
+        self.asrs.clock.advance(4.0)
+        assert self.crane.poll() == []
+
+        self.asrs.clock.advance(1.0)
+        assert self.crane.poll() == [request]
+        assert request.start_time == approx(5.0)
+        assert self.crane.mean_request_wait_time == approx(5.0)
+
+    def test_time_window_checked_only_on_submit_or_poll(self):
+        """시계만 진행해서는 처리되지 않고 다음 요청이나 poll에서 처리"""
+        self.asrs.set_crane_batching(BatchingPolicy(time_window=5.0))
+        first = self.crane.submit_put(self.asrs.create_item("a", "item"), Position(0, 3, 0))
+
+        self.asrs.clock.advance(8.0)
+        assert not first.completed and self.crane.queue_depth == 1
+
+        second = self.crane.submit_put(self.asrs.create_item("b", "item"), Position(0, 4, 0))
+        assert first.completed and second.completed
+        assert first.start_time == approx(8.0)
+
+    def test_batch_is_resequenced(self):
+        """묶음은 가까운 요청부터 처리되고 이동 시간 절감이 기록됨"""
+        requests = [self.crane.submit_put(self.asrs.create_item(str(y), "item"), Position(0, y, 0))
+                    for y in (9, 1, 5)]
+
+        sequence = self.crane.flush()
+
+        assert [request.position.y for request in sequence] == [1, 5, 9]
+        assert all(request in requests for request in sequence)
+        # 도착 순서: 9 + 8 + 4 = 21, 재배치: 1 + 4 + 4 = 9
+        assert self.crane.fifo_travel_time == approx(21.0)
+        assert self.crane.sequenced_travel_time == approx(9.0)
+        assert self.crane.sequencing_gain == approx(1.0 - 9.0 / 21.0)
+
+    def test_deadline_overrides_nearest(self):
+        """마감을 지킬 수 없게 되면 마감이 있는 요청을 먼저 처리"""
+        self.asrs.set_crane_batching(BatchingPolicy(max_batch_size=5, deadline_priority=1, max_delay=10.5))
+        for y in (1, 2, 3, 4):
+            self.crane.submit_put(self.asrs.create_item(str(y), "item"), Position(0, y, 0))
+        urgent = self.crane.submit_put(self.asrs.create_item("urgent", "item", priority=5), Position(0, 9, 0))
+
+        assert self.crane.queue_depth == 0
+        assert urgent.deadline == approx(10.5)
+        assert urgent.start_time == approx(0.0)
+        assert self.crane.deadline_misses == 0
+
+    def test_same_position_keeps_arrival_order(self):
+        """같은 위치의 입고 후 출고는 순서가 유지됨"""
+        put = self.crane.submit_put(self.asrs.create_item("a", "item"), Position(0, 5, 0))
+        get = self.crane.submit_get(Position(0, 5, 0))
+        self.crane.submit_put(self.asrs.create_item("b", "item"), Position(0, 2, 0))
+
+        self.crane.flush()
+
+        assert put.result is True
+        assert get.result.id == "a"
@@ -0,0 +1,104 @@
+import pytest
+from pytest import approx
+from src.asrs.asrs import ASRS
+from src.asrs.crane_fleet import CraneFleet, CranePartition
+from src.asrs.item import Item
+from src.asrs.position import Position
+from src.asrs.travel_time_model import TravelTimeModel
+
+
+class TestCraneFleetPartitioning:
+    def test_one_crane_per_aisle(self):
+        asrs = ASRS(max_x=4, max_y=6, max_z=2, crane_count=4)
+        fleet = asrs.crane_fleet
+
+        assert len(fleet.cranes) == 4
+        for x in range(4):
+            assert fleet.crane_for(Position(x, 5, 1)).crane_id == x
+
+    def test_two_cranes_per_long_aisle(self):
+        asrs = ASRS(max_x=2, max_y=10, max_z=2, crane_count=4, cranes_per_aisle=2)
+        fleet = asrs.crane_fleet
+
+        assert fleet.crane_for(Position(0, 0, 0)).crane_id == 0
+        assert fleet.crane_for(Position(0, 9, 0)).crane_id == 1
+        assert fleet.crane_for(Position(1, 4, 1)).crane_id == 2
+        assert fleet.crane_for(Position(1, 5, 1)).crane_id == 3
+        assert fleet.cranes[3].current_position == Position(1, 5, 0)
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            ASRS(max_x=2, max_y=2, max_z=2, crane_count=3, cranes_per_aisle=2)
+        with pytest.raises(ValueError):
+            ASRS(max_x=2, max_y=2, max_z=2, crane_count=3)
+
+    def test_custom_partitions_must_cover_rack(self):
+        asrs = ASRS(max_x=2, max_y=2, max_z=2)
+        with pytest.raises(ValueError, match="cover the whole rack"):
+            CraneFleet(asrs, [CranePartition((0, 1), (0, 2), (0, 2))])
+
+        fleet = CraneFleet(asrs, [CranePartition((0, 2), (0, 2), (0, 1)), CranePartition((0, 2), (0, 2), (1, 2))])
+        assert fleet.crane_for(Position(1, 1, 1)).crane_id == 1
+
+    def test_cranes_start_at_io_point(self):
+        """크레인은 I/O 지점에서, I/O 지점이 구역 밖이면 구역에서 가장 가까운 셀에서 시작"""
+        model = TravelTimeModel(5, 5, 5, io_point=Position(4, 4, 0))
+        single = ASRS(max_x=5, max_y=5, max_z=5, travel_model=model)
+        assert single.stacker_crane.current_position == Position(4, 4, 0)
+
+        fleet = ASRS(max_x=5, max_y=5, max_z=5, travel_model=model, crane_count=2).crane_fleet
+        assert [crane.home_position for crane in fleet.cranes] == [Position(2, 4, 0), Position(4, 4, 0)]
+
+
+class TestCraneFleetSimulation:
+    def test_cranes_work_concurrently(self):
+        asrs = ASRS(max_x=2, max_y=2, max_z=2, inbound_time=2.0, crane_count=2)
+
+        asrs.stacker_crane_put(Item("ITEM001", "Item"), Position(0, 0, 0))
+        asrs.stacker_crane_put(Item("ITEM002", "Item"), Position(1, 0, 0))
+        asrs.stacker_crane_put(Item("ITEM003", "Item"), Position(1, 1, 0))
+
+        # 두 크레인이 동시에 시작하므로 전체 작업은 4초에 끝남
+        assert asrs.crane_fleet.makespan == approx(4.0)
+        starts = [record.start_time for record in asrs.operation_log]
+        assert starts == [0.0, 0.0, 2.0]
+
+    def test_statistics(self):
+        asrs = ASRS(max_x=2, max_y=2, max_z=2, inbound_time=2.0, crane_count=2)
+        for i in range(3):
+            asrs.stacker_crane_put(Item(f"ITEM{i}", "Item"), Position(1, 0, 0))
+
+        first, second = asrs.get_crane_statistics()
+        assert first.operation_count == 0
+        assert first.utilization == 0.0
+        assert second.operation_count == 3
+        assert second.busy_time == approx(6.0)
+        assert second.utilization == approx(1.0)
+        # 모든 요청이 0초에 도착: 대기 시간 0, 2, 4초 / 대기열 길이 0, 1, 2
+        assert second.mean_wait_time == approx(2.0)
+        assert second.mean_queue_length == approx(1.0)
+        assert second.max_queue_length == 2
+
+        assert asrs.get_crane_statistics(horizon=12.0)[1].utilization == approx(0.5)
+
+    def test_requests_arriving_later_do_not_wait(self):
+        asrs = ASRS(max_x=1, max_y=1, max_z=1, inbound_time=2.0)
+        asrs.stacker_crane_put(Item("ITEM001", "Item"), Position(0, 0, 0))
+        asrs.clock.advance_to(10.0)
+        asrs.stacker_crane_put(Item("ITEM002", "Item"), Position(0, 0, 0))
+
+        stats = asrs.get_crane_statistics()[0]
+        assert asrs.operation_log[-1].start_time == 10.0
+        assert stats.mean_wait_time == 0.0
+        assert stats.max_queue_length == 0
+        assert stats.utilization == approx(4.0 / 12.0)
+
+    def test_batch_routed_to_owning_cranes(self):
+        asrs = ASRS(max_x=2, max_y=1, max_z=1, crane_count=2)
+        results = asrs.stacker_crane_put_items(
+            [(Item("ITEM001", "Item"), Position(1, 0, 0)), (Item("ITEM002", "Item"), Position(0, 0, 0))])
+
+        assert results == [True, True]
+        assert [crane.operation_count for crane in asrs.crane_fleet.cranes] == [1, 1]
+        items = asrs.stacker_crane_get_items([Position(0, 0, 0), Position(1, 0, 0)])
+        assert [item.id for item in items] == ["ITEM002", "ITEM001"]
@@ -0,0 +1,125 @@
+from pytest import approx
+from src.asrs.asrs import ASRS
+from src.asrs.crane_request import DualCommandReport
+from src.asrs.operation_record import OperationType
+from src.asrs.position import Position
+from src.asrs.travel_time_model import TravelTimeModel
+
+
+class TestDualCommandCycles:
+    def setup_method(self):
+        """각 테스트 전에 실행되는 설정"""
+        self.asrs = ASRS(max_x=1, max_y=10, max_z=3, inbound_time=0.0, outbound_time=0.0)
+        self.crane = self.asrs.stacker_crane
+
+    def test_pairs_put_with_nearest_get(self):
+        """입고 위치에서 가장 가까운 출고 요청과 짝지어짐"""
+        for y in (2, 8):
+            self.asrs.put_item(self.asrs.create_item(f"item-{y}", f"item-{y}"), Position(0, y, 0))
+        put = self.crane.submit_put(self.asrs.create_item("new", "new"), Position(0, 7, 1))
+        far_get = self.crane.submit_get(Position(0, 2, 0))
+        near_get = self.crane.submit_get(Position(0, 8, 0))
+
+        cycles = self.crane.pair_dual_commands(self.crane.request_queue)
+
+        assert cycles == [(put, near_get), (None, far_get)]
+
+    def test_run_executes_requests_and_reports(self):
+        """대기열을 처리하고 결과와 사이클 통계를 반환"""
+        model = TravelTimeModel(1, 10, 3)
+        asrs = ASRS(max_x=1, max_y=10, max_z=3, inbound_time=0.0, outbound_time=0.0, travel_model=model)
+        crane = asrs.stacker_crane
+        asrs.put_item(asrs.create_item("old", "old"), Position(0, 6, 0))
+        put = crane.submit_put(asrs.create_item("new", "new"), Position(0, 5, 0))
+        get = crane.submit_get(Position(0, 6, 0))
+
+        report = crane.run_dual_command_cycles()
+
+        assert isinstance(report, DualCommandReport)
+        assert put.completed and put.result is True
+        assert get.completed and get.result.name == "old"
+        assert crane.request_queue == []
+        assert report.dual_command_cycles == 1
+        assert report.single_command_cycles == 0
+        home, five, six = crane.home_position, Position(0, 5, 0), Position(0, 6, 0)
+        dual = model.travel_time(home, five) + model.travel_time(five, six) + model.travel_time(six, home)
+        single = 2 * model.travel_time(home, five) + 2 * model.travel_time(home, six)
+        assert report.elapsed_time == approx(dual)
+        assert report.single_command_elapsed_time == approx(single)
+        assert report.cycles_per_hour == approx(3600.0 / dual)
+        assert report.operations_per_hour > report.single_command_cycles_per_hour
+        assert report.time_saving_ratio == approx((single - dual) / single)
+
+    def test_without_travel_model_reports_handling_time_only(self):
+        """이동 시간 모델이 없으면 사이클 시간에 이동 시간을 넣지 않음"""
+        asrs = ASRS(max_x=1, max_y=10, max_z=3, inbound_time=2.0, outbound_time=3.0)
+        asrs.put_item(asrs.create_item("old", "old"), Position(0, 9, 0))
+        asrs.stacker_crane.submit_put(asrs.create_item("new", "new"), Position(0, 5, 0))
+        asrs.stacker_crane.submit_get(Position(0, 9, 0))
+
+        report = asrs.stacker_crane.run_dual_command_cycles()
+
+        assert report.elapsed_time == approx(5.0)
+        assert report.single_command_elapsed_time == approx(5.0)
+
+    def test_keeps_arrival_order_at_same_position(self):
+        """같은 위치의 요청은 도착 순서대로 처리됨"""
+        self.asrs.put_item(self.asrs.create_item("old", "old"), Position(0, 3, 0))
+        early_get = self.crane.submit_get(Position(0, 3, 0))
+        far_put = self.crane.submit_put(self.asrs.create_item("far", "far"), Position(0, 9, 0))
+        put = self.crane.submit_put(self.asrs.create_item("new", "new"), Position(0, 3, 0))
+        late_get = self.crane.submit_get(Position(0, 3, 0))
+
+        cycles = self.crane.pair_dual_commands(self.crane.request_queue)
+
+        # 먼저 도착한 출고는 나중 입고와 짝지을 수 없고, 입고 사이에 끼어들 수도 없음
+        assert cycles == [(None, early_get), (far_put, None), (put, late_get)]
+        self.crane.run_dual_command_cycles()
+        assert early_get.result.name == "old"
+        assert late_get.result.name == "new"
+
+    def test_unpaired_requests_run_as_single_commands(self):
+        """짝이 없는 요청은 단일 명령 사이클"""
+        requests = [self.crane.submit_put(self.asrs.create_item(f"item-{y}", f"item-{y}"), Position(0, y, 0))
+                    for y in (1, 2)]
+
+        report = self.crane.run_dual_command_cycles()
+
+        assert report.dual_command_cycles == 0
+        assert report.single_command_cycles == 2
+        assert report.elapsed_time == approx(report.single_command_elapsed_time)
+        assert all(request.operation == OperationType.PUT and request.result for request in requests)
+
+    def test_cycle_advances_crane_timeline(self):
+        """이동 시간 모델이 있으면 사이클이 크레인 시계를 진행시킴"""
+        model = TravelTimeModel(1, 10, 3)
+        asrs = ASRS(max_x=1, max_y=10, max_z=3, inbound_time=1.0, outbound_time=1.0, travel_model=model)
+        crane = asrs.stacker_crane
+        asrs.put_item(asrs.create_item("old", "old"), Position(0, 9, 2))
+        crane.submit_put(asrs.create_item("new", "new"), Position(0, 4, 1))
+        crane.submit_get(Position(0, 9, 2))
+        start = asrs.clock.now
+
+        report = crane.run_dual_command_cycles()
+
+        assert crane.timeline.now - start == approx(report.elapsed_time)
+        assert crane.operation_count == 2
+
+    def test_elapsed_time_is_measured(self):
+        """처리 시간은 크레인의 실제 출발 위치와 실패한 요청을 반영한 측정값"""
+        model = TravelTimeModel(1, 10, 3)
+        asrs = ASRS(max_x=1, max_y=10, max_z=3, inbound_time=1.0, outbound_time=1.0, travel_model=model)
+        crane = asrs.stacker_crane
+        crane.move_to(Position(0, 9, 2))
+        crane.submit_put(asrs.create_item("new", "new"), Position(0, 4, 1))
+        empty_get = crane.submit_get(Position(0, 8, 0))
+        start = crane.timeline.now
+
+        report = crane.run_dual_command_cycles()
+
+        home, four, eight = crane.home_position, Position(0, 4, 1), Position(0, 8, 0)
+        expected = (model.travel_time(Position(0, 9, 2), four) + 1.0 + model.travel_time(four, eight) +
+                    model.travel_time(eight, home))
+        assert empty_get.completed and empty_get.result is None
+        assert report.elapsed_time == approx(expected)
+        assert report.elapsed_time == approx(crane.timeline.now - start)
@@ -0,0 +1,84 @@
+import numpy as np
+from src.asrs.asrs import ASRS
+from src.asrs.free_slot_index import FreeSlotIndex
+from src.asrs.position import Position
+from src.asrs.travel_time_model import TravelTimeModel
+
+
+class TestFreeSlotIndex:
+    def setup_method(self):
+        """각 테스트 전에 실행되는 설정"""
+        self.asrs = ASRS(max_x=2, max_y=4, max_z=2, inbound_time=0.0, outbound_time=0.0, max_items_per_cell=1)
+
+    def test_nearest_follows_cost_order(self):
+        """가득 찬 셀을 건너뛰고 다음으로 가까운 셀 반환"""
+        assert self.asrs.free_slots.nearest() == Position(0, 0, 0)
+
+        self.asrs.put_item(self.asrs.create_item("a", "a"), Position(0, 0, 0))
+        nearest = self.asrs.free_slots.nearest()
+
+        assert self.asrs.free_slots.costs[nearest.x, nearest.y, nearest.z] == 1.0
+
+    def test_freed_slot_is_reused(self):
+        """출고로 빈자리가 생긴 셀이 다시 후보가 됨"""
+        for index in range(16):
+            assert self.asrs.put_item_auto(self.asrs.create_item(str(index), "item")) is not None
+        assert self.asrs.free_slots.nearest() is None
+
+        self.asrs.get_item(Position(1, 3, 1))
+        assert self.asrs.free_slots.nearest() == Position(1, 3, 1)
+
+    def test_zones_split_by_rank(self):
+        """구역은 이동 비용 순위 구간"""
+        index = self.asrs.free_slots
+        index.set_zones((0.25, 0.75))
+
+        assert index.zone_count == 2
+        assert index.zone_of(Position(0, 0, 0)) == 0
+        assert index.zone_of(Position(1, 3, 1)) == 1
+        assert index.nearest((1,)) not in (None, Position(0, 0, 0))
+
+    def test_costs_from_travel_model(self):
+        """이동 시간 모델이 있으면 I/O 지점 기준 이동 시간 순서"""
+        model = TravelTimeModel(2, 4, 2, io_point=Position(1, 3, 1))
+        asrs = ASRS(max_x=2, max_y=4, max_z=2, travel_model=model)
+
+        assert asrs.free_slots.nearest() == Position(1, 3, 1)
+        np.testing.assert_array_equal(asrs.free_slots.costs, model.io_table)
+
+    def test_chebyshev_costs(self):
+        costs = FreeSlotIndex.chebyshev_costs(3, 2, 2)
+        assert costs.shape == (3, 2, 2)
+        assert costs[2, 1, 0] == 2.0
+
+    def test_index_built_on_first_lookup(self):
+        """정렬 색인은 처음 조회할 때 만들어짐"""
+        asrs = ASRS(max_x=2, max_y=4, max_z=2)
+        assert not asrs.free_slots.built
+
+        asrs.put_item_auto(asrs.create_item("a", "a"))
+        assert asrs.free_slots.built
+        assert isinstance(asrs.free_slots.order, np.ndarray)
+
+    def test_matches_full_scan_under_random_churn(self):
+        """무작위 입출고 후에도 가장 가까운 가용 셀이 전체 스캔 결과와 같음"""
+        asrs = ASRS(max_x=4, max_y=5, max_z=3, inbound_time=0.0, outbound_time=0.0, max_items_per_cell=2)
+        index = asrs.free_slots
+        index.set_zones((0.3, 0.7))
+        index.nearest()
+        rng = np.random.default_rng(0)
+        for step in range(400):
+            if rng.random() < 0.6:
+                asrs.put_item_auto(asrs.create_item(str(step), "item"))
+            else:
+                occupied = np.argwhere(asrs.occupancy.counts > 0)
+                if len(occupied):
+                    x, y, z = occupied[rng.integers(len(occupied))].tolist()
+                    asrs.get_item(Position(x, y, z))
+            for zone in range(index.zone_count):
+                ranks = np.arange(index.zone_bounds[zone], index.zone_bounds[zone + 1])
+                free = ranks[asrs.occupancy.counts.reshape(-1)[index.order[ranks]] < 2]
+                expected = None
+                if free.size:
+                    expected = Position(*(int(v) for v in np.unravel_index(index.order[free[0]], index.shape)))
+                assert index.nearest((zone,)) == expected
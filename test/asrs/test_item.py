@@ -31,3 +31,18 @@ class TestItem:
         assert item.created_at == original_created_at
         assert item.name == "Changed Name"
         assert item.priority == 10
+
+    def test_item_has_no_instance_dict(self):
+        item = Item("ITEM005", "Slotted Item")
+        assert not hasattr(item, "__dict__")
+        with pytest.raises(AttributeError):
+            item.unknown_attribute = 1
+
+    def test_item_created_time_from_simulation_clock(self):
+        item = Item("ITEM006", "Simulated Item", created_time=120.5)
+        assert item.created_time == 120.5
+
+    def test_item_ids_are_interned(self):
+        item1 = Item("".join(["SKU", "-001"]), "Item")
+        item2 = Item("".join(["SKU", "-001"]), "Item")
+        assert item1.id is item2.id
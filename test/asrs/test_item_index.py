@@ -0,0 +1,63 @@
+import pytest
+from src.asrs.asrs import ASRS
+from src.asrs.cell import Cell
+from src.asrs.item import Item
+from src.asrs.item_index import ItemIndex
+from src.asrs.output_policy import OutputPolicy
+from src.asrs.position import Position
+
+
+class TestItemIndex:
+    def setup_method(self):
+        self.index = ItemIndex()
+        self.position = Position(0, 1, 2)
+        self.cell = Cell(self.position, [self.index])
+        self.item1 = Item("ITEM001", "First Item", priority=1)
+        self.item2 = Item("ITEM002", "Second Item", priority=2)
+
+    def test_add_updates_index(self):
+        self.cell.add_item(self.item1)
+
+        assert "ITEM001" in self.index
+        assert self.index.positions("ITEM001") == [self.position]
+
+    def test_all_remove_paths_update_index(self):
+        for remove in (self.cell.remove_item_fifo, self.cell.remove_item_lifo, self.cell.remove_item_priority):
+            self.cell.add_item(self.item1)
+            remove()
+            assert self.index.positions("ITEM001") == []
+            assert "ITEM001" not in self.index
+
+    def test_duplicate_ids_in_same_cell(self):
+        self.cell.add_item(self.item1)
+        self.cell.add_item(Item("ITEM001", "Same Id"))
+        assert self.index.count_at("ITEM001", self.position) == 2
+
+        self.cell.remove_item_fifo()
+        # 같은 ID가 남아있으므로 위치는 유지
+        assert self.index.positions("ITEM001") == [self.position]
+
+        self.cell.remove_item_fifo()
+        assert self.index.positions("ITEM001") == []
+
+    def test_unknown_id(self):
+        assert self.index.positions("UNKNOWN") == []
+        assert self.index.count_at("UNKNOWN", self.position) == 0
+
+
+class TestASRSFindItemPositions:
+    def test_index_follows_put_and_get(self):
+        asrs = ASRS(max_x=3, max_y=3, max_z=3)
+        asrs.set_output_policy(OutputPolicy.PRIORITY)
+        pos1 = Position(0, 0, 0)
+        pos2 = Position(2, 2, 2)
+        asrs.put_item(Item("ITEM001", "First Item", priority=1), pos1)
+        asrs.put_item(Item("ITEM002", "Second Item", priority=5), pos1)
+        asrs.put_item(Item("ITEM001", "First Item", priority=1), pos2)
+
+        assert sorted(asrs.find_item_positions("ITEM001"), key=repr) == [pos1, pos2]
+
+        assert asrs.get_item(pos1).id == "ITEM002"
+        assert asrs.find_item_positions("ITEM002") == []
+        assert asrs.get_item(pos2).id == "ITEM001"
+        assert asrs.find_item_positions("ITEM001") == [pos1]
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from src.asrs.asrs import ASRS
+from src.asrs.item import Item
+from src.asrs.position import Position
+
+
+class TestOccupancyIndex:
+    def setup_method(self):
+        self.asrs = ASRS(max_x=3, max_y=2, max_z=2, max_items_per_cell=2)
+
+    def _fill(self, position: Position):
+        for i in range(self.asrs.max_items_per_cell):
+            self.asrs.put_item(Item(f"ITEM{i}", "Item"), position)
+
+    def test_counts_follow_put_and_get(self):
+        position = Position(1, 1, 0)
+        self.asrs.put_item(Item("ITEM001", "First Item"), position)
+        assert self.asrs.occupancy.count_at(position) == 1
+
+        self.asrs.get_item(position)
+        assert self.asrs.occupancy.count_at(position) == 0
+
+    def test_empty_and_available_cells(self):
+        self._fill(Position(0, 0, 0))
+        self.asrs.put_item(Item("ITEM001", "First Item"), Position(2, 1, 1))
+
+        empty_cells = self.asrs.get_empty_cells()
+        assert len(empty_cells) == 10
+        assert Position(0, 0, 0) not in empty_cells
+        assert Position(2, 1, 1) not in empty_cells
+
+        available_cells = self.asrs.get_available_cells()
+        assert len(available_cells) == 11
+        assert available_cells[0] == Position(0, 0, 1)
+        assert Position(2, 1, 1) in available_cells
+
+    def test_first_free_cells(self):
+        self._fill(Position(0, 0, 0))
+        assert self.asrs.get_first_free_cells(2) == [Position(0, 0, 1), Position(0, 1, 0)]
+        assert len(self.asrs.get_first_free_cells(100)) == 11
+
+    def test_free_cells_in_layer(self):
+        self._fill(Position(1, 0, 1))
+        free_cells = self.asrs.get_free_cells_in_layer(1)
+
+        assert len(free_cells) == 5
+        assert all(position.z == 1 for position in free_cells)
+        assert Position(1, 0, 1) not in free_cells
+        assert self.asrs.get_free_cells_in_layer(5) == []
+
+    def test_free_count_per_aisle(self):
+        self._fill(Position(2, 0, 0))
+        self._fill(Position(2, 1, 1))
+
+        np.testing.assert_array_equal(self.asrs.get_free_count_per_aisle(), [4, 4, 2])
@@ -0,0 +1,180 @@
+import pytest
+from src.asrs.asrs import ASRS
+from src.asrs.config.storage_cost_policy import StorageCostPolicy
+from src.asrs.item import Item
+from src.asrs.operation_journal import OperationJournal
+from src.asrs.operation_record import OperationType
+from src.asrs.output_policy import OutputPolicy
+from src.asrs.position import Position
+from src.entity.Entity import Entity
+
+
+class TestOperationJournal:
+    def setup_method(self):
+        """각 테스트 전에 실행되는 설정"""
+        self.positions = [Position(0, 0, 0), Position(1, 1, 1), Position(0, 1, 0)]
+
+    def _run_scenario(self, path, **journal_options) -> ASRS:
+        journal = OperationJournal(path, **journal_options)
+        asrs = ASRS(max_x=2, max_y=2, max_z=2, journal=journal)
+        for index in range(6):
+            asrs.put_item(asrs.create_item(f"item-{index}", f"name-{index}", priority=index), self.positions[index % 3])
+        asrs.get_item(Position(0, 0, 0))
+        asrs.put_items([(asrs.create_item("batch", "batch"), Position(1, 1, 1))])
+        asrs.get_items([Position(1, 1, 1), Position(0, 1, 0)])
+        journal.close()
+        return asrs
+
+    def test_records_every_operation(self, tmp_path):
+        path = str(tmp_path / "ops.journal")
+        asrs = self._run_scenario(path)
+
+        entries = list(OperationJournal.read(path))
+
+        assert [entry.to_record() for entry in entries] == asrs.operation_log
+        assert entries[0].name == "name-0"
+        assert entries[5].priority == 5
+
+    def test_group_commit(self, tmp_path):
+        """group_size건마다 한 번에 파일에 씀"""
+        path = str(tmp_path / "ops.journal")
+        journal = OperationJournal(path, group_size=4, fsync_interval=None)
+        asrs = ASRS(max_x=1, max_y=1, max_z=1, journal=journal)
+        for index in range(10):
+            asrs.put_item(asrs.create_item(str(index), "item"), Position(0, 0, 0))
+
+        assert journal.flush_count == 2
+        assert len(list(OperationJournal.read(path))) == 8
+        journal.close()
+        assert len(list(OperationJournal.read(path))) == 10
+        assert journal.fsync_count == 0
+
+    def test_fsync_interval_zero_syncs_every_flush(self, tmp_path):
+        journal = OperationJournal(str(tmp_path / "ops.journal"), group_size=2, fsync_interval=0)
+        asrs = ASRS(max_x=1, max_y=1, max_z=1, journal=journal)
+        for index in range(4):
+            asrs.put_item(asrs.create_item(str(index), "item"), Position(0, 0, 0))
+
+        assert journal.fsync_count == 2
+        journal.close()
+
+    def test_replay_rebuilds_state(self, tmp_path):
+        """재적용하면 같은 재고와 시계, 운영 기록이 만들어짐"""
+        path = str(tmp_path / "ops.journal")
+        original = self._run_scenario(path)
+        restored = ASRS(max_x=2, max_y=2, max_z=2)
+
+        applied = OperationJournal.replay(path, restored)
+
+        assert applied == len(original.operation_log)
+        assert restored.clock.now == original.clock.now
+        assert restored.operation_log == original.operation_log
+        for position in self.positions:
+            assert [item.id for item in restored.get_items_at_position(position)] == \
+                [item.id for item in original.get_items_at_position(position)]
+
+    def test_replay_until_timestamp(self, tmp_path):
+        path = str(tmp_path / "ops.journal")
+        self._run_scenario(path)
+        restored = ASRS(max_x=2, max_y=2, max_z=2)
+
+        applied = OperationJournal.replay(path, restored, until=6.0)
+
+        assert applied == 6
+        assert restored.get_total_item_count() == 6
+        assert restored.clock.now == 6.0
+        assert all(record.operation == OperationType.PUT for record in restored.operation_log)
+
+    def test_replay_follows_output_policy(self, tmp_path):
+        """출고는 같은 출고 정책으로 재적용"""
+        path = str(tmp_path / "ops.journal")
+        journal = OperationJournal(path)
+        asrs = ASRS(max_x=1, max_y=1, max_z=1, journal=journal)
+        asrs.set_output_policy(OutputPolicy.LIFO)
+        for index in range(3):
+            asrs.put_item(asrs.create_item(str(index), "item"), Position(0, 0, 0))
+        asrs.get_item(Position(0, 0, 0))
+        journal.close()
+
+        restored = ASRS(max_x=1, max_y=1, max_z=1)
+        restored.set_output_policy(OutputPolicy.LIFO)
+        OperationJournal.replay(path, restored)
+
+        assert [item.id for item in restored.get_items_at_position(Position(0, 0, 0))] == ["0", "1"]
+
+    def test_replay_removes_journaled_item_under_other_policy(self, tmp_path):
+        """출고 정책이 달라도 저널에 기록된 아이템을 꺼냄"""
+        path = str(tmp_path / "ops.journal")
+        journal = OperationJournal(path)
+        asrs = ASRS(max_x=1, max_y=1, max_z=1, journal=journal)
+        asrs.put_item(asrs.create_item("X", "item", priority=9), Position(0, 0, 0))
+        asrs.put_item(asrs.create_item("Y", "item", priority=1), Position(0, 0, 0))
+        asrs.get_item(Position(0, 0, 0))  # FIFO: X 출고
+        asrs.put_item(asrs.create_item("X", "again", priority=9), Position(0, 0, 0))
+        journal.close()
+
+        restored = ASRS(max_x=1, max_y=1, max_z=1)
+        restored.set_output_policy(OutputPolicy.PRIORITY)
+        OperationJournal.replay(path, restored)
+
+        assert sorted(item.id for item in restored.get_items_at_position(Position(0, 0, 0))) == ["X", "Y"]
+        assert {item.name for item in restored.get_items_at_position(Position(0, 0, 0))} == {"item", "again"}
+
+    def test_read_until_filters_out_of_order_records(self, tmp_path):
+        """크레인이 여럿이면 종료 시각이 기록 순서와 달라도 until 이전 작업을 모두 읽음"""
+        path = str(tmp_path / "ops.journal")
+        with OperationJournal(path) as journal:
+            journal.record(OperationType.PUT, Item("A", "far"), Position(0, 0, 0), 0.0, 8.0)
+            journal.record(OperationType.PUT, Item("B", "near"), Position(1, 0, 0), 0.0, 2.0)
+
+        assert [entry.item_id for entry in OperationJournal.read(path, until=5.0)] == ["B"]
+
+        restored = ASRS(max_x=2, max_y=1, max_z=1)
+        assert OperationJournal.replay(path, restored, until=5.0) == 1
+        assert [item.id for item in restored.get_items_at_position(Position(1, 0, 0))] == ["B"]
+
+    def test_replay_restores_entities(self, tmp_path):
+        """입고 아이템의 Entity를 저널에 기록해 재적용 후 부피 기준 보관 비용이 같음"""
+        path = str(tmp_path / "ops.journal")
+        box = Entity("box", 2.0, 3.0, 4.0, 5.0, 1, {"kind": "A"})
+        journal = OperationJournal(path)
+        asrs = ASRS(max_x=2, max_y=1, max_z=1, journal=journal)
+        asrs.set_storage_cost_policy(StorageCostPolicy.VOLUME)
+        for index in range(3):
+            asrs.put_item(Item(str(index), "box", entity=box), Position(index % 2, 0, 0))
+        asrs.put_item(Item("plain", "plain"), Position(0, 0, 0))
+        journal.close()
+
+        restored = ASRS(max_x=2, max_y=1, max_z=1)
+        restored.set_storage_cost_policy(StorageCostPolicy.VOLUME)
+        OperationJournal.replay(path, restored)
+
+        entities = [item.entity for item in restored.get_items_at_position(Position(0, 0, 0))]
+        assert entities[0] == box and entities[-1] is None
+        assert restored.calculate_total_storage_cost(1.0) == pytest.approx(asrs.calculate_total_storage_cost(1.0))
+        assert restored.calculate_total_storage_cost(1.0) == pytest.approx(restored.cost * (3 * 24.0 + 1.0))
+
+    def test_truncated_record_is_ignored(self, tmp_path):
+        path = tmp_path / "ops.journal"
+        self._run_scenario(str(path))
+        data = path.read_bytes()
+        path.write_bytes(data[:-3])
+
+        assert len(list(OperationJournal.read(str(path)))) == 9
+
+    def test_appends_to_existing_journal(self, tmp_path):
+        path = str(tmp_path / "ops.journal")
+        self._run_scenario(path)
+        with OperationJournal(path) as journal:
+            asrs = ASRS(max_x=2, max_y=2, max_z=2, journal=journal)
+            asrs.put_item(asrs.create_item("late", "late"), Position(0, 0, 0))
+
+        assert list(OperationJournal.read(path))[-1].item_id == "late"
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"definitely not a journal")
+        with pytest.raises(ValueError):
+            OperationJournal(str(path))
+        with pytest.raises(ValueError):
+            OperationJournal(str(tmp_path / "new.journal"), group_size=0)
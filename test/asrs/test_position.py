@@ -59,3 +59,24 @@ class TestPosition:
         assert pos.x == 0
         assert pos.y == 0
         assert pos.z == 0
+
+    def test_position_is_interned(self):
+        """같은 좌표는 같은 인스턴스를 공유"""
+        assert Position(4, 5, 6) is Position(4, 5, 6)
+        assert Position(4, 5, 6) is not Position(4, 5, 7)
+
+    def test_position_is_immutable(self):
+        pos = Position(1, 2, 3)
+        with pytest.raises(AttributeError):
+            pos.x = 10
+        with pytest.raises(AttributeError):
+            pos.extra = 1
+        assert not hasattr(pos, "__dict__")
+
+    def test_position_pickle_and_copy_keep_identity(self):
+        import copy
+        import pickle
+
+        pos = Position(7, 8, 9)
+        assert pickle.loads(pickle.dumps(pos)) is pos
+        assert copy.deepcopy(pos) is pos
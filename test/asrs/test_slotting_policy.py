@@ -0,0 +1,82 @@
+from src.asrs.asrs import ASRS
+from src.asrs.position import Position
+from src.asrs.slotting_policy import SlottingPolicy
+
+
+class TestSlottingPolicy:
+    def setup_method(self):
+        """각 테스트 전에 실행되는 설정"""
+        self.asrs = ASRS(max_x=1, max_y=10, max_z=1, inbound_time=0.0, outbound_time=0.0, max_items_per_cell=1)
+
+    def test_closest_open_is_default(self):
+        """기본 정책은 가장 가까운 가용 셀"""
+        positions = [self.asrs.put_item_auto(self.asrs.create_item(str(y), "item")) for y in range(3)]
+
+        assert positions == [Position(0, 0, 0), Position(0, 1, 0), Position(0, 2, 0)]
+        assert self.asrs.find_item_positions("1") == [Position(0, 1, 0)]
+
+    def test_full_rack_returns_none(self):
+        """가용 셀이 없으면 None"""
+        for y in range(10):
+            self.asrs.put_item_auto(self.asrs.create_item(str(y), "item"))
+
+        assert self.asrs.put_item_auto(self.asrs.create_item("extra", "item")) is None
+        assert self.asrs.get_total_item_count() == 10
+
+    def test_random_fills_only_available_cells(self):
+        """무작위 정책은 가용 셀만 고름"""
+        self.asrs.set_slotting_policy(SlottingPolicy.RANDOM)
+        positions = {self.asrs.put_item_auto(self.asrs.create_item(str(y), "item")) for y in range(10)}
+
+        assert len(positions) == 10
+        assert None not in positions
+
+    def test_priority_zoned(self):
+        """우선순위가 높은 아이템은 가까운 구역에 입고"""
+        self.asrs.set_slotting_policy(SlottingPolicy.PRIORITY_ZONED)
+
+        low = self.asrs.put_item_auto(self.asrs.create_item("low", "low", priority=0))
+        high = self.asrs.put_item_auto(self.asrs.create_item("high", "high", priority=5))
+        middle = self.asrs.put_item_auto(self.asrs.create_item("middle", "middle", priority=1))
+
+        assert high.y < middle.y < low.y
+
+    def test_class_based_by_turnover(self):
+        """출고가 잦은 아이템은 A등급 구역에 입고"""
+        self.asrs.set_slotting_policy(SlottingPolicy.CLASS_BASED)
+        strategy = self.asrs.slotting_strategies[SlottingPolicy.CLASS_BASED]
+        strategy.reclassify_every = 1
+        for _ in range(3):
+            position = self.asrs.put_item_auto(self.asrs.create_item("fast", "fast"))
+            self.asrs.get_item(position)
+        for item_id in ("slow-1", "slow-2", "slow-3", "slow-4"):
+            position = self.asrs.put_item_auto(self.asrs.create_item(item_id, "slow"))
+            self.asrs.get_item(position)
+
+        fast = self.asrs.put_item_auto(self.asrs.create_item("fast", "fast"))
+        new = self.asrs.put_item_auto(self.asrs.create_item("new", "new"))
+
+        assert strategy.classify(self.asrs, self.asrs.create_item("fast", "fast")) == 0
+        assert fast.y < 2
+        assert new.y >= 5
+
+    def test_class_overflows_to_other_zones(self):
+        """배정된 구역이 가득 차면 다른 구역 사용"""
+        self.asrs.set_slotting_policy(SlottingPolicy.CLASS_BASED)
+        strategy = self.asrs.slotting_strategies[SlottingPolicy.CLASS_BASED]
+        strategy.assign_class("a", 0)
+
+        positions = [self.asrs.put_item_auto(self.asrs.create_item("a", "a")) for _ in range(4)]
+
+        assert positions[:2] == [Position(0, 0, 0), Position(0, 1, 0)]
+        assert all(position.y >= 2 for position in positions[2:])
+
+    def test_nearly_full_rack(self):
+        """95% 적재 상태에서도 남은 셀을 찾음"""
+        asrs = ASRS(max_x=4, max_y=50, max_z=10, inbound_time=0.0, max_items_per_cell=1)
+        for index in range(1900):
+            asrs.put_item_auto(asrs.create_item(str(index), "item"))
+
+        free = set(asrs.get_available_cells())
+        assert len(free) == 100
+        assert asrs.put_item_auto(asrs.create_item("last", "item")) in free
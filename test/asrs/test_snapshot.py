@@ -0,0 +1,139 @@
+import os
+import pytest
+from pytest import approx
+from src.asrs.asrs import ASRS
+from src.asrs.config.storage_cost_policy import PerZoneStrategy, StorageCostPolicy, TieredOccupancyStrategy
+from src.asrs.output_policy import OutputPolicy
+from src.asrs.position import Position
+from src.asrs.slotting_policy import SlottingPolicy
+from src.asrs.snapshot import read_snapshot, write_snapshot
+from src.asrs.travel_time_model import TravelTimeModel
+
+import numpy as np
+
+
+class TestSnapshotFormat:
+    def test_arrays_round_trip_aligned(self, tmp_path):
+        """배열은 64바이트 정렬로 저장되어 메모리 맵으로 읽힘"""
+        path = str(tmp_path / "data.snap")
+        arrays = {"a": np.arange(5, dtype=np.int64), "b": np.array([1.5, 2.5]), "empty": np.empty(0, np.int32)}
+        write_snapshot(path, {"key": "value"}, arrays)
+
+        header, loaded = read_snapshot(path)
+
+        assert header == {"key": "value"}
+        assert isinstance(loaded["a"].base, np.memmap) or isinstance(loaded["a"], np.memmap)
+        np.testing.assert_array_equal(loaded["a"], arrays["a"])
+        np.testing.assert_array_equal(loaded["b"], arrays["b"])
+        assert loaded["empty"].size == 0
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a snapshot at all")
+        with pytest.raises(ValueError):
+            read_snapshot(str(path))
+
+
+class TestASRSSnapshot:
+    def setup_method(self):
+        """각 테스트 전에 실행되는 설정"""
+        model = TravelTimeModel(3, 4, 2)
+        self.asrs = ASRS(max_x=3, max_y=4, max_z=2, max_items_per_cell=5, travel_model=model, crane_count=3,
+                         slotting_policy=SlottingPolicy.PRIORITY_ZONED)
+        for index in range(4):
+            self.asrs.put_item(self.asrs.create_item(f"item-{index}", "box", priority=index % 2), Position(1, 2, 1))
+        self.asrs.put_item(self.asrs.create_item("item-0", "box"), Position(0, 0, 0))
+        self.asrs.stacker_crane_put(self.asrs.create_item("crane", "pallet"), Position(2, 3, 1))
+        self.asrs.set_output_policy(OutputPolicy.PRIORITY)
+
+    def _round_trip(self, tmp_path, mmap=True) -> ASRS:
+        path = str(tmp_path / "asrs.snap")
+        self.asrs.snapshot(path)
+        return ASRS.restore(path, mmap=mmap)
+
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_restores_inventory(self, tmp_path, mmap):
+        """셀, 아이템, 집계값과 색인이 복원됨"""
+        restored = self._round_trip(tmp_path, mmap)
+
+        assert restored.get_total_item_count() == 6
+        assert restored.get_occupied_cell_count() == 3
+        assert restored.calculate_total_storage_cost(0) == approx(self.asrs.calculate_total_storage_cost(0))
+        assert set(restored.find_item_positions("item-0")) == {Position(1, 2, 1), Position(0, 0, 0)}
+        assert restored.occupancy.count_at(Position(1, 2, 1)) == 4
+        items = restored.get_items_at_position(Position(1, 2, 1))
+        assert [item.id for item in items] == ["item-0", "item-1", "item-2", "item-3"]
+        assert [item.created_time for item in items] == \
+            [item.created_time for item in self.asrs.get_items_at_position(Position(1, 2, 1))]
+
+    def test_restores_policies_clock_and_cranes(self, tmp_path):
+        restored = self._round_trip(tmp_path)
+
+        assert restored.clock.now == self.asrs.clock.now
+        assert restored.output_policy == OutputPolicy.PRIORITY
+        assert restored.slotting_policy == SlottingPolicy.PRIORITY_ZONED
+        assert restored.max_items_per_cell == 5
+        assert restored.travel_model.io_table.tolist() == self.asrs.travel_model.io_table.tolist()
+        assert len(restored.crane_fleet.cranes) == 3
+        for original, crane in zip(self.asrs.crane_fleet.cranes, restored.crane_fleet.cranes):
+            assert crane.current_position == original.current_position
+            assert crane.timeline.now == original.timeline.now
+            assert crane.operation_count == original.operation_count
+
+    def test_restored_asrs_keeps_working(self, tmp_path):
+        """복원 후 입출고와 색인/집계값이 일관됨"""
+        restored = self._round_trip(tmp_path)
+        restored.debug_aggregates = True
+
+        assert restored.get_item(Position(1, 2, 1)).id == "item-1"  # 우선순위 출고
+        assert restored.item_index.count_at("item-1", Position(1, 2, 1)) == 0
+        assert restored.put_item(restored.create_item("new", "box"), Position(1, 2, 1))
+        assert restored.put_item_auto(restored.create_item("auto", "box", priority=3)) is not None
+        assert restored.get_total_item_count() == 7
+        assert len(restored.item_index) == 6  # item-1은 출고됨
+
+    def test_snapshot_of_restored_asrs(self, tmp_path):
+        """복원한 자동창고를 다시 저장해도 같은 재고"""
+        restored = self._round_trip(tmp_path)
+        path = str(tmp_path / "again.snap")
+        restored.snapshot(path)
+        again = ASRS.restore(path)
+
+        assert sorted(item.id for item in again.get_total_items()) == \
+            sorted(item.id for item in self.asrs.get_total_items())
+
+    def test_snapshot_over_restored_file(self, tmp_path):
+        """메모리 맵으로 복원한 파일에 다시 저장해도 색인과 재고가 유지됨"""
+        path = str(tmp_path / "asrs.snap")
+        self.asrs.snapshot(path)
+        restored = ASRS.restore(path, mmap=True)
+        restored.put_item(restored.create_item("new", "box"), Position(0, 0, 0))
+        restored.snapshot(path)
+
+        assert set(restored.find_item_positions("item-0")) == {Position(1, 2, 1), Position(0, 0, 0)}
+        assert restored.find_item_positions("item-3") == [Position(1, 2, 1)]
+        again = ASRS.restore(path)
+        assert set(again.find_item_positions("item-0")) == {Position(1, 2, 1), Position(0, 0, 0)}
+        assert again.get_total_item_count() == 7
+        assert [name for name in os.listdir(tmp_path)] == ["asrs.snap"]
+
+    def test_restores_storage_cost_strategy(self, tmp_path):
+        """교체한 보관유지비용 전략의 설정이 복원되어 누적 비용이 원래와 같게 이어짐"""
+        asrs = ASRS(max_x=2, max_y=2, max_z=2, cost=1.0, cost_time=1.0,
+                    storage_cost_policy=StorageCostPolicy.PER_ZONE)
+        asrs.set_storage_cost_strategy(StorageCostPolicy.PER_ZONE, PerZoneStrategy((1.0, 5.0)))
+        asrs.set_storage_cost_strategy(StorageCostPolicy.TIERED_OCCUPANCY, TieredOccupancyStrategy(((1.0, 3.0),)))
+        asrs.put_item(asrs.create_item("low", "box"), Position(0, 0, 0))
+        asrs.put_item(asrs.create_item("high", "box"), Position(0, 0, 1))
+        path = str(tmp_path / "asrs.snap")
+        asrs.snapshot(path)
+        restored = ASRS.restore(path)
+
+        tiered = restored.storage_cost_strategies[StorageCostPolicy.TIERED_OCCUPANCY]
+        assert tiered.bounds.tolist() == [1.0] and tiered.multipliers.tolist() == [3.0]
+        assert restored.calculate_total_storage_cost(1.0) == approx(asrs.calculate_total_storage_cost(1.0))
+        for warehouse in (asrs, restored):
+            warehouse.clock.advance_to(10.0)
+            warehouse.get_item(Position(0, 0, 1))
+        assert restored.cost_accrual.open_rate == approx(1.0)
+        assert restored.accrued_storage_cost(at=20.0) == approx(asrs.accrued_storage_cost(at=20.0))
@@ -88,3 +88,9 @@ class TestStackerCrane:
         # 호출 횟수 확인
         assert self.mock_asrs.put_item.call_count == 1
         assert self.mock_asrs.get_item.call_count == 1
+
+    def test_move_without_travel_model_is_instant(self):
+        travel_time = self.stacker_crane.move_to(Position(3, 3, 3))
+        assert travel_time == 0.0
+        assert self.stacker_crane.total_travel_time == 0.0
+        self.mock_asrs.work_config.delay_time.assert_not_called()
@@ -0,0 +1,50 @@
+import pytest
+from pytest import approx
+from src.asrs.asrs import ASRS
+from src.asrs.config.storage_cost_policy import StorageCostPolicy
+from src.asrs.item import Item
+from src.asrs.output_policy import OutputPolicy
+from src.asrs.position import Position
+
+
+class TestStorageAggregates:
+    def setup_method(self):
+        self.asrs = ASRS(max_x=3, max_y=3, max_z=3, cost=0.5, debug_aggregates=True)
+        self.pos1 = Position(0, 0, 0)
+        self.pos2 = Position(2, 1, 0)
+
+    def test_counts_follow_put_and_get(self):
+        self.asrs.put_item(Item("ITEM001", "First Item"), self.pos1)
+        self.asrs.put_item(Item("ITEM002", "Second Item"), self.pos1)
+        self.asrs.put_item(Item("ITEM003", "Third Item"), self.pos2)
+
+        assert self.asrs.get_total_item_count() == 3
+        assert self.asrs.get_occupied_cell_count() == 2
+        assert len(self.asrs.get_total_items()) == 3
+
+        self.asrs.get_item(self.pos2)
+        assert self.asrs.get_total_item_count() == 2
+        assert self.asrs.get_occupied_cell_count() == 1
+
+    def test_cost_total_follows_mutations(self):
+        self.asrs.put_item(Item("ITEM001", "First Item"), self.pos1)
+        self.asrs.put_item(Item("ITEM002", "Second Item"), self.pos2)
+        assert self.asrs.calculate_total_storage_cost(0.5) == approx(1.0)
+
+        self.asrs.set_output_policy(OutputPolicy.LIFO)
+        self.asrs.get_item(self.pos1)
+        assert self.asrs.calculate_total_storage_cost(0.5) == approx(0.5)
+        assert self.asrs.aggregates.cost_totals[StorageCostPolicy.PER_TIME_UNIT] == approx(0.5)
+
+    def test_cost_change_recalculates_totals(self):
+        self.asrs.put_item(Item("ITEM001", "First Item"), self.pos1)
+        self.asrs.cost = 2.0
+
+        assert self.asrs.calculate_total_storage_cost(2.0) == approx(2.0)
+
+    def test_debug_flag_detects_drift(self):
+        self.asrs.put_item(Item("ITEM001", "First Item"), self.pos1)
+        self.asrs.aggregates.total_items += 1
+
+        with pytest.raises(RuntimeError, match="Aggregate mismatch"):
+            self.asrs.get_total_item_count()
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from pytest import approx
+from src.asrs.asrs import ASRS
+from src.asrs.item import Item
+from src.asrs.position import Position
+from src.asrs.travel_time_model import AxisKinematics, TravelTimeModel
+
+
+class TestAxisKinematics:
+    def test_trapezoidal_profile(self):
+        axis = AxisKinematics(max_speed=2.0, acceleration=1.0, pitch=1.0)
+        # 가속 거리(4m) 이상: d / v + v / a
+        assert axis.travel_time(10) == approx(10 / 2.0 + 2.0 / 1.0)
+
+    def test_triangular_profile(self):
+        axis = AxisKinematics(max_speed=2.0, acceleration=1.0, pitch=0.5)
+        # 최고 속도에 도달하지 못하는 거리(1m): 2 * sqrt(d / a)
+        assert axis.travel_time(2) == approx(2.0)
+        assert axis.travel_time(0) == 0.0
+
+    def test_vectorized(self):
+        axis = AxisKinematics(max_speed=2.0, acceleration=1.0)
+        np.testing.assert_allclose(axis.travel_time(np.array([0, 1, 10])), [0.0, 2.0, 7.0])
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            AxisKinematics(max_speed=0.0, acceleration=1.0)
+
+
+class TestTravelTimeModel:
+    def setup_method(self):
+        self.model = TravelTimeModel(4, 10, 5)
+
+    def test_chebyshev_travel_time(self):
+        start = Position(0, 0, 0)
+        end = Position(1, 9, 4)
+        expected = max(self.model.axes[0].travel_time(1), self.model.axes[1].travel_time(9),
+                       self.model.axes[2].travel_time(4))
+        assert self.model.travel_time(start, end) == approx(expected)
+        assert self.model.travel_time(end, start) == approx(expected)
+        assert self.model.travel_time(end, end) == 0.0
+
+    def test_io_table_matches_travel_time(self):
+        assert self.model.io_table.shape == (4, 10, 5)
+        for position in (Position(0, 0, 0), Position(3, 2, 1), Position(2, 9, 4)):
+            assert self.model.time_from_io(position) == approx(
+                self.model.travel_time(self.model.io_point, position))
+        assert self.model.cycle_time(Position(2, 9, 4)) == approx(2 * self.model.time_from_io(Position(2, 9, 4)))
+
+    def test_pair_table(self):
+        positions = [Position(0, 0, 0), Position(1, 5, 2), Position(3, 9, 4)]
+        table = self.model.pair_table(positions)
+
+        assert table.shape == (3, 3)
+        for i, start in enumerate(positions):
+            for j, end in enumerate(positions):
+                assert table[i, j] == approx(self.model.travel_time(start, end))
+
+
+class TestCraneTravel:
+    def test_crane_moves_advance_clock(self):
+        model = TravelTimeModel(3, 3, 3)
+        asrs = ASRS(max_x=3, max_y=3, max_z=3, travel_model=model)
+        position = Position(2, 2, 2)
+        travel_time = model.travel_time(Position(0, 0, 0), position)
+
+        asrs.stacker_crane_put(Item("ITEM001", "Item"), position)
+        assert asrs.clock.now == approx(travel_time + asrs.inbound_time)
+        assert asrs.stacker_crane.total_travel_time == approx(travel_time)
+
+        # 같은 위치에서 출고하면 이동 시간 없음
+        asrs.stacker_crane_get(position)
+        assert asrs.clock.now == approx(travel_time + asrs.inbound_time + asrs.outbound_time)
+        assert asrs.stacker_crane.move_count == 2
+        # 크레인이 한 대면 크레인 시계가 자동창고 시계
+        assert asrs.stacker_crane.timeline is asrs.clock
+        assert asrs.operation_log[-1].finish_time == approx(asrs.clock.now)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from src.distributions.buffered import BufferedDistribution
+from src.distributions.constant import Constant
+from src.distributions.exponential import Exponential
+from src.distributions.normal import Normal
+from src.distributions.triangular import Triangular
+from src.distributions.uniform import Uniform
+
+
+class TestBufferedDistribution:
+    """BufferedDistribution 테스트 클래스"""
+
+    @pytest.mark.parametrize("factory", [
+        lambda: Normal(mean=1.0, stddev=2.0, seed=11),
+        lambda: Uniform(min_val=0.0, max_val=3.0, seed=11),
+        lambda: Exponential(mean=2.0, seed=11),
+        lambda: Triangular(min_val=0.0, mode=1.0, max_val=4.0, seed=11),
+    ])
+    def test_matches_unbuffered_sampling(self, factory):
+        """같은 시드에서 버퍼 없이 추출한 결과와 동일"""
+        buffered = BufferedDistribution(factory(), buffer_size=64)
+        plain = factory()
+        assert [buffered.generate() for _ in range(200)] == [plain.generate() for _ in range(200)]
+
+    def test_generate_many_uses_remaining_buffer_first(self):
+        """generate_many는 남은 버퍼부터 사용해 순서를 유지"""
+        buffered = BufferedDistribution(Normal(mean=0.0, stddev=1.0, seed=5), buffer_size=10)
+        plain = Normal(mean=0.0, stddev=1.0, seed=5)
+        first = buffered.generate()
+        assert buffered.buffered == 9
+        rest = buffered.generate_many(25)
+        np.testing.assert_array_equal(np.concatenate(([first], rest)), plain.generate_many(26))
+        assert buffered.buffered == 0
+
+    def test_refills_in_chunks(self):
+        """버퍼가 빌 때만 buffer_size개씩 채움"""
+        buffered = BufferedDistribution(Constant(3.0), buffer_size=4)
+        values = [buffered.generate() for _ in range(5)]
+        assert values == [3.0] * 5
+        assert buffered.buffered == 3
+        assert isinstance(values[0], float)
+
+    def test_reseed_discards_buffer(self):
+        """reseed 후에는 새 시드의 처음부터 추출"""
+        buffered = BufferedDistribution(Uniform(min_val=0.0, max_val=1.0, seed=1), buffer_size=8)
+        buffered.generate()
+        buffered.reseed(2)
+        assert buffered.generate() == Uniform(min_val=0.0, max_val=1.0, seed=2).generate()
+
+    def test_invalid_buffer_size_raises_error(self):
+        """buffer_size가 0이면 ValueError"""
+        with pytest.raises(ValueError, match="buffer_size must be positive"):
+            BufferedDistribution(Constant(1.0), buffer_size=0)
+
+    def test_repr(self):
+        """__repr__ 메서드 테스트"""
+        buffered = BufferedDistribution(Constant(1.5), buffer_size=16)
+        assert repr(buffered) == "BufferedDistribution(Constant(value=1.5), buffer_size=16)"
@@ -1,3 +1,4 @@
+import numpy as np
 from src.distributions.constant import Constant
 import pytest
 from src.distributions.constant import Constant
@@ -31,6 +32,12 @@ class TestConstant:
         result = dist.generate()
         assert isinstance(result, float)
 
+    def test_generate_many_returns_filled_array(self):
+        """generate_many가 상수로 채운 배열을 반환하는지 테스트"""
+        samples = Constant(7).generate_many(5)
+        assert samples.dtype == np.float64
+        assert samples.tolist() == [7.0] * 5
+
     def test_repr(self):
         """__repr__ 메서드 테스트"""
         dist = Constant(7.5)
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from src.distributions.buffered import BufferedDistribution
+from src.distributions.empirical import Empirical
+
+
+class TestEmpirical:
+    """Empirical 분포 테스트 클래스"""
+
+    def test_discrete_matches_observed_frequencies(self):
+        """이산 분포는 관측 빈도에 비례해 관측값만 추출"""
+        observations = np.array([1.0] * 10 + [2.0] * 30 + [5.0] * 60)
+        dist = Empirical(observations, discrete=True, seed=1)
+        samples = dist.generate_many(200000)
+        values, counts = np.unique(samples, return_counts=True)
+        assert values.tolist() == [1.0, 2.0, 5.0]
+        np.testing.assert_allclose(counts / counts.sum(), [0.1, 0.3, 0.6], atol=0.01)
+
+    def test_alias_table_preserves_probabilities(self):
+        """별칭 표로 복원한 확률이 원래 확률과 같음"""
+        probabilities = np.array([0.05, 0.5, 0.15, 0.3])
+        accept, aliases = Empirical.alias_table(probabilities)
+        restored = accept.copy()
+        np.add.at(restored, aliases.astype(np.int64), 1.0 - accept)
+        np.testing.assert_allclose(restored / len(probabilities), probabilities)
+
+    def test_continuous_interpolates_within_range(self):
+        """연속 분포는 관측 범위 안에서 보간한 값을 추출"""
+        observations = np.random.default_rng(0).exponential(2.0, size=50000)
+        dist = Empirical(observations, seed=2)
+        samples = dist.generate_many(100000)
+        assert samples.min() >= observations.min() and samples.max() <= observations.max()
+        assert abs(samples.mean() - observations.mean()) < 0.05
+        assert abs(np.median(samples) - np.median(observations)) < 0.05
+
+    def test_quantiles_compress_table(self):
+        """quantiles를 지정하면 분위수 개수만큼의 표를 사용"""
+        dist = Empirical(np.arange(100000, dtype=float), quantiles=101, seed=3)
+        assert dist.table.shape == (1, 101)
+        assert abs(dist.generate_many(100000).mean() - 49999.5) < 500
+
+    @pytest.mark.parametrize("discrete", [True, False])
+    def test_generate_matches_generate_many(self, discrete):
+        """generate 반복과 generate_many의 결과가 같음 (버퍼 사용 포함)"""
+        observations = np.random.default_rng(4).integers(0, 20, size=1000).astype(float)
+        single = Empirical(observations, discrete=discrete, seed=5)
+        batch = Empirical(observations, discrete=discrete, seed=5)
+        buffered = BufferedDistribution(Empirical(observations, discrete=discrete, seed=5), buffer_size=64)
+        expected = batch.generate_many(300)
+        np.testing.assert_array_equal([single.generate() for _ in range(300)], expected)
+        np.testing.assert_array_equal([buffered.generate() for _ in range(300)], expected)
+
+    def test_single_observation(self):
+        """관측값이 하나면 항상 그 값"""
+        dist = Empirical(np.array([3.5]), seed=6)
+        assert dist.generate() == 3.5
+        assert dist.generate_many(3).tolist() == [3.5] * 3
+
+    @pytest.mark.parametrize("discrete", [True, False])
+    def test_table_round_trip_with_mmap(self, tmp_path, discrete):
+        """저장한 표를 메모리 맵으로 불러와 같은 샘플을 추출"""
+        observations = np.random.default_rng(7).normal(10.0, 2.0, size=5000).round(1)
+        original = Empirical(observations, discrete=discrete, seed=8)
+        path = str(tmp_path / "table.npy")
+        original.save_table(path)
+
+        loaded = Empirical.from_table(path, seed=8)
+        assert isinstance(loaded.table, np.memmap)
+        assert loaded.discrete == discrete
+        np.testing.assert_array_equal(loaded.generate_many(1000), original.generate_many(1000))
+        assert loaded.generate() == original.generate()
+
+    def test_invalid_inputs_raise_error(self, tmp_path):
+        """잘못된 관측값과 표는 ValueError"""
+        with pytest.raises(ValueError, match="at least one observation"):
+            Empirical(np.array([]))
+        with pytest.raises(ValueError, match="must be finite"):
+            Empirical(np.array([1.0, np.nan]))
+        path = str(tmp_path / "bad.npy")
+        np.save(path, np.zeros((2, 4)))
+        with pytest.raises(ValueError, match="Not an empirical distribution table"):
+            Empirical.from_table(path)
+
+    def test_repr(self):
+        """__repr__ 메서드 테스트"""
+        assert repr(Empirical(np.array([1.0, 2.0, 2.0]), discrete=True)) == "Empirical(discrete=True, size=2)"
@@ -56,6 +56,13 @@ class TestExponential:
         sample_variance = np.var(samples, ddof=1)
         assert abs(sample_variance - expected_variance) < 1.0
 
+    def test_generate_many_statistical_properties(self):
+        """generate_many가 n개의 양수 샘플 배열을 반환하는지 테스트"""
+        samples = Exponential(mean=2.0).generate_many(100000)
+        assert samples.shape == (100000,)
+        assert np.all(samples >= 0)
+        assert abs(samples.mean() - 2.0) < 0.05
+
     def test_repr(self):
         """__repr__ 메서드 테스트"""
         dist = Exponential(mean=4.5)
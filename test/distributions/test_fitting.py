@@ -0,0 +1,93 @@
+import os
+
+import numpy as np
+import pytest
+
+from src.distributions.constant import Constant
+from src.distributions.exponential import Exponential
+from src.distributions.fitting import best_fit, fit_distributions
+from src.distributions.normal import Normal
+from src.distributions.triangular import Triangular
+from src.distributions.uniform import Uniform
+
+
+class TestFitting:
+    """분포 적합 모듈 테스트"""
+
+    def setup_method(self):
+        self.rng = np.random.default_rng(2024)
+
+    @pytest.mark.parametrize("criterion", ["aic", "ks"])
+    @pytest.mark.parametrize("sample, expected", [
+        (lambda rng: rng.normal(10.0, 2.0, 20000), Normal),
+        (lambda rng: rng.uniform(1.0, 5.0, 20000), Uniform),
+        (lambda rng: rng.exponential(3.0, 20000), Exponential),
+        (lambda rng: rng.triangular(1.0, 2.0, 6.0, 20000), Triangular),
+    ])
+    def test_selects_generating_family(self, sample, expected, criterion):
+        """생성한 분포 계열이 가장 좋은 적합으로 선택됨"""
+        assert isinstance(best_fit(sample(self.rng), criterion=criterion), expected)
+
+    def test_recovers_parameters(self):
+        """적합한 모수가 생성 모수에 근사"""
+        dist = best_fit(self.rng.normal(10.0, 2.0, 50000))
+        assert dist.mean == pytest.approx(10.0, abs=0.05)
+        assert dist.stddev == pytest.approx(2.0, abs=0.05)
+
+        triangular = best_fit(self.rng.triangular(1.0, 2.0, 6.0, 50000))
+        assert (triangular.min_val, triangular.mode, triangular.max_val) == \
+            pytest.approx((1.0, 2.0, 6.0), abs=0.1)
+
+    def test_results_sorted_by_criterion(self):
+        """결과는 기준이 좋은 순서"""
+        results = fit_distributions(self.rng.exponential(1.0, 5000), criterion="ks")
+        statistics = [result.ks_statistic for result in results]
+        assert statistics == sorted(statistics)
+
+    def test_negative_data_skips_exponential(self):
+        """음수 관측값이 있으면 Exponential은 제외"""
+        results = fit_distributions(self.rng.normal(0.0, 1.0, 1000))
+        assert "exponential" not in [result.family for result in results]
+
+    def test_constant_data_returns_constant(self):
+        """모든 관측값이 같으면 Constant"""
+        dist = best_fit(np.full(100, 4.0))
+        assert isinstance(dist, Constant)
+        assert dist.generate() == 4.0
+
+    def test_seed_passed_to_distribution(self):
+        """seed를 지정하면 재현 가능한 분포"""
+        data = self.rng.uniform(0.0, 1.0, 1000)
+        first = best_fit(data, seed=9).generate_many(5)
+        np.testing.assert_array_equal(best_fit(data, seed=9).generate_many(5), first)
+
+    def test_cache_reused_for_same_data(self, tmp_path, monkeypatch):
+        """같은 관측값은 디스크 캐시에서 읽고 다시 적합하지 않음"""
+        data = self.rng.normal(5.0, 1.0, 2000)
+        cache_dir = str(tmp_path / "fits")
+        first = fit_distributions(data, cache_dir=cache_dir)
+        assert len(os.listdir(cache_dir)) == 1
+
+        import src.distributions.fitting as fitting
+
+        def fail(name, data):
+            raise AssertionError("refit")
+
+        monkeypatch.setattr(fitting, "_fit_family", fail)
+        cached = fit_distributions(data, cache_dir=cache_dir)
+        assert cached == first
+        by_ks = fit_distributions(data, criterion="ks", cache_dir=cache_dir)
+        assert sorted(result.family for result in by_ks) == sorted(result.family for result in first)
+        with pytest.raises(AssertionError, match="refit"):
+            fit_distributions(data + 1.0, cache_dir=cache_dir)
+
+    def test_invalid_inputs_raise_error(self):
+        """잘못된 입력은 ValueError"""
+        with pytest.raises(ValueError, match="criterion must be one of"):
+            fit_distributions(np.ones(3), criterion="bic")
+        with pytest.raises(ValueError, match="Unknown distribution families"):
+            fit_distributions(np.arange(3.0), families=["gamma"])
+        with pytest.raises(ValueError, match="at least one observation"):
+            fit_distributions(np.array([]))
+        with pytest.raises(ValueError, match="must be finite"):
+            fit_distributions(np.array([1.0, np.inf]))
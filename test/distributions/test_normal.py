@@ -47,6 +47,13 @@ class TestNormal:
         sample_stddev = np.std(samples, ddof=1)
         assert abs(sample_stddev - stddev) < 0.1
 
+    def test_generate_many_statistical_properties(self):
+        """generate_many가 n개의 샘플 배열을 반환하는지 테스트"""
+        samples = Normal(mean=10.0, stddev=2.0).generate_many(100000)
+        assert samples.shape == (100000,)
+        assert abs(samples.mean() - 10.0) < 0.05
+        assert abs(samples.std(ddof=1) - 2.0) < 0.05
+
     def test_repr(self):
         """__repr__ 메서드 테스트"""
         dist = Normal(mean=1.5, stddev=0.5)
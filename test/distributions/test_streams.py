@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from src.distributions.exponential import Exponential
+from src.distributions.normal import Normal
+from src.distributions.streams import StreamManager
+from src.distributions.uniform import Uniform
+
+
+class TestSeededDistribution:
+    """분포별 Generator 시드 테스트"""
+
+    def test_same_seed_reproduces_samples(self):
+        """같은 시드의 분포는 같은 샘플을 추출"""
+        first = Normal(mean=0.0, stddev=1.0, seed=42)
+        second = Normal(mean=0.0, stddev=1.0, seed=42)
+        assert first.generate() == second.generate()
+        np.testing.assert_array_equal(first.generate_many(100), second.generate_many(100))
+
+    def test_instances_do_not_share_global_state(self):
+        """전역 np.random 상태와 무관하게 재현됨"""
+        np.random.seed(0)
+        expected = Exponential(mean=2.0, seed=7).generate_many(10)
+        np.random.seed(1)
+        np.random.random(1000)
+        np.testing.assert_array_equal(Exponential(mean=2.0, seed=7).generate_many(10), expected)
+
+    def test_reseed_restarts_stream(self):
+        """reseed 후 처음부터 같은 스트림"""
+        dist = Uniform(min_val=0.0, max_val=1.0, seed=3)
+        expected = dist.generate_many(5)
+        dist.reseed(3)
+        np.testing.assert_array_equal(dist.generate_many(5), expected)
+
+
+class TestStreamManager:
+    """StreamManager 테스트"""
+
+    def setup_method(self):
+        self.streams = StreamManager(seed=12345)
+
+    def test_streams_reproducible_regardless_of_request_order(self):
+        """요청 순서와 관계없이 같은 키에는 같은 스트림"""
+        other = StreamManager(seed=12345)
+        crane = self.streams.generator("crane", 1).random(5)
+        other.generator("source", 0)
+        np.testing.assert_array_equal(other.generator("crane", 1).random(5), crane)
+
+    def test_streams_are_independent(self):
+        """서로 다른 키의 스트림은 다른 난수열"""
+        keys = [("source", 0), ("source", 1), ("crane", 0)]
+        samples = [self.streams.generator(*key).random(1000) for key in keys]
+        for index, first in enumerate(samples):
+            for second in samples[index + 1:]:
+                assert abs(np.corrcoef(first, second)[0, 1]) < 0.1
+                assert not np.array_equal(first, second)
+
+    def test_generator_is_cached_per_key(self):
+        """같은 키는 같은 Generator 객체"""
+        assert self.streams.generator("crane", 0) is self.streams.generator("crane", 0)
+
+    def test_bind_seeds_distribution(self):
+        """bind한 분포는 같은 키의 새 Generator와 같은 샘플"""
+        dist = self.streams.bind(Normal(mean=0.0, stddev=1.0), "source", 2)
+        expected = np.random.default_rng(self.streams.seed_sequence("source", 2)).normal(0.0, 1.0, 10)
+        np.testing.assert_array_equal(dist.generate_many(10), expected)
+
+    def test_replications_are_distinct_and_reproducible(self):
+        """반복 실행별 하위 관리자는 서로 다르고 재현 가능"""
+        first = self.streams.replication(0).generator("crane", 0).random(5)
+        second = self.streams.replication(1).generator("crane", 0).random(5)
+        again = StreamManager(seed=12345).replication(0).generator("crane", 0).random(5)
+        assert not np.array_equal(first, second)
+        np.testing.assert_array_equal(first, again)
+
+    def test_negative_index_raises_error(self):
+        """음수 번호는 ValueError"""
+        with pytest.raises(ValueError, match="Stream index cannot be negative"):
+            self.streams.seed_sequence("crane", -1)
@@ -113,6 +113,13 @@ class TestTriangular:
         # 모든 값이 범위 내에 있는지 확인
         assert all(min_val <= sample <= max_val for sample in samples)
 
+    def test_generate_many_within_bounds(self):
+        """generate_many의 샘플이 범위 안에 있고 평균이 기대값에 근사하는지 테스트"""
+        samples = Triangular(min_val=1.0, mode=2.0, max_val=6.0).generate_many(100000)
+        assert samples.shape == (100000,)
+        assert samples.min() >= 1.0 and samples.max() <= 6.0
+        assert abs(samples.mean() - 3.0) < 0.05
+
     def test_repr(self):
         """__repr__ 메서드 테스트"""
         dist = Triangular(min_val=1.0, mode=2.5, max_val=4.0)